@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Headless TTK Benchmark Runner
+Runs the benchmark tests without dialogs and writes JSON results.
+
+Usage:
+    python -m benchmark_cli                        # all tests, JSON to stdout
+    python -m benchmark_cli -o results.json        # write to a file
+    python -m benchmark_cli --tests treeview,widgets --treeview-items 5000
+    python -m benchmark_cli --tests extended       # the Benchmarks menu suites
+    python -m benchmark_cli --xvfb                 # run on a virtual X display
+    python -m benchmark_cli --store results.db     # also append to the results history
+"""
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import time
+
+# Add the current directory to the path so we can import main
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from results_store import ResultsStore
+from main import ALL_TESTS, BENCHMARK_TESTS, EXTENDED_TESTS, CONFIG_FILE, load_config
+
+# Command-line options -> config.json default_settings keys
+SETTING_OPTIONS = [
+    ('treeview_items', 'Number of treeview items'),
+    ('label_updates', 'Number of label/progress updates'),
+    ('window_count', 'Number of windows to create'),
+    ('widget_count', 'Number of widget sets to create'),
+    ('memory_test_mb', 'Memory test size in MB'),
+    ('virtual_tree_rows', 'Rows for the virtual treeview comparison'),
+    ('scroll_steps', 'Scroll steps timed per scroll benchmark'),
+    ('bulk_insert_rows', 'Rows loaded by the treeview bulk insert benchmark'),
+    ('update_fps', 'Frame rate of the coalesced update benchmark'),
+    ('bandwidth_mb', 'Buffer size in MB for the memory bandwidth benchmark'),
+    ('bandwidth_random_reads', 'Random reads per memory bandwidth run'),
+    ('startup_runs', 'Warm runs of the startup benchmark'),
+    ('startup_cold_runs', 'Cold runs of the startup benchmark'),
+    ('theme_throughput_widgets', 'Widgets created and updated per theme by the theme benchmark'),
+    ('style_widgets', 'Buttons created per step of the style scaling benchmark'),
+    ('canvas_batch_size', 'Items per Tcl call in the batched canvas operations'),
+    ('canvas_frames', 'Animation frames timed per canvas item count'),
+    ('text_document_mb', 'Document size in MB for the Text benchmark'),
+    ('text_line_cap', 'Line cap of the capped Text append'),
+    ('text_tag_ranges', 'Ranges tagged by the Text benchmark'),
+    ('scroll_tree_rows', 'Treeview rows scrolled by the scrolling benchmark'),
+    ('repetitions', 'Timed repetitions per test'),
+    ('warmup_runs', 'Untimed warmup runs per test'),
+]
+
+def start_virtual_display(screen="1280x1024x24"):
+    """Start an Xvfb server and return (process, display name)."""
+    xvfb = shutil.which("Xvfb")
+    if not xvfb:
+        raise RuntimeError("Xvfb not found on PATH")
+
+    # -displayfd makes Xvfb pick a free display number and report it back
+    read_fd, write_fd = os.pipe()
+    proc = subprocess.Popen(
+        [xvfb, "-displayfd", str(write_fd), "-screen", "0", screen, "-nolisten", "tcp"],
+        pass_fds=(write_fd,),
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL
+    )
+    os.close(write_fd)
+    with os.fdopen(read_fd) as f:
+        number = f.readline().strip()
+    if not number:
+        proc.terminate()
+        raise RuntimeError("Xvfb did not report a display number")
+    return proc, f":{number}"
+
+def stop_virtual_display(proc):
+    """Terminate an Xvfb server started by start_virtual_display."""
+    if proc is not None and proc.poll() is None:
+        proc.terminate()
+        try:
+            proc.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+
+def parse_args(argv=None):
+    """Parse command-line arguments."""
+    test_names = [name for name, _ in ALL_TESTS]
+    core_names = [name for name, _ in BENCHMARK_TESTS]
+    extended_names = [name for name, _, _ in EXTENDED_TESTS]
+    parser = argparse.ArgumentParser(
+        prog="benchmark_cli",
+        description="Run the TTK benchmarks headlessly and emit JSON results."
+    )
+    parser.add_argument("--config", default=CONFIG_FILE, help="Path to config.json")
+    parser.add_argument("--tests", default="all",
+                        help=f"Comma-separated tests to run: {', '.join(test_names)}; "
+                             "'all' runs the core tests, 'extended' the Benchmarks menu suites (default: all)")
+    parser.add_argument("-o", "--output", help="Write JSON to this file instead of stdout")
+    parser.add_argument("--store", metavar="DB", help="Also append the results to this results history database")
+    parser.add_argument("--theme", help="TTK theme to use (overrides config)")
+    parser.add_argument("--xvfb", action="store_true",
+                        help="Start a private Xvfb display (automatic when DISPLAY is unset on Linux)")
+    parser.add_argument("--no-probe", action="store_true", help="Do not measure UI lag while tests run")
+    parser.add_argument("-v", "--verbose", action="store_true", help="Print progress to stderr")
+    for key, help_text in SETTING_OPTIONS:
+        parser.add_argument("--" + key.replace("_", "-"), dest=key, type=int, help=help_text)
+
+    args = parser.parse_args(argv)
+    groups = {'all': core_names, 'extended': extended_names}
+    selected = []
+    for name in (t.strip() for t in args.tests.split(",")):
+        for test in groups.get(name, [name] if name else []):
+            if test not in selected:
+                selected.append(test)
+    unknown = [t for t in selected if t not in test_names]
+    if unknown:
+        parser.error(f"unknown test(s): {', '.join(unknown)}")
+    args.tests = selected
+    return args
+
+def run_benchmarks(config, tests, verbose=False):
+    """Create a headless app, run the selected tests and return the results payload."""
+    import tkinter as tk
+    from main import TTKBenchmarkApp
+
+    root = tk.Tk()
+    try:
+        app = TTKBenchmarkApp(root, config=config, headless=True)
+        root.update()
+
+        # The test loops stop early unless a run is marked as active
+        app.is_running_tests = True
+        methods = dict(ALL_TESTS)
+        for name in tests:
+            if verbose:
+                print(f"Running {name}...", file=sys.stderr)
+            start = time.perf_counter()
+            app.run_probed(getattr(app, methods[name]))
+            root.update()
+            if verbose:
+                print(f"  done in {time.perf_counter() - start:.3f}s", file=sys.stderr)
+        app.is_running_tests = False
+
+        payload = app.get_save_data()
+        payload['settings'] = config['default_settings']
+        return payload
+    finally:
+        root.destroy()
+
+def main(argv=None):
+    """Command-line entry point."""
+    args = parse_args(argv)
+    config = load_config(args.config)
+    settings = config['default_settings']
+    for key, _ in SETTING_OPTIONS:
+        if getattr(args, key) is not None:
+            settings[key] = getattr(args, key)
+    if args.theme:
+        settings['theme'] = args.theme
+    settings['auto_save'] = False
+    if args.no_probe:
+        settings['ui_lag_probe'] = False
+
+    xvfb_proc = None
+    needs_display = sys.platform.startswith("linux") and not os.environ.get("DISPLAY")
+    try:
+        if args.xvfb or needs_display:
+            xvfb_proc, display = start_virtual_display()
+            os.environ["DISPLAY"] = display
+            if args.verbose:
+                print(f"Using virtual display {display}", file=sys.stderr)
+
+        payload = run_benchmarks(config, args.tests, verbose=args.verbose)
+    except Exception as e:
+        print(f"Benchmark run failed: {e}", file=sys.stderr)
+        return 1
+    finally:
+        stop_virtual_display(xvfb_proc)
+
+    if args.store:
+        try:
+            with ResultsStore(args.store) as store:
+                store.add_run(payload)
+        except Exception as e:
+            print(f"Could not store results in {args.store}: {e}", file=sys.stderr)
+            return 1
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(payload, f, indent=2)
+        if args.verbose:
+            print(f"Results written to {args.output}", file=sys.stderr)
+    else:
+        json.dump(payload, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
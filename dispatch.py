@@ -0,0 +1,105 @@
+"""
+Thread-safe dispatch of Tk work onto the main thread.
+
+Tk is not thread-safe: widgets, variables and dialogs must only be touched
+from the thread that created the interpreter. Worker threads hand work to a
+UIDispatcher instead, which drains a queue from an after() callback on the
+main thread.
+
+Usage:
+    dispatcher = UIDispatcher(root)      # create on the main thread
+    dispatcher.start()
+    # in a worker thread:
+    dispatcher.post(status_var.set, "Running...")     # fire and forget
+    value = dispatcher.call(entry_var.get)            # wait for the result
+    # back on the main thread when the worker is done:
+    dispatcher.stop()
+"""
+
+import queue
+import threading
+import time
+
+class UIDispatcher:
+    """Runs callables on the Tk main thread on behalf of worker threads."""
+
+    def __init__(self, root, interval_ms=10, budget_ms=50):
+        self.root = root
+        self.interval_ms = interval_ms
+        self.budget = budget_ms / 1000.0
+        self._queue = queue.SimpleQueue()
+        self._users = 0
+        self._after_id = None
+        self._main_thread = threading.current_thread()
+
+    def is_main_thread(self):
+        """Return True if called from the thread that owns the Tk root."""
+        return threading.current_thread() is self._main_thread
+
+    @property
+    def running(self):
+        return self._users > 0
+
+    def start(self):
+        """Start draining the queue. Calls nest; each start() needs a stop()."""
+        self._users += 1
+        if self._after_id is None:
+            self._after_id = self.root.after(self.interval_ms, self._drain)
+
+    def stop(self):
+        """Stop draining once the last user is done and fail any pending calls."""
+        self._users = max(0, self._users - 1)
+        if self._users:
+            return
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+        while True:
+            try:
+                future, _, _, _ = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if future is not None and future.set_running_or_notify_cancel():
+                future.set_exception(RuntimeError("UI dispatcher stopped"))
+
+    def post(self, func, *args, **kwargs):
+        """Queue func(*args, **kwargs) to run on the main thread without waiting."""
+        if self.is_main_thread():
+            return func(*args, **kwargs)
+        self._queue.put((None, func, args, kwargs))
+
+    def call(self, func, *args, **kwargs):
+        """Run func on the main thread and return its result (or raise its exception)."""
+        if self.is_main_thread():
+            return func(*args, **kwargs)
+        if not self.running:
+            raise RuntimeError("UI dispatcher is not running")
+        from concurrent.futures import Future # Kept off the startup import path
+        future = Future()
+        self._queue.put((future, func, args, kwargs))
+        return future.result()
+
+    def _drain(self):
+        """Run queued work for up to one time budget, then yield to the event loop."""
+        self._after_id = None
+        deadline = time.perf_counter() + self.budget
+        while time.perf_counter() < deadline:
+            try:
+                future, func, args, kwargs = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if future is not None and not future.set_running_or_notify_cancel():
+                continue
+            try:
+                result = func(*args, **kwargs)
+            except Exception as e:
+                if future is None:
+                    print(f"UI dispatch error in {getattr(func, '__name__', func)}: {e}")
+                else:
+                    future.set_exception(e)
+                continue
+            if future is not None:
+                future.set_result(result)
+
+        if self._users and self._after_id is None:
+            self._after_id = self.root.after(self.interval_ms, self._drain)
@@ -75,6 +75,18 @@ def test_core_functionality():
             'test_window_creation',
             'test_widget_creation',
             'test_memory_usage',
+            'test_virtual_treeview',
+            'test_treeview_bulk_insert',
+            'test_treeview_clear',
+            'test_coalesced_updates',
+            'test_memory_bandwidth',
+            'test_startup_time',
+            'test_theme_switch',
+            'test_style_scaling',
+            'test_geometry_managers',
+            'test_canvas_items',
+            'test_text_document',
+            'test_scrolling',
             'update_system_info',
             'save_results',
             'load_results'
@@ -0,0 +1,169 @@
+"""
+Low-overhead latency recording for per-operation benchmark timings.
+
+LatencyHistogram buckets values logarithmically in the style of
+HdrHistogram: each power of two is split into 2**(SUB_BUCKET_BITS - 1)
+linear sub-buckets, so every recorded value keeps a bounded relative error
+(about 6% with the default 5 bits) and record() is just integer math
+plus one list increment.
+
+LatencyRecorder pairs a histogram with a binned latency-vs-index curve so
+growth in per-operation cost (e.g. as a Treeview fills up) stays visible.
+"""
+
+import time
+
+SUB_BUCKET_BITS = 5
+SUB_BUCKET_COUNT = 1 << SUB_BUCKET_BITS
+
+def bucket_index(value):
+    """Map a non-negative integer value to its bucket index."""
+    exponent = value.bit_length()
+    if exponent <= SUB_BUCKET_BITS:
+        return value
+    shift = exponent - SUB_BUCKET_BITS
+    return (shift << SUB_BUCKET_BITS) + (value >> shift)
+
+def bucket_bounds(index):
+    """Return the (low, high) integer value range covered by a bucket."""
+    if index < SUB_BUCKET_COUNT:
+        return index, index
+    shift = index >> SUB_BUCKET_BITS
+    low = (index & (SUB_BUCKET_COUNT - 1)) << shift
+    return low, low + (1 << shift) - 1
+
+class LatencyHistogram:
+    """Log-bucketed histogram of integer nanosecond latencies."""
+
+    def __init__(self):
+        self.counts = []
+        self.total = 0
+        self.count = 0
+        self.min = None
+        self.max = 0
+
+    def record(self, value_ns):
+        """Record one latency in nanoseconds."""
+        index = bucket_index(value_ns)
+        counts = self.counts
+        if index >= len(counts):
+            counts.extend([0] * (index + 1 - len(counts)))
+        counts[index] += 1
+        self.count += 1
+        self.total += value_ns
+        if value_ns > self.max:
+            self.max = value_ns
+        if self.min is None or value_ns < self.min:
+            self.min = value_ns
+
+    def value_at_percentile(self, pct):
+        """Return the upper bound of the bucket holding the pct-th percentile."""
+        if not self.count:
+            return 0
+        target = max(1, int(round(self.count * pct / 100.0)))
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= target:
+                return min(bucket_bounds(index)[1], self.max)
+        return self.max
+
+    def summary_ms(self, name):
+        """Return flat {name}_p50_ms / _p99_ms / _max_ms keys for test_results."""
+        return {
+            f'{name}_p50_ms': self.value_at_percentile(50) / 1e6,
+            f'{name}_p99_ms': self.value_at_percentile(99) / 1e6,
+            f'{name}_max_ms': self.max / 1e6
+        }
+
+    def to_dict(self):
+        """Export percentiles and non-empty buckets (values in microseconds)."""
+        us = lambda ns: ns / 1000.0
+        return {
+            'count': self.count,
+            'min_us': us(self.min or 0),
+            'max_us': us(self.max),
+            'mean_us': us(self.total / self.count) if self.count else 0.0,
+            'p50_us': us(self.value_at_percentile(50)),
+            'p90_us': us(self.value_at_percentile(90)),
+            'p99_us': us(self.value_at_percentile(99)),
+            'p999_us': us(self.value_at_percentile(99.9)),
+            'buckets': [[us(bucket_bounds(i)[1]), c] for i, c in enumerate(self.counts) if c]
+        }
+
+class LatencyRecorder:
+    """Histogram plus a latency-vs-index curve for one benchmark loop.
+
+    With budget_ns set, operations slower than the budget (e.g. one frame at
+    60 fps) are counted in over_budget.
+
+    Usage:
+        recorder = LatencyRecorder(num_ops)
+        for i in range(num_ops):
+            t0 = recorder.clock()
+            ... one operation ...
+            recorder.record(recorder.clock() - t0)
+    """
+
+    clock = staticmethod(time.perf_counter_ns)
+
+    def __init__(self, expected_ops, curve_points=200, budget_ns=None):
+        self.histogram = LatencyHistogram()
+        self.budget_ns = budget_ns
+        self.over_budget = 0
+        self.bin_size = max(1, expected_ops // curve_points)
+        self.bin_sums = []
+        self.bin_max = []
+        self._index = 0
+
+    def record(self, value_ns):
+        """Record the latency of the next operation."""
+        self.histogram.record(value_ns)
+        if self.budget_ns is not None and value_ns > self.budget_ns:
+            self.over_budget += 1
+        bin_number = self._index // self.bin_size
+        if bin_number == len(self.bin_sums):
+            self.bin_sums.append(0)
+            self.bin_max.append(0)
+        self.bin_sums[bin_number] += value_ns
+        if value_ns > self.bin_max[bin_number]:
+            self.bin_max[bin_number] = value_ns
+        self._index += 1
+
+    def curve(self):
+        """Return per-bin mean and max latency in microseconds."""
+        means = []
+        for number, total in enumerate(self.bin_sums):
+            ops = min(self.bin_size, self._index - number * self.bin_size)
+            means.append(total / ops / 1000.0)
+        return {
+            'bin_size': self.bin_size,
+            'mean_us': means,
+            'max_us': [m / 1000.0 for m in self.bin_max]
+        }
+
+    def growth_onset(self, factor=2.0):
+        """Index of the first bin whose mean latency exceeds factor x the early baseline.
+
+        The baseline is the median bin mean over the first 10% of the run.
+        Returns None if per-operation cost never grows that much.
+        """
+        means = self.curve()['mean_us']
+        if len(means) < 10:
+            return None
+        early = sorted(means[:max(1, len(means) // 10)])
+        baseline = early[len(early) // 2]
+        for number, mean in enumerate(means):
+            if mean > baseline * factor:
+                return number * self.bin_size
+        return None
+
+    def to_dict(self):
+        """Export the histogram and curve for test_results."""
+        data = self.histogram.to_dict()
+        data['curve'] = self.curve()
+        data['growth_onset_index'] = self.growth_onset()
+        if self.budget_ns is not None:
+            data['budget_us'] = self.budget_ns / 1000.0
+            data['over_budget'] = self.over_budget
+        return data
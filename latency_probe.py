@@ -0,0 +1,104 @@
+"""
+Event-loop responsiveness probe.
+
+While a benchmark runs, EventLoopProbe keeps a 16 ms after() timer chain
+going, queues an after(0) callback on every tick, and every few ticks
+generates a synthetic <<LatencyProbe>> input event. Each callback records
+how late it ran compared to when it should have run. If the benchmark
+blocks the Tk event loop for 400 ms, the probe records ~400 ms of lag.
+
+Usage:
+    probe = EventLoopProbe(root)
+    probe.start()
+    run_benchmark()
+    results = probe.stop()   # dict of p50/p99/max lag in milliseconds
+"""
+
+import time
+
+from histogram import LatencyHistogram
+
+PROBE_EVENT = "<<LatencyProbe>>"
+
+class EventLoopProbe:
+    """Measures scheduled-vs-actual timer delay and input-to-handler latency."""
+
+    def __init__(self, root, interval_ms=16, input_every=3):
+        self.root = root
+        self.interval_ms = interval_ms
+        self.input_every = input_every
+        self.clock = time.perf_counter_ns
+        self._after_ids = set()
+        self._binding = None
+        self._pending_inputs = []
+        self._running = False
+
+    def start(self):
+        """Reset the histograms and start probing."""
+        self.timer_lag = LatencyHistogram()
+        self.zero_delay_lag = LatencyHistogram()
+        self.input_lag = LatencyHistogram()
+        self._ticks = 0
+        self._pending_inputs = []
+        self._running = True
+        self._binding = self.root.bind(PROBE_EVENT, self._on_input, add="+")
+        self._schedule_tick(self.clock())
+
+    def stop(self):
+        """Let pending probe callbacks run, stop probing and return the results."""
+        # Callbacks held up by the benchmark fire here and record their full delay
+        self.root.update()
+        self._running = False
+        for after_id in self._after_ids:
+            self.root.after_cancel(after_id)
+        self._after_ids.clear()
+        if self._binding is not None:
+            self.root.unbind(PROBE_EVENT, self._binding)
+            self._binding = None
+        return self.results()
+
+    def _after(self, delay_ms, callback):
+        holder = []
+
+        def run():
+            self._after_ids.discard(holder[0])
+            callback()
+
+        holder.append(self.root.after(delay_ms, run))
+        self._after_ids.add(holder[0])
+
+    def _schedule_tick(self, now):
+        intended = now + self.interval_ms * 1000000
+        self._after(self.interval_ms, lambda: self._tick(intended))
+
+    def _tick(self, intended):
+        if not self._running:
+            return
+        now = self.clock()
+        self.timer_lag.record(max(0, now - intended))
+        self._ticks += 1
+
+        self._after(0, lambda: self._zero_delay(now))
+        if self._ticks % self.input_every == 0:
+            # Latency is measured from when the input should have arrived
+            self._pending_inputs.append(intended)
+            self.root.event_generate(PROBE_EVENT, when="tail")
+        self._schedule_tick(now)
+
+    def _zero_delay(self, queued):
+        if self._running:
+            self.zero_delay_lag.record(max(0, self.clock() - queued))
+
+    def _on_input(self, event):
+        if self._running and self._pending_inputs:
+            self.input_lag.record(max(0, self.clock() - self._pending_inputs.pop(0)))
+
+    def results(self):
+        """Return lag percentiles in milliseconds."""
+        results = {}
+        for name, histogram in (('ui_lag', self.timer_lag), ('zero_delay_lag', self.zero_delay_lag),
+                                ('input_lag', self.input_lag)):
+            results.update(histogram.summary_ms(name))
+        results['ui_lag_samples'] = self.timer_lag.count
+        results['input_lag_samples'] = self.input_lag.count
+        return results
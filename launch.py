@@ -4,6 +4,7 @@ TTK Benchmark App Launcher
 Simple launcher script with error handling
 """
 
+import importlib.util
 import sys
 import os
 
@@ -11,14 +12,12 @@ def check_dependencies():
     """Check if all required dependencies are available."""
     missing = []
     
-    try:
-        import tkinter
-    except ImportError:
+    # find_spec locates the packages without importing them, so the check
+    # costs nothing against startup time
+    if importlib.util.find_spec("tkinter") is None:
         missing.append("tkinter (usually comes with Python)")
     
-    try:
-        import psutil
-    except ImportError:
+    if importlib.util.find_spec("psutil") is None:
         missing.append("psutil (install with: pip install psutil)")
     
     if missing:
@@ -1,24 +1,183 @@
+import time
+IMPORT_START = time.perf_counter()  # Startup timing begins before the heavier imports
+
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
-import time
 import random
 import threading
 import json
-import csv
-import platform
-import psutil
 import os
 
+from measurement import measure, flatten_summary, SUMMARY_KEYS
+from histogram import LatencyRecorder, LatencyHistogram
+from dispatch import UIDispatcher
+from virtual_tree import VirtualTreeview
+from update_scheduler import CoalescingUpdater
+from latency_probe import EventLoopProbe
+from treeview_ops import bulk_insert, bulk_insert_chunked, delete_all, detach_all, reattach, discard_detached
+from canvas_ops import create_batch, coords_batch
+from startup_profile import StartupTimer
+from style_cache import StyleCache
+
+# psutil, csv and the results store, regression, pooling, memory and sampler
+# modules are imported where they are first used so they stay off the startup path.
+
+IMPORTS_DONE = time.perf_counter()
+
+CONFIG_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "config.json")
+
+# Fallback values used when config.json is missing or incomplete
+DEFAULT_SETTINGS = {
+    "treeview_items": 1000,
+    "label_updates": 5000,
+    "window_count": 50,
+    "widget_count": 200,
+    "memory_test_mb": 100,
+    "repetitions": 5,
+    "warmup_runs": 1,
+    "virtual_tree_rows": 100000,
+    "scroll_steps": 200,
+    "bulk_insert_rows": 20000,
+    "bulk_batch_sizes": [10, 100, 1000, 5000],
+    "treeview_clear_strategy": "auto",
+    "clear_sizes": [10000, 100000, 1000000],
+    "update_fps": 60,
+    "bandwidth_mb": 128,
+    "bandwidth_random_reads": 1000000,
+    "startup_runs": 10,
+    "startup_cold_runs": 3,
+    "theme_widget_counts": [100, 1000, 10000],
+    "theme_throughput_widgets": 500,
+    "style_counts": [10, 100, 1000],
+    "style_widgets": 500,
+    "geometry_sizes": [100, 1000, 5000, 20000],
+    "canvas_item_counts": [1000, 10000, 100000],
+    "canvas_batch_size": 1000,
+    "canvas_frames": 120,
+    "text_document_mb": 4,
+    "text_line_cap": 10000,
+    "text_tag_ranges": 10000,
+    "scroll_tree_rows": 100000,
+    "monitor_interval": 0.5,
+    "monitor_history": 120,
+    "ui_lag_probe": True,
+    "fast_start": True,
+    "pooled_mode": True,
+    "memory_accounting": True,
+    "auto_save": True,
+    "results_db": "ttk_benchmark_results.db",
+    "show_system_info": True,
+    "verbose_mode": False,
+    "theme": "default"
+}
+
+# Benchmark tests in run order: (result key, TTKBenchmarkApp method name)
+BENCHMARK_TESTS = [
+    ('treeview', 'test_treeview_population'),
+    ('label_updates', 'test_label_progressbar_updates'),
+    ('windows', 'test_window_creation'),
+    ('widgets', 'test_widget_creation'),
+    ('memory', 'test_memory_usage'),
+]
+
+# Longer, specialised benchmarks run from the Benchmarks menu or the CLI: (result key, method name, label)
+EXTENDED_TESTS = [
+    ('virtual_treeview', 'test_virtual_treeview', 'Virtual vs. Real Treeview'),
+    ('bulk_insert', 'test_treeview_bulk_insert', 'Treeview Bulk Insert'),
+    ('treeview_clear', 'test_treeview_clear', 'Treeview Clear/Reload'),
+    ('coalesced_updates', 'test_coalesced_updates', 'Coalesced Label/Progress Updates'),
+    ('memory_bandwidth', 'test_memory_bandwidth', 'Memory Bandwidth'),
+    ('startup', 'test_startup_time', 'Cold/Warm Startup'),
+    ('theme_switch', 'test_theme_switch', 'Theme Switch Cost'),
+    ('style_scaling', 'test_style_scaling', 'Style Configure/Lookup Scaling'),
+    ('geometry', 'test_geometry_managers', 'Geometry Managers'),
+    ('canvas', 'test_canvas_items', 'Canvas Item Throughput'),
+    ('text', 'test_text_document', 'Large Text Document'),
+    ('scrolling', 'test_scrolling', 'Scrolling Frame Time'),
+]
+
+EXTENDED_LABELS = {key: label for key, _, label in EXTENDED_TESTS}
+
+TREEVIEW_CLEAR_STRATEGIES = ('loop', 'delete_all', 'detach', 'recreate')
+
+# Widgets cycled through by the theme benchmark: (ttk class, option changed by the update test)
+THEME_WIDGET_KINDS = (
+    (ttk.Label, 'text'),
+    (ttk.Button, 'text'),
+    (ttk.Checkbutton, 'text'),
+    (ttk.Entry, 'width'),
+    (ttk.Progressbar, 'value'),
+    (ttk.Scale, 'value'),
+)
+
+# Geometry manager configurations: (manager, propagate); place never propagates
+GEOMETRY_LAYOUTS = (('pack', True), ('pack', False), ('grid', True), ('grid', False), ('place', None))
+
+# Row height used to place widgets in the same single column pack and grid produce
+PLACE_ROW_HEIGHT = 22
+
+# Canvas operations timed per run; each is reported as items per second
+CANVAS_OPERATIONS = ('create', 'create_batch', 'move_item', 'move_tag', 'coords_item', 'coords_batch', 'delete')
+
+# Lines per insert when the Text benchmark appends to a capped log
+TEXT_APPEND_LINES = 100
+
+# Largest tree the per-item 'loop' clear strategy is benchmarked on
+LOOP_CLEAR_MAX_ROWS = 100000
+
+# The Performance Monitor draws at most this many per-core CPU sparklines
+MONITOR_MAX_CORES = 16
+
+ALL_TESTS = BENCHMARK_TESTS + [(key, method) for key, method, _ in EXTENDED_TESTS]
+
+# Method name -> result key
+TEST_KEYS = {method: key for key, method in ALL_TESTS}
+
+def load_config(path=CONFIG_FILE):
+    """Load config.json, filling in missing default_settings."""
+    config = {}
+    try:
+        with open(path, 'r') as f:
+            config = json.load(f)
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError) as e:
+        print(f"Could not read config {path}: {e}")
+
+    settings = dict(DEFAULT_SETTINGS)
+    settings.update(config.get('default_settings', {}))
+    config['default_settings'] = settings
+    return config
+
 class TTKBenchmarkApp:
-    def __init__(self, root):
+    def __init__(self, root, config=None, headless=False):
+        # Phases run from the first import of this module to the first drawn frame
+        self.startup = StartupTimer(origin=IMPORT_START)
+        self.startup.mark("imports", at=IMPORTS_DONE)
+        self.startup.mark("tk_root")
         self.root = root
         root.title("TTK Benchmark Test App")
         root.geometry("800x900") # Adjusted for more content
 
+        # Headless mode suppresses dialogs so tests can run unattended
+        self.headless = headless
+        self.config = config if config is not None else load_config()
+        settings = self.config['default_settings']
+        self.settings = settings
+        self.startup.mark("config")
+
         # Initialize result storage
         self.test_results = {}
         self.is_running_tests = False
+        self.current_test = None  # Name of the test method running now, if any
+        self.last_event_service = 0.0
         self.comparison_results = []  # For comparing multiple test runs
+        self.results_store = None  # Opened on first auto-save or history view
+        self.sampler = None  # Background system sampler, started by the Performance Monitor
+        self._fingerprint = None  # Shared by the info panel and every exporter, built on first use
+
+        # Worker threads hand all Tk work to the main thread through this
+        self.dispatcher = UIDispatcher(root)
         
         # --- Style ---
         self.style = ttk.Style()
@@ -26,13 +185,21 @@ class TTKBenchmarkApp:
         # e.g., 'aqua' (macOS default), 'clam', 'alt', 'default', 'classic'
         # print(self.style.theme_names()) # To see available themes
         # self.style.theme_use('aqua') # Explicitly set if needed, usually automatic on macOS
+        # The configured theme keeps headless runs comparable; the interactive app
+        # keeps the platform's native theme until the user picks another one
+        if headless and settings['theme'] in self.style.theme_names():
+            self.style.theme_use(settings['theme'])
+        self.style_cache = StyleCache(self.style)  # Theme changes go through it so cached lookups stay valid
+        self.startup.mark("style")
 
         # Create menu bar
         self.create_menu()
+        self.startup.mark("menu")
 
         # --- Main Frame ---
         main_frame = ttk.Frame(root, padding="10")
         main_frame.pack(fill=tk.BOTH, expand=True)
+        self.main_frame = main_frame
 
         # --- Theme Selection Frame ---
         theme_frame = ttk.LabelFrame(main_frame, text="Theme & Settings", padding="10")
@@ -46,41 +213,56 @@ class TTKBenchmarkApp:
         
         ttk.Separator(theme_frame, orient="vertical").pack(side=tk.LEFT, fill=tk.Y, padx=10)
         
-        self.auto_save_var = tk.BooleanVar(value=True)
+        self.auto_save_var = tk.BooleanVar(value=settings['auto_save'])
         ttk.Checkbutton(theme_frame, text="Auto-save results", variable=self.auto_save_var).pack(side=tk.LEFT, padx=5)
         
-        self.show_system_info_var = tk.BooleanVar(value=True)
+        self.show_system_info_var = tk.BooleanVar(value=settings['show_system_info'])
         ttk.Checkbutton(theme_frame, text="Show system info", variable=self.show_system_info_var, command=self.toggle_system_info).pack(side=tk.LEFT, padx=5)
 
-        self.verbose_mode_var = tk.BooleanVar(value=False)
+        self.verbose_mode_var = tk.BooleanVar(value=settings['verbose_mode'])
         ttk.Checkbutton(theme_frame, text="Verbose output", variable=self.verbose_mode_var).pack(side=tk.LEFT, padx=5)
 
+        ttk.Separator(theme_frame, orient="vertical").pack(side=tk.LEFT, fill=tk.Y, padx=10)
+
+        # Every test runs warmup + repetitions times through the measurement engine
+        ttk.Label(theme_frame, text="Runs:").pack(side=tk.LEFT, padx=5)
+        self.repetitions_var = tk.IntVar(value=settings['repetitions'])
+        ttk.Spinbox(theme_frame, from_=1, to=100, textvariable=self.repetitions_var, width=4).pack(side=tk.LEFT)
+        ttk.Label(theme_frame, text="Warmup:").pack(side=tk.LEFT, padx=5)
+        self.warmup_var = tk.IntVar(value=settings['warmup_runs'])
+        ttk.Spinbox(theme_frame, from_=0, to=20, textvariable=self.warmup_var, width=3).pack(side=tk.LEFT)
+
         # --- System Info Frame ---
         self.system_info_frame = ttk.LabelFrame(main_frame, text="System Information", padding="10")
-        self.system_info_frame.pack(fill=tk.X, pady=5)
-        self.update_system_info()
+        if self.show_system_info_var.get():
+            self.system_info_frame.pack(fill=tk.X, pady=5)
+        self.system_info_label = ttk.Label(self.system_info_frame, font=('TkDefaultFont', 9))
+        self.system_info_label.pack(anchor="w")
+        self.system_info_after_id = None
 
         # --- Controls Frame ---
         controls_frame = ttk.LabelFrame(main_frame, text="Benchmark Controls", padding="10")
         controls_frame.pack(fill=tk.X, pady=10)
+        self.controls_frame = controls_frame
 
         # --- Results Frame ---
         results_frame = ttk.LabelFrame(main_frame, text="Results", padding="10")
         results_frame.pack(fill=tk.BOTH, expand=True, pady=10)
+        self.results_frame = results_frame
 
         # --- Treeview Test ---
         ttk.Label(controls_frame, text="Treeview Items:").grid(row=0, column=0, padx=5, pady=5, sticky="w")
-        self.tree_items_var = tk.IntVar(value=1000)
+        self.tree_items_var = tk.IntVar(value=settings['treeview_items'])
         ttk.Entry(controls_frame, textvariable=self.tree_items_var, width=10).grid(row=0, column=1, padx=5, pady=5, sticky="w")
-        ttk.Button(controls_frame, text="Test Treeview Population", command=self.test_treeview_population).grid(row=0, column=2, padx=5, pady=5)
+        ttk.Button(controls_frame, text="Test Treeview Population", command=lambda: self.run_single_test(self.test_treeview_population)).grid(row=0, column=2, padx=5, pady=5)
         self.treeview_result_var = tk.StringVar(value="Treeview: Not run")
         ttk.Label(results_frame, textvariable=self.treeview_result_var).pack(anchor="w")
 
         # --- Label & Progressbar Update Test ---
         ttk.Label(controls_frame, text="Label Updates:").grid(row=1, column=0, padx=5, pady=5, sticky="w")
-        self.label_updates_var = tk.IntVar(value=5000)
+        self.label_updates_var = tk.IntVar(value=settings['label_updates'])
         ttk.Entry(controls_frame, textvariable=self.label_updates_var, width=10).grid(row=1, column=1, padx=5, pady=5, sticky="w")
-        ttk.Button(controls_frame, text="Test Label/Progress Updates", command=self.test_label_progressbar_updates).grid(row=1, column=2, padx=5, pady=5)
+        ttk.Button(controls_frame, text="Test Label/Progress Updates", command=lambda: self.run_single_test(self.test_label_progressbar_updates)).grid(row=1, column=2, padx=5, pady=5)
         self.label_update_result_var = tk.StringVar(value="Label/Progress: Not run")
         ttk.Label(results_frame, textvariable=self.label_update_result_var).pack(anchor="w")
         self.progressbar = ttk.Progressbar(results_frame, orient="horizontal", length=300, mode="determinate")
@@ -91,81 +273,107 @@ class TTKBenchmarkApp:
 
         # --- Window Creation Test ---
         ttk.Label(controls_frame, text="Windows to Create:").grid(row=2, column=0, padx=5, pady=5, sticky="w")
-        self.window_count_var = tk.IntVar(value=50)
+        self.window_count_var = tk.IntVar(value=settings['window_count'])
         ttk.Entry(controls_frame, textvariable=self.window_count_var, width=10).grid(row=2, column=1, padx=5, pady=5, sticky="w")
-        ttk.Button(controls_frame, text="Test Window Creation/Destruction", command=self.test_window_creation).grid(row=2, column=2, padx=5, pady=5)
+        ttk.Button(controls_frame, text="Test Window Creation/Destruction", command=lambda: self.run_single_test(self.test_window_creation)).grid(row=2, column=2, padx=5, pady=5)
         self.window_result_var = tk.StringVar(value="Windows: Not run")
         ttk.Label(results_frame, textvariable=self.window_result_var).pack(anchor="w")
 
         # --- Widget Creation Test ---
         ttk.Label(controls_frame, text="Widgets to Create:").grid(row=3, column=0, padx=5, pady=5, sticky="w")
-        self.widget_count_var = tk.IntVar(value=200) # Number of sets of widgets
+        self.widget_count_var = tk.IntVar(value=settings['widget_count']) # Number of sets of widgets
         ttk.Entry(controls_frame, textvariable=self.widget_count_var, width=10).grid(row=3, column=1, padx=5, pady=5, sticky="w")
-        ttk.Button(controls_frame, text="Test Bulk Widget Creation", command=self.test_widget_creation).grid(row=3, column=2, padx=5, pady=5)
+        ttk.Button(controls_frame, text="Test Bulk Widget Creation", command=lambda: self.run_single_test(self.test_widget_creation)).grid(row=3, column=2, padx=5, pady=5)
         self.widget_creation_result_var = tk.StringVar(value="Widget Creation: Not run")
         ttk.Label(results_frame, textvariable=self.widget_creation_result_var).pack(anchor="w")
 
         # --- Window Creation Test ---
         ttk.Label(controls_frame, text="Memory Test (MB):").grid(row=4, column=0, padx=5, pady=5, sticky="w")
-        self.memory_test_var = tk.IntVar(value=100)
+        self.memory_test_var = tk.IntVar(value=settings['memory_test_mb'])
         ttk.Entry(controls_frame, textvariable=self.memory_test_var, width=10).grid(row=4, column=1, padx=5, pady=5, sticky="w")
-        ttk.Button(controls_frame, text="Test Memory Usage", command=self.test_memory_usage).grid(row=4, column=2, padx=5, pady=5)
+        ttk.Button(controls_frame, text="Test Memory Usage", command=lambda: self.run_single_test(self.test_memory_usage)).grid(row=4, column=2, padx=5, pady=5)
         self.memory_result_var = tk.StringVar(value="Memory: Not run")
         ttk.Label(results_frame, textvariable=self.memory_result_var).pack(anchor="w")
 
+        # --- Run All Button ---
+        run_all_frame = ttk.Frame(controls_frame)
+        run_all_frame.grid(row=5, column=0, columnspan=3, pady=10, sticky="ew")
+        
+        self.run_all_btn = ttk.Button(run_all_frame, text="Run All Tests", command=self.run_all_tests_threaded)
+        self.run_all_btn.pack(side=tk.LEFT, padx=5)
+        
+        self.cancel_btn = ttk.Button(run_all_frame, text="Cancel Tests", command=self.cancel_tests, state="disabled")
+        self.cancel_btn.pack(side=tk.LEFT, padx=5)
+        
+        self.save_results_btn = ttk.Button(run_all_frame, text="Save Results", command=self.save_results)
+        self.save_results_btn.pack(side=tk.LEFT, padx=5)
+        
+        self.load_results_btn = ttk.Button(run_all_frame, text="Load Results", command=self.load_results)
+        self.load_results_btn.pack(side=tk.LEFT, padx=5)
+
+        self.startup.mark("core_panels")
+
+        # The treeview, summary, sample widgets and system info are not needed
+        # to draw the first frame; fast start builds them once the window is up
+        self.secondary_panels_built = False
+        self._tree = None
+        self._summary_text = None
+        if settings['fast_start'] and not headless:
+            root.bind("<Map>", self.on_first_map, add="+")
+        else:
+            self.finish_startup()
+
+    def on_first_map(self, event):
+        """Record the first drawn frame, then build the deferred panels."""
+        if event.widget is not self.root or self.secondary_panels_built:
+            return
+        self.root.update_idletasks()
+        self.startup.mark("first_frame")
+        self.root.after_idle(self.finish_startup)
+
+    def finish_startup(self):
+        """Build the deferred panels and report the startup phases."""
+        self.build_secondary_panels()
+        self.startup.mark("secondary_panels")
+        if self.verbose_mode_var.get():
+            print(self.startup.report())
+
+    def build_secondary_panels(self):
+        """Create the panels that are not needed for the first frame."""
+        if self.secondary_panels_built:
+            return
+        self.secondary_panels_built = True
+
         # --- Treeview Widget for Testing ---
-        treeview_frame = ttk.LabelFrame(results_frame, text="Test Treeview", padding="10")
+        treeview_frame = ttk.LabelFrame(self.results_frame, text="Test Treeview", padding="10")
         treeview_frame.pack(fill=tk.BOTH, expand=True, pady=10)
         
-        # Create treeview with columns
-        self.tree = ttk.Treeview(treeview_frame, columns=("col1", "col2"), show="headings", height=8)
-        self.tree.heading("col1", text="Item")
-        self.tree.heading("col2", text="Value")
-        self.tree.column("col1", width=150)
-        self.tree.column("col2", width=150)
-        
         # Add scrollbars for treeview
-        tree_v_scroll = ttk.Scrollbar(treeview_frame, orient="vertical", command=self.tree.yview)
-        tree_h_scroll = ttk.Scrollbar(treeview_frame, orient="horizontal", command=self.tree.xview)
-        self.tree.configure(yscrollcommand=tree_v_scroll.set, xscrollcommand=tree_h_scroll.set)
-        
-        # Pack treeview and scrollbars
-        self.tree.grid(row=0, column=0, sticky="nsew")
-        tree_v_scroll.grid(row=0, column=1, sticky="ns")
-        tree_h_scroll.grid(row=1, column=0, sticky="ew")
+        self.treeview_frame = treeview_frame
+        self.tree_v_scroll = ttk.Scrollbar(treeview_frame, orient="vertical")
+        self.tree_h_scroll = ttk.Scrollbar(treeview_frame, orient="horizontal")
+        self.tree_v_scroll.grid(row=0, column=1, sticky="ns")
+        self.tree_h_scroll.grid(row=1, column=0, sticky="ew")
+
+        # Create treeview with columns
+        self.build_treeview()
         
         # Configure grid weights
         treeview_frame.grid_rowconfigure(0, weight=1)
         treeview_frame.grid_columnconfigure(0, weight=1)
 
         # --- Performance Summary ---
-        summary_frame = ttk.LabelFrame(results_frame, text="Performance Summary", padding="10")
+        summary_frame = ttk.LabelFrame(self.results_frame, text="Performance Summary", padding="10")
         summary_frame.pack(fill=tk.X, pady=10)
         
-        self.summary_text = tk.Text(summary_frame, height=6, wrap=tk.WORD)
+        self._summary_text = tk.Text(summary_frame, height=6, wrap=tk.WORD)
         summary_scrollbar = ttk.Scrollbar(summary_frame, orient="vertical", command=self.summary_text.yview)
         self.summary_text.configure(yscrollcommand=summary_scrollbar.set)
         self.summary_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         summary_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
 
-        # --- Run All Button ---
-        run_all_frame = ttk.Frame(controls_frame)
-        run_all_frame.grid(row=5, column=0, columnspan=3, pady=10, sticky="ew")
-        
-        self.run_all_btn = ttk.Button(run_all_frame, text="Run All Tests", command=self.run_all_tests_threaded)
-        self.run_all_btn.pack(side=tk.LEFT, padx=5)
-        
-        self.cancel_btn = ttk.Button(run_all_frame, text="Cancel Tests", command=self.cancel_tests, state="disabled")
-        self.cancel_btn.pack(side=tk.LEFT, padx=5)
-        
-        self.save_results_btn = ttk.Button(run_all_frame, text="Save Results", command=self.save_results)
-        self.save_results_btn.pack(side=tk.LEFT, padx=5)
-        
-        self.load_results_btn = ttk.Button(run_all_frame, text="Load Results", command=self.load_results)
-        self.load_results_btn.pack(side=tk.LEFT, padx=5)
-
         # --- Miscellaneous Widgets for Visual Check ---
-        misc_frame = ttk.LabelFrame(main_frame, text="Sample TTK Widgets", padding="10")
+        misc_frame = ttk.LabelFrame(self.main_frame, text="Sample TTK Widgets", padding="10")
         misc_frame.pack(fill=tk.X, pady=10)
 
         ttk.Button(misc_frame, text="TTK Button").pack(side=tk.LEFT, padx=5)
@@ -178,10 +386,79 @@ class TTKBenchmarkApp:
         self.combobox.current(0)
         ttk.Scale(misc_frame, from_=0, to=100, orient=tk.HORIZONTAL).pack(side=tk.LEFT, padx=5, fill=tk.X, expand=True)
 
-    def clear_treeview(self):
-        """Clears all items from the treeview."""
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        self.update_system_info()
+
+    @property
+    def tree(self):
+        if not self.secondary_panels_built:
+            self.build_secondary_panels()
+        return self._tree
+
+    @tree.setter
+    def tree(self, value):
+        self._tree = value
+
+    @property
+    def summary_text(self):
+        if not self.secondary_panels_built:
+            self.build_secondary_panels()
+        return self._summary_text
+
+    @property
+    def fingerprint(self):
+        if self._fingerprint is None:
+            from system_fingerprint import SystemFingerprint
+            self._fingerprint = SystemFingerprint(self.root)
+        return self._fingerprint
+
+    def build_treeview(self):
+        """Create the test treeview and wire it to its scrollbars."""
+        self.tree = ttk.Treeview(self.treeview_frame, columns=("col1", "col2"), show="headings", height=8)
+        self.tree.heading("col1", text="Item")
+        self.tree.heading("col2", text="Value")
+        self.tree.column("col1", width=150)
+        self.tree.column("col2", width=150)
+        self.tree.configure(yscrollcommand=self.tree_v_scroll.set, xscrollcommand=self.tree_h_scroll.set)
+        self.tree_v_scroll.configure(command=self.tree.yview)
+        self.tree_h_scroll.configure(command=self.tree.xview)
+        self.tree.grid(row=0, column=0, sticky="nsew")
+
+    def clear_strategy(self):
+        """The configured clear strategy; 'auto' uses the fastest one test_treeview_clear measured."""
+        strategy = self.settings['treeview_clear_strategy']
+        if strategy == 'auto':
+            strategy = self.test_results.get('treeview_clear', {}).get('fastest_strategy', 'delete_all')
+        return strategy
+
+    def clear_treeview(self, strategy=None, reuse=False):
+        """Clears all items from the treeview.
+
+        Strategies: 'delete_all' (one Tcl call, the fallback), 'loop' (one
+        delete() per item), 'detach' (keep items for reload_treeview to reuse)
+        and 'recreate' (destroy and rebuild the widget). Detached items are
+        only kept when reuse is True, i.e. the caller reloads through
+        reload_treeview(); otherwise they are deleted so they cannot pile up.
+        """
+        strategy = strategy or self.clear_strategy()
+        if strategy == 'loop':
+            for item in self.tree.get_children():
+                self.tree.delete(item)
+        elif strategy == 'detach':
+            detach_all(self.tree)
+            if not reuse:
+                discard_detached(self.tree)
+        elif strategy == 'recreate':
+            discard_detached(self.tree)
+            self.tree.destroy()
+            self.build_treeview()
+        else:
+            discard_detached(self.tree)
+            delete_all(self.tree)
+
+    def reload_treeview(self, rows):
+        """Load rows into the (cleared) treeview, reusing detached items where possible."""
+        reused = reattach(self.tree, rows)
+        bulk_insert(self.tree, rows[reused:])
 
     def create_menu(self):
         """Create the application menu bar."""
@@ -194,6 +471,7 @@ class TTKBenchmarkApp:
         file_menu.add_command(label="Save Results...", command=self.save_results, accelerator="Cmd+S")
         file_menu.add_command(label="Load Results...", command=self.load_results, accelerator="Cmd+O")
         file_menu.add_command(label="Export to CSV...", command=self.export_to_csv)
+        file_menu.add_command(label="Results History...", command=self.show_history_window)
         file_menu.add_separator()
         file_menu.add_command(label="Reset All Tests", command=self.reset_all_tests)
         file_menu.add_separator()
@@ -204,12 +482,19 @@ class TTKBenchmarkApp:
         menubar.add_cascade(label="Tools", menu=tools_menu)
         tools_menu.add_command(label="System Information", command=self.show_system_info_window)
         tools_menu.add_command(label="Performance Monitor", command=self.show_performance_monitor)
+        tools_menu.add_command(label="Latency Curves", command=self.show_latency_curves)
         tools_menu.add_command(label="Compare Results", command=self.show_comparison_window)
         tools_menu.add_command(label="Stress Test Mode", command=self.show_stress_test_window)
         tools_menu.add_command(label="Clear Treeview", command=self.clear_treeview)
         tools_menu.add_separator()
         tools_menu.add_command(label="Generate Report", command=self.generate_html_report)
         
+        # Benchmarks menu (extended suites)
+        bench_menu = tk.Menu(menubar, tearoff=0)
+        menubar.add_cascade(label="Benchmarks", menu=bench_menu)
+        for test_key, method_name, label in EXTENDED_TESTS:
+            bench_menu.add_command(label=label, command=lambda k=test_key, m=method_name: self.run_extended_test(k, m))
+        
         # Help menu
         help_menu = tk.Menu(menubar, tearoff=0)
         menubar.add_cascade(label="Help", menu=help_menu)
@@ -224,51 +509,114 @@ class TTKBenchmarkApp:
     def change_theme(self, event=None):
         """Change the TTK theme."""
         try:
-            self.style.theme_use(self.theme_var.get())
+            start_time = time.perf_counter()
+            self.style_cache.theme_use(self.theme_var.get())
+            self.root.update_idletasks()
+            if self.verbose_mode_var.get():
+                print(f"Theme switch to {self.theme_var.get()}: {(time.perf_counter() - start_time) * 1000:.1f} ms")
         except tk.TclError as e:
             messagebox.showerror("Theme Error", f"Could not apply theme: {e}")
 
     def update_system_info(self):
-        """Update system information display."""
+        """Refresh the live values in the system information panel."""
+        self.system_info_after_id = None
         if not self.show_system_info_var.get():
             return
             
         try:
-            cpu_count = psutil.cpu_count()
-            memory = psutil.virtual_memory()
-            python_version = platform.python_version()
-            tk_version = self.root.tk.call('info', 'patchlevel')
-            
-            info_text = f"OS: {platform.system()} {platform.release()} | "
-            info_text += f"CPU: {cpu_count} cores | "
-            info_text += f"RAM: {memory.total // (1024**3)}GB ({memory.percent}% used) | "
-            info_text += f"Python: {python_version} | Tk: {tk_version}"
-            
-            if hasattr(self, 'system_info_label'):
-                self.system_info_label.destroy()
-            self.system_info_label = ttk.Label(self.system_info_frame, text=info_text, font=('TkDefaultFont', 9))
-            self.system_info_label.pack(anchor="w")
+            info_text = self.fingerprint.summary()
+            if self.system_info_label.cget('text') != info_text:
+                self.system_info_label.config(text=info_text)
         except Exception as e:
             print(f"Error updating system info: {e}")
 
         # Schedule the next update
-        if self.show_system_info_var.get():
-            self.root.after(5000, self.update_system_info) # Update every 5 seconds
+        self.system_info_after_id = self.root.after(5000, self.update_system_info) # Update every 5 seconds
 
     def toggle_system_info(self):
         """Toggle system info visibility."""
+        if self.system_info_after_id is not None:
+            self.root.after_cancel(self.system_info_after_id)
+            self.system_info_after_id = None
         if self.show_system_info_var.get():
-            self.system_info_frame.pack(fill=tk.X, pady=5, before=self.root.children['!frame'].children['!labelframe2'])
+            self.system_info_frame.pack(fill=tk.X, pady=5, before=self.controls_frame)
             self.update_system_info()
         else:
             self.system_info_frame.pack_forget()
 
+    def measure(self, sample):
+        """Run a benchmark sample through the shared measurement engine."""
+        summaries = measure(
+            sample,
+            repeats=self.repetitions_var.get(),
+            warmup=self.warmup_var.get(),
+            cancelled=lambda: not self.service_events()
+        )
+        return flatten_summary(summaries)
+
+    def service_events(self, interval=0.1):
+        """Let the GUI handle input (Cancel, window moves) during a long test.
+
+        Runs the event loop at most once per interval so the cost inside timed
+        loops stays small; headless runs have no user input and skip it.
+        Returns False once the run has been cancelled.
+        """
+        if not self.headless:
+            now = time.perf_counter()
+            if now - self.last_event_service >= interval:
+                self.last_event_service = now
+                self.root.update()
+        return self.is_running_tests
+
+    def run_single_test(self, test_method):
+        """Run one test from its button, marking the run as active. Returns False if another run was active."""
+        # Buttons stay live while service_events() runs the event loop mid-test
+        if self.is_running_tests or self.current_test is not None:
+            return False
+        self.is_running_tests = True
+        try:
+            self.run_probed(test_method)
+        finally:
+            self.is_running_tests = False
+        return True
+
+    def run_probed(self, test_method):
+        """Run a test as the current test, probing event-loop lag when enabled."""
+        test_key = TEST_KEYS.get(test_method.__name__)
+        previous = self.test_results.get(test_key)
+        sampler_running = self.sampler is not None and self.sampler.running
+        self.current_test = test_method.__name__
+        try:
+            self.run_with_probe(test_method)
+        finally:
+            self.current_test = None
+        # The monitor's sampler thread competes for the CPU; flag results measured alongside it
+        sampler_running = sampler_running or (self.sampler is not None and self.sampler.running)
+        result = self.test_results.get(test_key)
+        if sampler_running and result is not None and result is not previous:
+            result['sampler_running'] = True
+            result['sampler_overhead_pct'] = self.sampler.overhead_pct()
+
+    def run_with_probe(self, test_method):
+        """Run a test, adding event-loop lag to its results when probing is enabled."""
+        test_key = TEST_KEYS.get(test_method.__name__)
+        if not self.settings['ui_lag_probe'] or test_key is None:
+            return test_method()
+
+        previous = self.test_results.get(test_key)
+        probe = EventLoopProbe(self.root)
+        probe.start()
+        try:
+            test_method()
+        finally:
+            lag = probe.stop()
+        # Only annotate results this run produced
+        result = self.test_results.get(test_key)
+        if result is not None and result is not previous:
+            result.update(lag)
+
     def test_treeview_population(self):
         """Tests how long it takes to populate the treeview."""
-        if self.is_running_tests and hasattr(self, 'test_thread'):
-            return
-            
-        self.clear_treeview()
         num_items = self.tree_items_var.get()
         if num_items <= 0:
             self.treeview_result_var.set("Treeview: Invalid number of items.")
@@ -277,28 +625,54 @@ class TTKBenchmarkApp:
         self.treeview_result_var.set(f"Treeview: Running for {num_items} items...")
         self.root.update_idletasks() # Ensure UI is updated before starting
 
-        start_time = time.perf_counter()
-        for i in range(num_items):
-            if hasattr(self, 'is_running_tests') and not self.is_running_tests:
-                break
-            self.tree.insert("", "end", values=(f"Item {i+1}", f"Data {random.randint(0, 1000)}"))
-            if i % 100 == 0: # Allow UI to refresh periodically for very large numbers
-                self.root.update_idletasks()
-        
-        # Ensure all items are rendered before stopping timer
-        self.root.update_idletasks()
-        end_time = time.perf_counter()
-        
-        duration = end_time - start_time
-        self.treeview_result_var.set(f"Treeview: Populated {num_items} items in {duration:.4f} seconds.")
+        recorders = []
+
+        def populate():
+            self.clear_treeview()
+            self.root.update_idletasks()
+            # Per-insert latency, including the periodic idle flush, so stalls show up
+            recorder = LatencyRecorder(num_items)
+            recorders[:] = [recorder]
+            clock = recorder.clock
+            start_time = time.perf_counter()
+            for i in range(num_items):
+                if not self.service_events():
+                    break
+                op_start = clock()
+                self.tree.insert("", "end", values=(f"Item {i+1}", f"Data {random.randint(0, 1000)}"))
+                if i % 100 == 0: # Allow UI to refresh periodically for very large numbers
+                    self.root.update_idletasks()
+                recorder.record(clock() - op_start)
+            
+            # Ensure all items are rendered before stopping timer
+            self.root.update_idletasks()
+            return time.perf_counter() - start_time
+
+        stats = self.measure(populate)
+        if not stats:
+            return
+        duration = stats['duration']
+        self.treeview_result_var.set(f"Treeview: Populated {num_items} items in {duration:.4f} seconds (median of {stats['repetitions']}).")
         
         # Store results
         self.test_results['treeview'] = {
             'items': num_items,
             'duration': duration,
-            'rate': num_items / duration if duration > 0 else 0
+            'rate': num_items / duration if duration > 0 else 0,
+            **stats,
+            'latency_histogram': recorders[0].to_dict()
         }
 
+        if self.settings['memory_accounting']:
+            def insert_rows():
+                for i in range(num_items):
+                    self.tree.insert("", "end", values=(f"Item {i+1}", f"Data {random.randint(0, 1000)}"))
+
+            # Free the timed rows outside the accounted window so their release doesn't offset the new ones
+            self.clear_treeview()
+            self.root.update_idletasks()
+            self.test_results['treeview'].update(self.account_memory(insert_rows, num_items, 'item'))
+
     def test_label_progressbar_updates(self):
         """Tests how long it takes to update a label and progressbar rapidly."""
         num_updates = self.label_updates_var.get()
@@ -310,28 +684,113 @@ class TTKBenchmarkApp:
         self.progressbar["maximum"] = num_updates
         self.root.update_idletasks()
 
-        start_time = time.perf_counter()
-        for i in range(num_updates):
-            if hasattr(self, 'is_running_tests') and not self.is_running_tests:
-                break
-            self.dynamic_label.config(text=f"Dynamic Label: Update {i+1}/{num_updates}")
-            self.progressbar["value"] = i + 1
-            if i % 100 == 0: # Update UI periodically to see changes
-                self.root.update_idletasks()
-        
-        self.dynamic_label.config(text=f"Dynamic Label: Update {num_updates}/{num_updates}")
-        self.progressbar["value"] = num_updates
-        self.root.update_idletasks() # Ensure final update is rendered
-        end_time = time.perf_counter()
+        recorders = []
+
+        def run_updates():
+            self.progressbar["value"] = 0
+            self.root.update_idletasks()
+            recorder = LatencyRecorder(num_updates)
+            recorders[:] = [recorder]
+            clock = recorder.clock
+            start_time = time.perf_counter()
+            for i in range(num_updates):
+                if not self.service_events():
+                    break
+                op_start = clock()
+                self.dynamic_label.config(text=f"Dynamic Label: Update {i+1}/{num_updates}")
+                self.progressbar["value"] = i + 1
+                if i % 100 == 0: # Update UI periodically to see changes
+                    self.root.update_idletasks()
+                recorder.record(clock() - op_start)
+            
+            self.dynamic_label.config(text=f"Dynamic Label: Update {num_updates}/{num_updates}")
+            self.progressbar["value"] = num_updates
+            self.root.update_idletasks() # Ensure final update is rendered
+            return time.perf_counter() - start_time
 
-        duration = end_time - start_time
-        self.label_update_result_var.set(f"Label/Progress: {num_updates} updates in {duration:.4f} seconds.")
+        stats = self.measure(run_updates)
+        if not stats:
+            return
+        duration = stats['duration']
+        self.label_update_result_var.set(f"Label/Progress: {num_updates} updates in {duration:.4f} seconds (median of {stats['repetitions']}).")
         
         # Store results
         self.test_results['label_updates'] = {
             'updates': num_updates,
             'duration': duration,
-            'rate': num_updates / duration if duration > 0 else 0
+            'rate': num_updates / duration if duration > 0 else 0,
+            **stats,
+            'latency_histogram': recorders[0].to_dict()
+        }
+
+    def test_coalesced_updates(self):
+        """Compares updating the label/progressbar on every value with frame-rate-coalesced updates."""
+        num_updates = self.label_updates_var.get()
+        fps = self.settings['update_fps']
+        if num_updates <= 0:
+            return
+
+        self.progressbar["maximum"] = num_updates
+        set_label = lambda text: self.dynamic_label.config(text=text)
+        set_progress = lambda value: self.progressbar.configure(value=value)
+
+        def timed(produce):
+            def sample():
+                self.progressbar["value"] = 0
+                self.root.update_idletasks()
+                cpu_start = time.process_time()
+                start_time = time.perf_counter()
+                produce()
+                self.root.update_idletasks()
+                return {
+                    'wall_time': time.perf_counter() - start_time,
+                    'cpu_time': time.process_time() - cpu_start
+                }
+            return self.measure(sample)
+
+        # The current approach: every value goes straight to the widgets
+        def every_update():
+            for i in range(num_updates):
+                if not self.is_running_tests:
+                    break
+                set_label(f"Dynamic Label: Update {i+1}/{num_updates}")
+                set_progress(i + 1)
+                if i % 100 == 0:
+                    self.root.update()
+
+        # Same producer, but widgets only see the newest value once per frame
+        updaters = []
+
+        def coalesced():
+            updater = CoalescingUpdater(self.root, fps=fps)
+            updaters[:] = [updater]
+            for i in range(num_updates):
+                if not self.is_running_tests:
+                    break
+                updater.post('label', set_label, f"Dynamic Label: Update {i+1}/{num_updates}")
+                updater.post('progress', set_progress, i + 1)
+                if i % 100 == 0:
+                    self.root.update()
+            updater.stop()
+
+        direct = timed(every_update)
+        batched = timed(coalesced)
+        if not direct or not batched:
+            return
+
+        counters = updaters[0].stats()
+        self.test_results['coalesced_updates'] = {
+            'updates': num_updates,
+            'fps': fps,
+            'direct_wall_time': direct['wall_time'],
+            'direct_cpu_time': direct['cpu_time'],
+            'coalesced_wall_time': batched['wall_time'],
+            'coalesced_cpu_time': batched['cpu_time'],
+            'wall_speedup': direct['wall_time'] / batched['wall_time'] if batched['wall_time'] > 0 else 0,
+            'cpu_saving_pct': (1 - batched['cpu_time'] / direct['cpu_time']) * 100 if direct['cpu_time'] > 0 else 0,
+            'widget_updates_direct': num_updates * 2,
+            'widget_updates_coalesced': counters['applied'],
+            'frames': counters['ticks']
         }
 
     def test_window_creation(self):
@@ -344,62 +803,205 @@ class TTKBenchmarkApp:
         self.window_result_var.set(f"Windows: Creating {num_windows} windows...")
         self.root.update_idletasks()
         
-        windows_list = []
-        start_time = time.perf_counter()
+        def create_and_destroy():
+            windows_list = []
+            start_time = time.perf_counter()
 
-        for i in range(num_windows):
-            win = tk.Toplevel(self.root)
-            win.geometry("150x50+{}+{}".format(random.randint(50,800), random.randint(50,600)))
-            win.title(f"Test Win {i+1}")
-            ttk.Label(win, text=f"Window {i+1}").pack(padx=10, pady=10)
-            windows_list.append(win)
-            if i % 10 == 0: # Allow UI to refresh
-                self.root.update_idletasks()
-        
-        self.root.update_idletasks() # Ensure all windows are mapped
-        creation_time = time.perf_counter()
-        creation_duration = creation_time - start_time
-        self.window_result_var.set(f"Windows: Created {num_windows} in {creation_duration:.4f}s. Destroying...")
-        self.root.update_idletasks()
+            for i in range(num_windows):
+                win = tk.Toplevel(self.root)
+                win.geometry("150x50+{}+{}".format(random.randint(50,800), random.randint(50,600)))
+                win.title(f"Test Win {i+1}")
+                ttk.Label(win, text=f"Window {i+1}").pack(padx=10, pady=10)
+                windows_list.append(win)
+                if i % 10 == 0: # Allow UI to refresh
+                    self.root.update_idletasks()
+                    self.service_events()
+            
+            self.root.update_idletasks() # Ensure all windows are mapped
+            creation_duration = time.perf_counter() - start_time
+
+            # Destruction part
+            destroy_start_time = time.perf_counter()
+            for win in windows_list:
+                win.destroy()
+                # self.root.update_idletasks() # Can slow down destruction significantly if uncommented
+            
+            self.root.update_idletasks() # Ensure all windows are destroyed
+            destroy_duration = time.perf_counter() - destroy_start_time
+            return {
+                'creation_duration': creation_duration,
+                'destroy_duration': destroy_duration,
+                'total_duration': creation_duration + destroy_duration
+            }
 
-        # Destruction part
-        destroy_start_time = time.perf_counter()
-        for win in windows_list:
-            win.destroy()
-            # self.root.update_idletasks() # Can slow down destruction significantly if uncommented
-        
-        self.root.update_idletasks() # Ensure all windows are destroyed
-        destroy_end_time = time.perf_counter()
-        destroy_duration = destroy_end_time - destroy_start_time
-        
-        total_duration = creation_duration + destroy_duration
+        rss_before = self.current_rss_mb()
+        stats = self.measure(create_and_destroy)
+        if not stats:
+            return
+        fresh_rss_growth = self.current_rss_mb() - rss_before
+        creation_duration = stats['creation_duration']
+        destroy_duration = stats['destroy_duration']
+        total_duration = stats['total_duration']
         self.window_result_var.set(f"Windows: {num_windows} created in {creation_duration:.4f}s, destroyed in {destroy_duration:.4f}s. Total: {total_duration:.4f}s")
         
         # Store results
         self.test_results['windows'] = {
             'count': num_windows,
-            'creation_duration': creation_duration,
-            'destroy_duration': destroy_duration,
-            'total_duration': total_duration
+            # One create and one destroy per window
+            'rate': num_windows * 2 / total_duration if total_duration > 0 else 0,
+            **stats,
+            'fresh_rss_growth_mb': fresh_rss_growth
         }
 
-    def test_widget_creation(self):
-        """Tests creation of many miscellaneous ttk widgets in a new window."""
-        num_widget_sets = self.widget_count_var.get()
-        if num_widget_sets <= 0:
-            self.widget_creation_result_var.set("Widget Creation: Invalid number.")
-            return
+        if self.settings['memory_accounting']:
+            accounted = []
 
-        self.widget_creation_result_var.set(f"Widget Creation: Creating {num_widget_sets} sets...")
+            def open_windows():
+                for i in range(num_windows):
+                    win = tk.Toplevel(self.root)
+                    win.geometry("150x50+{}+{}".format(random.randint(50,800), random.randint(50,600)))
+                    win.title(f"Test Win {i+1}")
+                    ttk.Label(win, text=f"Window {i+1}").pack(padx=10, pady=10)
+                    accounted.append(win)
+
+            try:
+                self.test_results['windows'].update(self.account_memory(open_windows, num_windows, 'window'))
+            finally:
+                for win in accounted:
+                    win.destroy()
+
+        if self.settings['pooled_mode']:
+            pooled = self.measure_window_pool(num_windows)
+            if pooled:
+                self.test_results['windows'].update(pooled)
+                self.window_result_var.set(
+                    f"Windows: {num_windows} created in {creation_duration:.4f}s, destroyed in {destroy_duration:.4f}s; "
+                    f"pooled acquire {pooled['pooled_acquire_duration']:.4f}s, release {pooled['pooled_release_duration']:.4f}s")
+
+    def current_rss_mb(self):
+        """Return this process's resident set size in MB."""
+        import psutil
+        return psutil.Process().memory_info().rss / 1024 / 1024
+
+    def account_memory(self, work, count, unit):
+        """Run work() in an untimed pass under tracemalloc and RSS/USS accounting.
+
+        Returns per-unit costs ('python_bytes_per_item', ...) and the top
+        allocation sites.
+        """
+        from memory_accounting import MemoryAccountant, per_unit
+        accountant = MemoryAccountant()
+        accountant.start()
+        try:
+            work()
+            self.root.update_idletasks() # Let Tk realize the new widgets
+        finally:
+            usage = accountant.stop()
+        return per_unit(usage, count, unit)
+
+    def account_widget_types(self, count):
+        """Measure the memory cost of each widget type used by the widget test."""
+        win = tk.Toplevel(self.root)
+        win.title("Widget Memory Accounting")
+        win.geometry("400x300")
+        factories = (
+            ('Frame', lambda: ttk.Frame(win, padding=2)),
+            ('Label', lambda: ttk.Label(win, text="Set:")),
+            ('Button', lambda: ttk.Button(win, text="B")),
+            ('Entry', lambda: ttk.Entry(win, width=5)),
+            ('Checkbutton', lambda: ttk.Checkbutton(win, text="C"))
+        )
+        # The outer accountant keeps tracemalloc running across all types
+        from memory_accounting import MemoryAccountant
+        overall = MemoryAccountant()
+        overall.start()
+        per_type = {}
+        try:
+            for name, factory in factories:
+                costs = self.account_memory(lambda: [factory().pack(anchor="w") for _ in range(count)], count, 'widget')
+                costs.pop('top_allocations')
+                per_type[name] = costs
+        finally:
+            usage = overall.stop()
+            win.destroy()
+        return {
+            'memory_per_widget_type': per_type,
+            'top_allocations': usage['top_allocations']
+        }
+
+    def measure_pool(self, pool, count, acquire_args):
+        """Time acquiring and releasing count items from a prefilled pool.
+
+        Returns flattened stats plus per-operation latency percentiles and the
+        steady-state RSS once the pool holds every item.
+        """
+        pool.prefill(count)
         self.root.update_idletasks()
+        acquire_latency = LatencyHistogram()
+        release_latency = LatencyHistogram()
+        clock = time.perf_counter_ns
 
-        test_win = tk.Toplevel(self.root)
-        test_win.title("Bulk Widget Creation Test")
-        test_win.geometry("400x300")
-        
-        # Create a canvas and a frame inside it to make it scrollable
-        canvas = tk.Canvas(test_win)
-        scrollbar = ttk.Scrollbar(test_win, orient="vertical", command=canvas.yview)
+        def cycle():
+            items = []
+            start_time = time.perf_counter()
+            for i in range(count):
+                op_start = clock()
+                items.append(pool.acquire(*acquire_args(i)))
+                acquire_latency.record(clock() - op_start)
+            self.root.update_idletasks() # Ensure everything is mapped
+            acquire_duration = time.perf_counter() - start_time
+
+            release_start = time.perf_counter()
+            for item in items:
+                op_start = clock()
+                pool.release(item)
+                release_latency.record(clock() - op_start)
+            self.root.update_idletasks()
+            release_duration = time.perf_counter() - release_start
+            return {
+                'pooled_acquire_duration': acquire_duration,
+                'pooled_release_duration': release_duration,
+                'pooled_total_duration': acquire_duration + release_duration
+            }
+
+        rss_before = self.current_rss_mb()
+        stats = self.measure(cycle)
+        if not stats:
+            return {}
+        rss_after = self.current_rss_mb()
+        return {
+            **stats,
+            **acquire_latency.summary_ms('pooled_acquire'),
+            **release_latency.summary_ms('pooled_release'),
+            'pooled_created': pool.created,
+            'pooled_reused': pool.reused,
+            'pooled_steady_rss_mb': rss_after,
+            'pooled_rss_growth_mb': rss_after - rss_before
+        }
+
+    def measure_window_pool(self, num_windows):
+        """Run the window test against a ToplevelPool (withdraw/deiconify)."""
+        def build(win):
+            label = ttk.Label(win)
+            label.pack(padx=10, pady=10)
+            return label
+
+        def configure(win, label, i):
+            win.geometry("150x50+{}+{}".format(random.randint(50,800), random.randint(50,600)))
+            win.title(f"Test Win {i+1}")
+            label.config(text=f"Window {i+1}")
+
+        from widget_pool import ToplevelPool
+        pool = ToplevelPool(self.root, build, configure)
+        try:
+            return self.measure_pool(pool, num_windows, lambda i: (i,))
+        finally:
+            pool.clear()
+
+    def create_scrollable_frame(self, parent):
+        """Pack a canvas with a scrollbar into parent and return (canvas, frame scrolled by it)."""
+        canvas = tk.Canvas(parent)
+        scrollbar = ttk.Scrollbar(parent, orient="vertical", command=canvas.yview)
         scrollable_frame = ttk.Frame(canvas)
 
         scrollable_frame.bind(
@@ -414,20 +1016,21 @@ class TTKBenchmarkApp:
 
         canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
-        
-        widgets = []
+        return canvas, scrollable_frame
 
-        start_time = time.perf_counter()
+    def add_widget_sets(self, parent, num_widget_sets):
+        """Create num_widget_sets rows of label, button, entry and checkbutton in parent."""
+        widgets = []
         for i in range(num_widget_sets):
-            frame = ttk.Frame(scrollable_frame, padding=2) # Use a frame for each set
+            frame = ttk.Frame(parent, padding=2) # Use a frame for each set
             l = ttk.Label(frame, text=f"Set {i+1}:")
             l.pack(side=tk.LEFT)
             widgets.append(l)
-            
+
             b = ttk.Button(frame, text="B")
             b.pack(side=tk.LEFT, padx=1)
             widgets.append(b)
-            
+
             e = ttk.Entry(frame, width=5)
             e.insert(0, str(i))
             e.pack(side=tk.LEFT, padx=1)
@@ -440,10 +1043,46 @@ class TTKBenchmarkApp:
 
             if i % 50 == 0: # Update UI periodically
                 self.root.update_idletasks()
-        
-        self.root.update_idletasks() # Ensure all widgets are mapped
-        end_time = time.perf_counter()
-        duration = end_time - start_time
+                self.service_events()
+        return widgets
+
+    def test_widget_creation(self):
+        """Tests creation of many miscellaneous ttk widgets in a new window."""
+        num_widget_sets = self.widget_count_var.get()
+        if num_widget_sets <= 0:
+            self.widget_creation_result_var.set("Widget Creation: Invalid number.")
+            return
+
+        self.widget_creation_result_var.set(f"Widget Creation: Creating {num_widget_sets} sets...")
+        self.root.update_idletasks()
+
+        test_windows = []
+
+        def create_widgets():
+            # Only the most recent test window is kept around
+            for old_win in test_windows:
+                old_win.destroy()
+            test_windows.clear()
+
+            test_win = tk.Toplevel(self.root)
+            test_win.title("Bulk Widget Creation Test")
+            test_win.geometry("400x300")
+            test_windows.append(test_win)
+            
+            _, scrollable_frame = self.create_scrollable_frame(test_win)
+            self.root.update_idletasks()
+
+            start_time = time.perf_counter()
+            self.add_widget_sets(scrollable_frame, num_widget_sets)
+            self.root.update_idletasks() # Ensure all widgets are mapped
+            return time.perf_counter() - start_time
+
+        rss_before = self.current_rss_mb()
+        stats = self.measure(create_widgets)
+        if not stats:
+            return
+        fresh_rss_growth = self.current_rss_mb() - rss_before
+        duration = stats['duration']
         
         self.widget_creation_result_var.set(f"Widget Creation: {num_widget_sets*4} widgets in {num_widget_sets} sets created in {duration:.4f}s.")
         
@@ -452,13 +1091,58 @@ class TTKBenchmarkApp:
             'sets': num_widget_sets,
             'widgets': num_widget_sets * 4,
             'duration': duration,
-            'rate': (num_widget_sets * 4) / duration if duration > 0 else 0
+            'rate': (num_widget_sets * 4) / duration if duration > 0 else 0,
+            **stats,
+            'fresh_rss_growth_mb': fresh_rss_growth
         }
-        
-        # Clean up the test window after a delay or on button press
-        # For simplicity, we'll leave it open. User can close it.
-        # Or add a button to close it:
-        # ttk.Button(test_win, text="Close Widget Window", command=test_win.destroy).pack(pady=10)
+
+        if self.settings['memory_accounting']:
+            self.test_results['widgets'].update(self.account_widget_types(num_widget_sets))
+
+        if self.settings['pooled_mode']:
+            pooled = self.measure_widget_pool(num_widget_sets)
+            if pooled:
+                self.test_results['widgets'].update(pooled)
+                self.widget_creation_result_var.set(
+                    f"Widget Creation: {num_widget_sets*4} widgets created in {duration:.4f}s; "
+                    f"pooled acquire {pooled['pooled_acquire_duration']:.4f}s, release {pooled['pooled_release_duration']:.4f}s")
+        
+        # The last test window is left open so the user can inspect it
+        if self.headless:
+            for test_win in test_windows:
+                test_win.destroy()
+
+    def measure_widget_pool(self, num_widget_sets):
+        """Run the widget test against a WidgetSetPool (reconfigure instead of recreate)."""
+        pool_win = tk.Toplevel(self.root)
+        pool_win.title("Pooled Widget Test")
+        pool_win.geometry("400x300")
+
+        def build(parent):
+            frame = ttk.Frame(parent, padding=2)
+            label = ttk.Label(frame)
+            label.pack(side=tk.LEFT)
+            ttk.Button(frame, text="B").pack(side=tk.LEFT, padx=1)
+            entry = ttk.Entry(frame, width=5)
+            entry.pack(side=tk.LEFT, padx=1)
+            check = ttk.Checkbutton(frame, text="C")
+            check.pack(side=tk.LEFT, padx=1)
+            return frame, (label, entry, check)
+
+        def configure(contents, i):
+            label, entry, check = contents
+            label.config(text=f"Set {i+1}:")
+            entry.delete(0, tk.END)
+            entry.insert(0, str(i))
+            check.state(['!selected'])
+
+        from widget_pool import WidgetSetPool
+        pool = WidgetSetPool(pool_win, build, configure, anchor="w")
+        try:
+            return self.measure_pool(pool, num_widget_sets, lambda i: (i,))
+        finally:
+            pool.clear()
+            pool_win.destroy()
 
     def test_memory_usage(self):
         """Test memory allocation and deallocation performance."""
@@ -470,30 +1154,41 @@ class TTKBenchmarkApp:
         self.memory_result_var.set(f"Memory: Testing {memory_mb}MB allocation...")
         self.root.update_idletasks()
 
-        try:
-            start_memory = psutil.Process().memory_info().rss / 1024 / 1024
+        peak_increases = []
+
+        def allocate():
+            start_memory = self.current_rss_mb()
             start_time = time.perf_counter()
             
             # Allocate memory
             data = bytearray(memory_mb * 1024 * 1024)
             alloc_time = time.perf_counter()
             
-            # Write to memory to ensure it's actually allocated
-            for i in range(0, len(data), 1024):
-                data[i] = i % 256
+            # Write to memory to ensure it's actually allocated. One strided slice
+            # assignment touches every 1024th byte without a Python-level loop.
+            memoryview(data)[::1024] = bytes(len(range(0, len(data), 1024)))
             write_time = time.perf_counter()
             
-            peak_memory = psutil.Process().memory_info().rss / 1024 / 1024
+            peak_memory = self.current_rss_mb()
+            peak_increases.append(peak_memory - start_memory)
             
             # Clean up
             del data
             cleanup_time = time.perf_counter()
-            final_memory = psutil.Process().memory_info().rss / 1024 / 1024
-            
-            alloc_duration = alloc_time - start_time
-            write_duration = write_time - alloc_time
-            cleanup_duration = cleanup_time - write_time
-            memory_increase = peak_memory - start_memory
+            return {
+                'alloc_time': alloc_time - start_time,
+                'write_time': write_time - alloc_time,
+                'cleanup_time': cleanup_time - write_time
+            }
+
+        try:
+            stats = self.measure(allocate)
+            if not stats:
+                return
+            alloc_duration = stats['alloc_time']
+            write_duration = stats['write_time']
+            cleanup_duration = stats['cleanup_time']
+            memory_increase = max(peak_increases)
             
             result = f"Memory: {memory_mb}MB - Alloc: {alloc_duration:.4f}s, Write: {write_duration:.4f}s, "
             result += f"Cleanup: {cleanup_duration:.4f}s, Peak: +{memory_increase:.1f}MB"
@@ -501,68 +1196,895 @@ class TTKBenchmarkApp:
             
             self.test_results['memory'] = {
                 'size_mb': memory_mb,
-                'alloc_time': alloc_duration,
-                'write_time': write_duration,
-                'cleanup_time': cleanup_duration,
-                'memory_increase_mb': memory_increase
+                'memory_increase_mb': memory_increase,
+                **stats
             }
             
         except Exception as e:
             self.memory_result_var.set(f"Memory: Error - {str(e)}")
 
-    def run_all_tests(self):
-        """Runs all benchmark tests sequentially."""
-        self.test_treeview_population()
-        if not self.is_running_tests:
+    def test_memory_bandwidth(self):
+        """Measures memory bandwidth (GB/s) and page faults for sequential, strided, random, copy and mmap kernels."""
+        size_mb = self.settings['bandwidth_mb']
+        if size_mb <= 0:
             return
-        self.root.update() # Allow UI to process events & update display
-        
-        self.test_label_progressbar_updates()
-        if not self.is_running_tests:
+
+        from memory_bandwidth import BandwidthBench, KERNELS
+        bench = BandwidthBench(size_mb * 1024 * 1024, random_reads=self.settings['bandwidth_random_reads'])
+        faults = {kernel: [0, 0, 0] for kernel in KERNELS} # minor, major, runs
+        warmup_left = [self.warmup_var.get()]
+
+        def run_kernels():
+            # measure() runs the warmup passes first; their first-touch faults are not counted
+            timed = warmup_left[0] <= 0
+            warmup_left[0] -= 1
+            timings = {}
+            for kernel in KERNELS:
+                seconds, (minor, major) = bench.run(kernel)
+                if timed:
+                    counts = faults[kernel]
+                    counts[0] += minor
+                    counts[1] += major
+                    counts[2] += 1
+                timings[f'{kernel}_time'] = seconds
+            return timings
+
+        try:
+            stats = self.measure(run_kernels)
+        finally:
+            bench.close()
+        if not stats:
             return
-        self.root.update()
-        
-        self.test_window_creation()
-        if not self.is_running_tests:
+
+        result = {'size_mb': bench.size // (1024 * 1024), 'random_reads': bench.random_reads}
+        for kernel in KERNELS:
+            seconds = stats[f'{kernel}_time']
+            result[f'{kernel}_gbps'] = bench.bytes_moved(kernel) / seconds / 1e9 if seconds > 0 else 0
+        for kernel, (minor, major, runs) in faults.items():
+            result[f'{kernel}_minor_faults'] = minor / runs if runs else 0
+            result[f'{kernel}_major_faults'] = major / runs if runs else 0
+        result.update(stats)
+        self.test_results['memory_bandwidth'] = result
+
+    def test_startup_time(self):
+        """Times imports, Tk root creation, app construction and first idle in fresh interpreters, cold and warm."""
+        runs = self.settings['startup_runs']
+        if runs <= 0:
             return
-        self.root.update()
-        
-        self.test_widget_creation()
-        if not self.is_running_tests:
+
+        from startup_bench import run_startup_benchmark
+        result, _ = run_startup_benchmark(runs, cold_runs=self.settings['startup_cold_runs'],
+                                          cancelled=lambda: not self.service_events())
+        if result is not None:
+            self.test_results['startup'] = result
+
+    def time_scroll_steps(self, widget, steps, seed=0, mode='moveto', budget_ns=None, redraw=None):
+        """Scroll a widget step by step, timing each step until redrawn.
+
+        'moveto' jumps to random positions; 'scroll' moves one unit at a
+        time like a mouse wheel, reversing at either end.
+        """
+        rng = random.Random(seed)
+        recorder = LatencyRecorder(steps, budget_ns=budget_ns)
+        redraw = redraw or self.root.update_idletasks
+        direction = 1
+        for _ in range(steps):
+            if not self.service_events():
+                break
+            step_start = recorder.clock()
+            if mode == 'moveto':
+                widget.yview_moveto(rng.random())
+            else:
+                widget.yview_scroll(direction, "units")
+            redraw()
+            recorder.record(recorder.clock() - step_start)
+            if mode == 'scroll':
+                top, bottom = widget.yview()
+                if (direction > 0 and bottom >= 1.0) or (direction < 0 and top <= 0.0):
+                    direction = -direction
+        return recorder
+
+    def test_virtual_treeview(self):
+        """Compares the virtualized treeview against self.tree: memory, population and scroll frame time."""
+        num_rows = self.settings['virtual_tree_rows']
+        steps = self.settings['scroll_steps']
+        if num_rows <= 0:
             return
-        self.root.update()
-        
-        self.test_memory_usage()
-        self.root.update()
-        self.test_memory_usage()
-        self.root.update()
-        messagebox.showinfo("Benchmark Tests", "All tests completed.")
+
+        rows = [(f"Item {i+1}", f"Data {random.randint(0, 1000)}") for i in range(num_rows)]
+        import psutil
+        process = psutil.Process()
+        memory_deltas = {}
+
+        # Real Tcl items in the main window's treeview
+        def populate_real():
+            self.clear_treeview()
+            self.root.update_idletasks()
+            rss_before = process.memory_info().rss
+            start_time = time.perf_counter()
+            for row in rows:
+                if not self.service_events():
+                    break
+                self.tree.insert("", "end", values=row)
+            self.root.update_idletasks()
+            duration = time.perf_counter() - start_time
+            # Freed Tcl memory is reused by later runs, so keep the largest growth seen
+            delta = (process.memory_info().rss - rss_before) / 1024 / 1024
+            memory_deltas['real'] = max(memory_deltas.get('real', 0), delta)
+            return {'real_populate_time': duration}
+
+        real_stats = self.measure(populate_real)
+        if not real_stats:
+            return
+        real_scroll = self.time_scroll_steps(self.tree, steps).to_dict()
+
+        # Virtualized view of the same rows, same visible height
+        test_win = tk.Toplevel(self.root)
+        test_win.title("Virtual Treeview Test")
+        virtual_tree = VirtualTreeview(test_win, columns=("col1", "col2"), height=int(self.tree.cget("height")))
+        virtual_tree.tree.heading("col1", text="Item")
+        virtual_tree.tree.heading("col2", text="Value")
+        virtual_tree.pack(fill=tk.BOTH, expand=True)
+        self.root.update_idletasks()
+
+        def populate_virtual():
+            virtual_tree.set_data([])
+            self.root.update_idletasks()
+            rss_before = process.memory_info().rss
+            start_time = time.perf_counter()
+            virtual_tree.set_data(rows)
+            self.root.update_idletasks()
+            duration = time.perf_counter() - start_time
+            # Freed Tcl memory is reused by later runs, so keep the largest growth seen
+            delta = (process.memory_info().rss - rss_before) / 1024 / 1024
+            memory_deltas['virtual'] = max(memory_deltas.get('virtual', 0), delta)
+            return {'virtual_populate_time': duration}
+
+        virtual_stats = self.measure(populate_virtual)
+        virtual_scroll = self.time_scroll_steps(virtual_tree, steps).to_dict()
+        test_win.destroy()
+
+        real_time = real_stats['real_populate_time']
+        virtual_time = virtual_stats.get('virtual_populate_time', 0)
+        self.test_results['virtual_treeview'] = {
+            'rows': num_rows,
+            'real_populate_time': real_time,
+            'virtual_populate_time': virtual_time,
+            'populate_speedup': real_time / virtual_time if virtual_time > 0 else 0,
+            'real_memory_mb': memory_deltas.get('real', 0),
+            'virtual_memory_mb': memory_deltas.get('virtual', 0),
+            'real_scroll_p50_ms': real_scroll['p50_us'] / 1000,
+            'real_scroll_p99_ms': real_scroll['p99_us'] / 1000,
+            'virtual_scroll_p50_ms': virtual_scroll['p50_us'] / 1000,
+            'virtual_scroll_p99_ms': virtual_scroll['p99_us'] / 1000,
+            'tcl_items_real': num_rows,
+            'tcl_items_virtual': len(virtual_tree.pool),
+            **real_stats,
+            **virtual_stats,
+            'real_scroll_histogram': real_scroll,
+            'virtual_scroll_histogram': virtual_scroll
+        }
+
+    def time_treeview_load(self, load):
+        """Median time to clear self.tree and run load() until the tree is redrawn."""
+        def sample():
+            self.clear_treeview()
+            self.root.update_idletasks()
+            start_time = time.perf_counter()
+            load()
+            self.root.update_idletasks()
+            return time.perf_counter() - start_time
+
+        return self.measure(sample).get('duration')
+
+    def test_treeview_bulk_insert(self):
+        """Times batched Tcl-level inserts into self.tree against one insert() call per row."""
+        num_rows = self.settings['bulk_insert_rows']
+        batch_sizes = self.settings['bulk_batch_sizes']
+        if num_rows <= 0:
+            return
+
+        rows = [(f"Item {i+1}", f"Data {random.randint(0, 1000)}") for i in range(num_rows)]
+
+        def per_row():
+            for row in rows:
+                self.tree.insert("", "end", values=row)
+
+        baseline = self.time_treeview_load(per_row)
+        if not baseline:
+            return
+        results = {
+            'rows': num_rows,
+            'per_row_time': baseline,
+            'per_row_rate': num_rows / baseline
+        }
+
+        speedup_curve = []
+        for batch_size in batch_sizes:
+            def batched(batch_size=batch_size):
+                bulk_insert(self.tree, rows, batch_size)
+
+            def chunked(batch_size=batch_size):
+                # One batch per after() callback; run the event loop until the last batch lands
+                done = tk.BooleanVar(self.root, value=False)
+                bulk_insert_chunked(self.tree, rows, batch_size, on_done=lambda ids: done.set(True))
+                self.root.wait_variable(done)
+
+            batch_time = self.time_treeview_load(batched)
+            chunked_time = self.time_treeview_load(chunked)
+            if not batch_time or not chunked_time:
+                break
+            results[f'batch_{batch_size}_time'] = batch_time
+            results[f'batch_{batch_size}_speedup'] = baseline / batch_time
+            results[f'chunked_{batch_size}_time'] = chunked_time
+            results[f'chunked_{batch_size}_speedup'] = baseline / chunked_time
+            speedup_curve.append([batch_size, baseline / batch_time, baseline / chunked_time])
+
+        if speedup_curve:
+            results['best_batch_size'] = max(speedup_curve, key=lambda p: p[1])[0]
+            results['best_chunked_batch_size'] = max(speedup_curve, key=lambda p: p[2])[0]
+        results['speedup_curve'] = speedup_curve
+        self.test_results['bulk_insert'] = results
+
+    def test_treeview_clear(self):
+        """Times each treeview clear strategy, and reloading afterwards, at several tree sizes."""
+        sizes = self.settings['clear_sizes']
+        results = {'sizes': list(sizes)}
+        totals = {}
+
+        for size in sizes:
+            rows = [(f"Item {i+1}", f"Data {i % 1000}") for i in range(size)]
+            for strategy in TREEVIEW_CLEAR_STRATEGIES:
+                if strategy == 'loop' and size > LOOP_CLEAR_MAX_ROWS:
+                    continue # One delete() per item takes minutes at this size
+
+                def clear_and_reload(strategy=strategy):
+                    self.clear_treeview('delete_all')
+                    bulk_insert(self.tree, rows)
+                    self.root.update_idletasks()
+
+                    start_time = time.perf_counter()
+                    self.clear_treeview(strategy, reuse=True)
+                    self.root.update_idletasks()
+                    clear_time = time.perf_counter() - start_time
+
+                    start_time = time.perf_counter()
+                    self.reload_treeview(rows)
+                    self.root.update_idletasks()
+                    return {
+                        'clear_time': clear_time,
+                        'reload_time': time.perf_counter() - start_time
+                    }
+
+                stats = self.measure(clear_and_reload)
+                if not stats:
+                    self.clear_treeview('delete_all')
+                    return
+                results[f'{strategy}_{size}_clear_time'] = stats['clear_time']
+                results[f'{strategy}_{size}_reload_time'] = stats['reload_time']
+                # Detaching defers the work to the reload, so rank on the whole cycle
+                totals.setdefault(strategy, {})[size] = stats['clear_time'] + stats['reload_time']
+
+            measured = {s: t[size] for s, t in totals.items() if size in t}
+            results[f'fastest_clear_{size}'] = min(measured, key=measured.get)
+
+        # Rank on the sizes every strategy completed so skipped runs don't skew the result
+        complete = [s for s in totals if len(totals[s]) == len(sizes)]
+        if complete:
+            results['fastest_strategy'] = min(complete, key=lambda s: sum(totals[s].values()))
+
+        self.clear_treeview('delete_all')
+        self.test_results['treeview_clear'] = results
+        results['default_strategy'] = self.clear_strategy()
+
+    def create_theme_widgets(self, parent, count, columns=20):
+        """Grid count widgets cycling through THEME_WIDGET_KINDS. Returns [(widget, option)]."""
+        widgets = []
+        for i in range(count):
+            widget_class, option = THEME_WIDGET_KINDS[i % len(THEME_WIDGET_KINDS)]
+            widget = widget_class(parent)
+            if option == 'text':
+                widget.configure(text=f"W{i}")
+            widget.grid(row=i // columns, column=i % columns)
+            widgets.append((widget, option))
+        return widgets
+
+    def update_theme_widgets(self, widgets, rounds=5):
+        """Reconfigure every widget rounds times, as a live screen refreshing its values."""
+        for round_number in range(rounds):
+            for widget, option in widgets:
+                if option == 'text':
+                    widget.configure(text=f"R{round_number}")
+                elif option == 'width':
+                    widget.configure(width=5 + round_number % 2)
+                else:
+                    widget.configure(value=round_number * 10)
+        return rounds * len(widgets)
+
+    def test_theme_switch(self):
+        """Times theme_use for every theme with 100/1k/10k live widgets, plus per-theme creation and update throughput."""
+        counts = self.settings['theme_widget_counts']
+        throughput_widgets = self.settings['theme_throughput_widgets']
+        themes = list(self.style.theme_names())
+        original_theme = self.style.theme_use()
+        results = {'themes': themes, 'widget_counts': list(counts)}
+        switch_totals = {}
+
+        test_win = tk.Toplevel(self.root)
+        test_win.title("Theme Switch Test")
+        test_win.geometry("800x600")
+        try:
+            for count in counts:
+                frame = ttk.Frame(test_win)
+                frame.pack(fill=tk.BOTH, expand=True)
+                self.create_theme_widgets(frame, count)
+                self.root.update_idletasks()
+
+                for index, theme in enumerate(themes):
+                    # Switch away first so every timed switch really changes theme
+                    previous = themes[index - 1] if len(themes) > 1 else theme
+
+                    def switch(theme=theme, previous=previous):
+                        self.style_cache.theme_use(previous)
+                        self.root.update_idletasks()
+                        start_time = time.perf_counter()
+                        self.style_cache.theme_use(theme)
+                        switched = time.perf_counter()
+                        self.root.update_idletasks()
+                        return {
+                            'switch_time': switched - start_time,
+                            'relayout_time': time.perf_counter() - switched
+                        }
+
+                    stats = self.measure(switch)
+                    if not stats:
+                        return
+                    results[f'{theme}_{count}_switch_time'] = stats['switch_time']
+                    results[f'{theme}_{count}_relayout_time'] = stats['relayout_time']
+                    switch_totals.setdefault(count, {})[theme] = stats['switch_time'] + stats['relayout_time']
+
+                frame.destroy()
+                self.root.update_idletasks()
+
+            creation_rates = {}
+            for theme in themes:
+                self.style_cache.theme_use(theme)
+
+                def create_and_update():
+                    frame = ttk.Frame(test_win)
+                    frame.pack(fill=tk.BOTH, expand=True)
+                    start_time = time.perf_counter()
+                    widgets = self.create_theme_widgets(frame, throughput_widgets)
+                    self.root.update_idletasks()
+                    created = time.perf_counter()
+                    updates = self.update_theme_widgets(widgets)
+                    self.root.update_idletasks()
+                    updated = time.perf_counter()
+                    frame.destroy()
+                    # Update time is per pass over every widget, so both rates are widgets/s
+                    return {
+                        'create_time': created - start_time,
+                        'update_time': (updated - created) / updates * throughput_widgets
+                    }
+
+                stats = self.measure(create_and_update)
+                if not stats:
+                    return
+                create_time = stats['create_time']
+                update_time = stats['update_time']
+                results[f'{theme}_create_rate'] = throughput_widgets / create_time if create_time > 0 else 0
+                results[f'{theme}_update_rate'] = throughput_widgets / update_time if update_time > 0 else 0
+                creation_rates[theme] = results[f'{theme}_create_rate']
+        finally:
+            self.style_cache.theme_use(original_theme)
+            test_win.destroy()
+
+        # Widget-heavy screens care most about the largest count
+        if switch_totals:
+            largest = switch_totals[max(switch_totals)]
+            results['cheapest_switch_theme'] = min(largest, key=largest.get)
+        if creation_rates:
+            results['fastest_create_theme'] = max(creation_rates, key=creation_rates.get)
+        results['throughput_widgets'] = throughput_widgets
+        self.test_results['theme_switch'] = results
+
+    def test_style_scaling(self):
+        """Times Style.configure/map/lookup for N custom styles, widget creation as styles accumulate, and StyleCache."""
+        counts = self.settings['style_counts']
+        widget_count = self.settings['style_widgets']
+        colors = ("black", "navy", "darkgreen", "maroon")
+        results = {'style_counts': list(counts), 'widgets': widget_count}
+        # ttk styles cannot be deleted, so every run defines fresh names and the total only grows
+        created = {'runs': 0, 'styles': 0}
+        latest_names = []
+
+        test_win = tk.Toplevel(self.root)
+        test_win.title("Style Scaling Test")
+        test_win.geometry("600x400")
+
+        def create_buttons(names):
+            frame = ttk.Frame(test_win)
+            frame.pack(fill=tk.BOTH, expand=True)
+            start_time = time.perf_counter()
+            for i in range(widget_count):
+                ttk.Button(frame, text=f"B{i}", style=names[i % len(names)]).grid(row=i // 20, column=i % 20)
+            self.root.update_idletasks()
+            elapsed = time.perf_counter() - start_time
+            frame.destroy()
+            return elapsed
+
+        try:
+            stats = self.measure(lambda: create_buttons(["TButton"]))
+            if not stats:
+                return
+            results['baseline_create_rate'] = widget_count / stats['duration'] if stats['duration'] > 0 else 0
+
+            for count in counts:
+                def style_operations(count=count):
+                    created['runs'] += 1
+                    names = [f"Bench{created['runs']}_{i}.TButton" for i in range(count)]
+                    start_time = time.perf_counter()
+                    for i, name in enumerate(names):
+                        self.style.configure(name, padding=i % 8, foreground=colors[i % len(colors)])
+                    configured = time.perf_counter()
+                    for name in names:
+                        self.style.map(name, foreground=[('active', 'blue'), ('disabled', 'gray')])
+                    mapped = time.perf_counter()
+                    for name in names:
+                        self.style.lookup(name, 'foreground')
+                    looked_up = time.perf_counter()
+                    created['styles'] += count
+                    latest_names[:] = names
+                    return {
+                        'configure_time': configured - start_time,
+                        'map_time': mapped - configured,
+                        'lookup_time': looked_up - mapped
+                    }
+
+                stats = self.measure(style_operations)
+                if not stats:
+                    return
+                for operation in ('configure', 'map', 'lookup'):
+                    seconds = stats[f'{operation}_time']
+                    results[f'{operation}_{count}_rate'] = count / seconds if seconds > 0 else 0
+
+                stats = self.measure(lambda: create_buttons(latest_names))
+                if not stats:
+                    return
+                results[f'create_{count}_rate'] = widget_count / stats['duration'] if stats['duration'] > 0 else 0
+                results[f'defined_styles_{count}'] = created['styles']
+
+            if not latest_names:
+                return
+            names = list(latest_names)
+            options = ('foreground', 'padding')
+            rounds = 5
+
+            def cache_comparison():
+                start_time = time.perf_counter()
+                for _ in range(rounds):
+                    for name in names:
+                        for option in options:
+                            self.style.lookup(name, option)
+                uncached_lookup = time.perf_counter() - start_time
+
+                cache = StyleCache(self.style)
+                start_time = time.perf_counter()
+                for _ in range(rounds):
+                    for name in names:
+                        for option in options:
+                            cache.lookup(name, option)
+                cached_lookup = time.perf_counter() - start_time
+
+                # Re-applying unchanged options, as a screen rebuilt from the same style table does
+                for i, name in enumerate(names):
+                    cache.configure(name, padding=i % 8)
+                start_time = time.perf_counter()
+                for i, name in enumerate(names):
+                    self.style.configure(name, padding=i % 8)
+                uncached_configure = time.perf_counter() - start_time
+                start_time = time.perf_counter()
+                for i, name in enumerate(names):
+                    cache.configure(name, padding=i % 8)
+                return {
+                    'uncached_lookup_time': uncached_lookup,
+                    'cached_lookup_time': cached_lookup,
+                    'uncached_configure_time': uncached_configure,
+                    'cached_configure_time': time.perf_counter() - start_time
+                }
+
+            stats = self.measure(cache_comparison)
+            if not stats:
+                return
+            results['cache_styles'] = len(names)
+            results['uncached_lookup_time'] = stats['uncached_lookup_time']
+            results['cached_lookup_time'] = stats['cached_lookup_time']
+            results['uncached_configure_time'] = stats['uncached_configure_time']
+            results['cached_configure_time'] = stats['cached_configure_time']
+            for operation in ('lookup', 'configure'):
+                cached = stats[f'cached_{operation}_time']
+                results[f'cache_{operation}_speedup'] = stats[f'uncached_{operation}_time'] / cached if cached > 0 else 0
+        finally:
+            test_win.destroy()
+
+        self.test_results['style_scaling'] = results
+
+    def lay_out(self, widget, manager, row):
+        """Put widget in row of a single full-width column with the given geometry manager."""
+        if manager == 'pack':
+            widget.pack(side=tk.TOP, fill=tk.X)
+        elif manager == 'grid':
+            widget.grid(row=row, column=0, sticky="ew")
+        else:
+            widget.place(x=0, y=row * PLACE_ROW_HEIGHT, relwidth=1.0, height=PLACE_ROW_HEIGHT)
+
+    def test_geometry_managers(self):
+        """Times initial layout, resize relayout and single add/remove for pack, grid and place at 100-20k widgets."""
+        sizes = self.settings['geometry_sizes']
+        results = {'sizes': list(sizes)}
+
+        test_win = tk.Toplevel(self.root)
+        test_win.title("Geometry Manager Test")
+        test_win.geometry("800x600") # A fixed size keeps the requested size from resizing the window
+        self.root.update_idletasks()
+
+        try:
+            for size in sizes:
+                layout_times = {}
+                for manager, propagate in GEOMETRY_LAYOUTS:
+                    if propagate is None:
+                        name = manager
+                    else:
+                        name = f"{manager}_{'propagate' if propagate else 'fixed'}"
+
+                    def layout_run(manager=manager, propagate=propagate):
+                        test_win.geometry("800x600")
+                        container = ttk.Frame(test_win)
+                        container.pack(fill=tk.BOTH, expand=True)
+                        if manager == 'pack':
+                            container.pack_propagate(propagate)
+                        elif manager == 'grid':
+                            container.grid_propagate(propagate)
+                            container.grid_columnconfigure(0, weight=1)
+                        # Creation is the same for every manager, so only layout is timed
+                        widgets = [ttk.Label(container, text=f"Field {i}") for i in range(size)]
+                        self.root.update_idletasks()
+
+                        start_time = time.perf_counter()
+                        for row, widget in enumerate(widgets):
+                            self.lay_out(widget, manager, row)
+                        self.root.update_idletasks()
+                        laid_out = time.perf_counter()
+
+                        test_win.geometry("1000x700")
+                        self.root.update_idletasks()
+                        resized = time.perf_counter()
+
+                        extra = ttk.Label(container, text="Added")
+                        start_add = time.perf_counter()
+                        self.lay_out(extra, manager, size)
+                        self.root.update_idletasks()
+                        added = time.perf_counter()
+
+                        # Removing the first widget makes pack shift every other slave up
+                        getattr(widgets[0], f"{manager}_forget")()
+                        self.root.update_idletasks()
+                        removed = time.perf_counter()
+
+                        container.destroy()
+                        return {
+                            'layout_time': laid_out - start_time,
+                            'resize_time': resized - laid_out,
+                            'add_time': added - start_add,
+                            'remove_time': removed - added
+                        }
+
+                    stats = self.measure(layout_run)
+                    if not stats:
+                        return
+                    for metric in ('layout_time', 'resize_time', 'add_time', 'remove_time'):
+                        results[f'{name}_{size}_{metric}'] = stats[metric]
+                    layout_times[name] = stats['layout_time']
+
+                results[f'fastest_layout_{size}'] = min(layout_times, key=layout_times.get)
+        finally:
+            test_win.destroy()
+
+        self.test_results['geometry'] = results
+
+    def test_canvas_items(self):
+        """Times Canvas create/move/delete and per-item, tag and batched coordinate updates, plus animation frames."""
+        counts = self.settings['canvas_item_counts']
+        batch_size = max(1, self.settings['canvas_batch_size'])
+        frames = self.settings['canvas_frames']
+        frame_budget_ms = 1000.0 / self.settings['update_fps']
+        rng = random.Random(0)
+        results = {'item_counts': list(counts), 'batch_size': batch_size, 'animation_frames': frames}
+
+        test_win = tk.Toplevel(self.root)
+        test_win.title("Canvas Item Test")
+        canvas = tk.Canvas(test_win, width=800, height=600, background="white")
+        canvas.pack(fill=tk.BOTH, expand=True)
+        self.root.update_idletasks()
+
+        def set_coords_batched(ids, boxes):
+            for start in range(0, len(ids), batch_size):
+                coords_batch(canvas, ids[start:start + batch_size], boxes[start:start + batch_size])
+
+        def create_batched(boxes):
+            ids = []
+            for start in range(0, len(boxes), batch_size):
+                ids.extend(create_batch(canvas, "rectangle", boxes[start:start + batch_size], tags=("bench",)))
+            return ids
+
+        try:
+            for count in counts:
+                boxes = []
+                for _ in range(count):
+                    x, y = rng.randrange(796), rng.randrange(596)
+                    boxes.append((x, y, x + 4, y + 4))
+                shifted = [(x0 + 2, y0 + 1, x1 + 2, y1 + 1) for x0, y0, x1, y1 in boxes]
+
+                def item_operations():
+                    timings = {}
+
+                    def timed(name, operation):
+                        start_time = time.perf_counter()
+                        value = operation()
+                        self.root.update_idletasks()
+                        timings[f'{name}_time'] = time.perf_counter() - start_time
+                        return value
+
+                    ids = timed('create', lambda: [canvas.create_rectangle(*box, tags=("bench",)) for box in boxes])
+                    timed('move_item', lambda: [canvas.move(item, 1, 0) for item in ids])
+                    timed('move_tag', lambda: canvas.move("bench", 1, 0))
+                    timed('coords_item', lambda: [canvas.coords(item, *box) for item, box in zip(ids, shifted)])
+                    timed('coords_batch', lambda: set_coords_batched(ids, boxes))
+                    timed('delete', lambda: canvas.delete("bench"))
+                    timed('create_batch', lambda: create_batched(boxes))
+                    canvas.delete("bench")
+                    self.root.update_idletasks()
+                    return timings
+
+                stats = self.measure(item_operations)
+                if not stats:
+                    return
+                for operation in CANVAS_OPERATIONS:
+                    seconds = stats[f'{operation}_time']
+                    results[f'{operation}_{count}_rate'] = count / seconds if seconds > 0 else 0
+
+                # Continuous animation: every item gets new coordinates each frame, then the canvas redraws
+                ids = create_batched(boxes)
+                self.root.update_idletasks()
+                histogram = LatencyHistogram()
+                dropped = 0
+                positions = (shifted, boxes)
+                for frame in range(frames):
+                    if not self.service_events():
+                        break
+                    start_ns = time.perf_counter_ns()
+                    set_coords_batched(ids, positions[frame % 2])
+                    self.root.update_idletasks()
+                    elapsed_ns = time.perf_counter_ns() - start_ns
+                    histogram.record(elapsed_ns)
+                    if elapsed_ns / 1e6 > frame_budget_ms:
+                        dropped += 1
+                canvas.delete("bench")
+                self.root.update_idletasks()
+                results.update(histogram.summary_ms(f'animation_{count}_frame'))
+                results[f'animation_{count}_dropped_frames'] = dropped
+        finally:
+            test_win.destroy()
+
+        self.test_results['canvas'] = results
+
+    def test_text_document(self):
+        """Times line vs bulk Text inserts, capped appends, tagging many ranges and search over a multi-MB log."""
+        size_mb = self.settings['text_document_mb']
+        line_cap = self.settings['text_line_cap']
+        tag_ranges = self.settings['text_tag_ranges']
+        if size_mb <= 0:
+            return
+
+        lines = []
+        size = 0
+        while size < size_mb * 1024 * 1024:
+            number = len(lines)
+            line = f"{number:08d} INFO worker-{number % 8} handled request {number * 7919 % 1000003} in {number % 97} ms\n"
+            lines.append(line)
+            size += len(line)
+        lines.append("ERROR needle-final\n") # Found only after scanning the whole document
+        document = "".join(lines)
+        document_mb = len(document) / 1024 / 1024
+        chunks = ["".join(lines[i:i + TEXT_APPEND_LINES]) for i in range(0, len(lines), TEXT_APPEND_LINES)]
+        step = max(1, len(lines) // max(1, tag_ranges))
+        tag_lines = list(range(1, len(lines) + 1, step))[:tag_ranges]
+        tag_indices = []
+        for number in tag_lines:
+            tag_indices.extend((f"{number}.0", f"{number}.8"))
+        # Freed Tcl memory is reused by later runs, so keep the largest growth seen
+        growth = {}
+
+        test_win = tk.Toplevel(self.root)
+        test_win.title("Text Document Test")
+        test_win.geometry("700x400")
+
+        def new_text():
+            text = tk.Text(test_win, wrap=tk.NONE, undo=False)
+            text.pack(fill=tk.BOTH, expand=True)
+            self.root.update_idletasks()
+            return text
+
+        def timed_fill(name, text, fill):
+            rss_before = self.current_rss_mb()
+            start_time = time.perf_counter()
+            fill()
+            self.root.update_idletasks()
+            elapsed = time.perf_counter() - start_time
+            growth[name] = max(growth.get(name, 0), self.current_rss_mb() - rss_before)
+            return elapsed
+
+        def append_capped(text):
+            for chunk in chunks:
+                text.insert("end", chunk)
+                excess = int(text.index("end-1c").split(".")[0]) - line_cap
+                if excess > 0:
+                    text.delete("1.0", f"{excess + 1}.0")
+
+        def text_operations():
+            timings = {}
+            text = new_text()
+            timings['line_insert_time'] = timed_fill('line_insert', text, lambda: [text.insert("end", line) for line in lines])
+            text.destroy()
+
+            text = new_text()
+            timings['bulk_insert_time'] = timed_fill('bulk_insert', text, lambda: text.insert("end", document))
+
+            start_time = time.perf_counter()
+            for number in tag_lines:
+                text.tag_add("hit", f"{number}.0", f"{number}.8")
+            self.root.update_idletasks()
+            timings['tag_time'] = time.perf_counter() - start_time
+            text.tag_remove("hit", "1.0", "end")
+
+            # tag_add takes any number of index pairs, so one call tags every range
+            start_time = time.perf_counter()
+            text.tag_add("hit", *tag_indices)
+            self.root.update_idletasks()
+            timings['tag_batch_time'] = time.perf_counter() - start_time
+
+            start_time = time.perf_counter()
+            text.search("needle-final", "1.0", stopindex="end")
+            timings['search_time'] = time.perf_counter() - start_time
+            start_time = time.perf_counter()
+            text.search(r"ERROR needle-\w+", "1.0", stopindex="end", regexp=True)
+            timings['search_regexp_time'] = time.perf_counter() - start_time
+            text.destroy()
+
+            text = new_text()
+            timings['capped_append_time'] = timed_fill('capped_append', text, lambda: append_capped(text))
+            text.destroy()
+            return timings
+
+        try:
+            stats = self.measure(text_operations)
+        finally:
+            test_win.destroy()
+        if not stats:
+            return
+
+        result = {'document_mb': document_mb, 'lines': len(lines), 'line_cap': line_cap, 'tag_ranges': len(tag_lines)}
+        for operation in ('line_insert', 'bulk_insert', 'capped_append', 'search', 'search_regexp'):
+            seconds = stats[f'{operation}_time']
+            result[f'{operation}_mbps'] = document_mb / seconds if seconds > 0 else 0
+        for operation in ('tag', 'tag_batch'):
+            seconds = stats[f'{operation}_time']
+            result[f'{operation}_rate'] = len(tag_lines) / seconds if seconds > 0 else 0
+        for name, delta in growth.items():
+            result[f'{name}_memory_mb'] = delta
+        result.update(stats)
+        self.test_results['text'] = result
+
+    def test_scrolling(self):
+        """Per-step frame time of yview_moveto/yview_scroll over a populated self.tree and the widget test's scrollable frame."""
+        num_rows = self.settings['scroll_tree_rows']
+        steps = self.settings['scroll_steps']
+        num_widget_sets = self.widget_count_var.get()
+        budget_ns = int(1e9 / self.settings['update_fps'])
+        result = {'tree_rows': num_rows, 'widget_sets': num_widget_sets, 'steps': steps, 'frame_budget_ms': budget_ns / 1e6}
+
+        def record(target, mode, recorder):
+            result.update(recorder.histogram.summary_ms(f'{target}_{mode}_frame'))
+            result[f'{target}_{mode}_dropped_frames'] = recorder.over_budget
+            result[f'{target}_{mode}_histogram'] = recorder.to_dict()
+
+        if num_rows > 0:
+            self.clear_treeview('delete_all')
+            bulk_insert(self.tree, [(f"Item {i+1}", f"Data {i % 1000}") for i in range(num_rows)])
+            self.root.update_idletasks()
+            for mode in ('moveto', 'scroll'):
+                if not self.is_running_tests:
+                    break
+                self.tree.yview_moveto(0)
+                self.root.update_idletasks()
+                record('tree', mode, self.time_scroll_steps(self.tree, steps, mode=mode, budget_ns=budget_ns))
+            self.clear_treeview('delete_all')
+
+        if num_widget_sets > 0 and self.is_running_tests:
+            test_win = tk.Toplevel(self.root)
+            test_win.title("Scrollable Frame Scroll Test")
+            test_win.geometry("400x300")
+            try:
+                canvas, scrollable_frame = self.create_scrollable_frame(test_win)
+                self.add_widget_sets(scrollable_frame, num_widget_sets)
+                self.root.update()
+                for mode in ('moveto', 'scroll'):
+                    if not self.is_running_tests:
+                        break
+                    canvas.yview_moveto(0)
+                    self.root.update()
+                    # Embedded widgets repaint on Expose events, which update_idletasks() does not process
+                    recorder = self.time_scroll_steps(canvas, steps, mode=mode, budget_ns=budget_ns, redraw=self.root.update)
+                    record('frame', mode, recorder)
+            finally:
+                test_win.destroy()
+
+        self.test_results['scrolling'] = result
+
+    def run_all_tests(self, dispatcher=None):
+        """Runs all benchmark tests sequentially.
+
+        When called from a worker thread, pass the UI dispatcher: each test is
+        then run on the Tk main thread and the worker only sequences them.
+        Returns True if every test ran, False if the run was cancelled.
+        """
+        for _, method_name in BENCHMARK_TESTS:
+            if not self.is_running_tests:
+                return False
+            test_method = getattr(self, method_name)
+            if dispatcher is not None:
+                dispatcher.call(self.run_probed, test_method)
+            else:
+                self.run_probed(test_method)
+                self.root.update() # Allow UI to process events & update display
+        return True
 
     def run_all_tests_threaded(self):
-        """Run all tests in a separate thread to prevent UI blocking."""
+        """Run all tests from a worker thread; tests service GUI input as they run so Cancel works mid-test."""
         if self.is_running_tests:
             return
             
         self.is_running_tests = True
         self.run_all_btn.config(state="disabled")
         self.cancel_btn.config(state="normal")
+        self.dispatcher.start()
         
         def run_tests():
+            completed = False
             try:
-                self.run_all_tests()
-                self.update_performance_summary()
-                if self.auto_save_var.get():
-                    self.auto_save_results()
+                completed = self.run_all_tests(self.dispatcher)
+            except Exception as e:
+                print(f"Test run failed: {e}")
             finally:
-                self.root.after(0, self.tests_completed)
+                self.dispatcher.post(self.finish_test_run, completed)
                 
         self.test_thread = threading.Thread(target=run_tests, daemon=True)
         self.test_thread.start()
 
+    def finish_test_run(self, completed):
+        """Main-thread wrap-up after a threaded test run."""
+        self.update_performance_summary()
+        if self.auto_save_var.get():
+            self.auto_save_results()
+        self.tests_completed()
+        self.dispatcher.stop()
+        if completed and not self.headless:
+            messagebox.showinfo("Benchmark Tests", "All tests completed.")
+
     def cancel_tests(self):
-        """Cancel running tests."""
+        """Cancel running tests; the current test stops at its next check."""
         self.is_running_tests = False
-        self.tests_completed()
+        self.cancel_btn.config(state="disabled")
 
     def tests_completed(self):
         """Called when tests are completed or cancelled."""
@@ -570,6 +2092,83 @@ class TTKBenchmarkApp:
         self.run_all_btn.config(state="normal")
         self.cancel_btn.config(state="disabled")
 
+    def run_extended_test(self, test_key, method_name):
+        """Run an extended benchmark from the menu and show its report."""
+        previous = self.test_results.get(test_key)
+        if not self.run_single_test(getattr(self, method_name)):
+            return
+        # A cancelled run leaves the earlier result in place; don't present it as new
+        result = self.test_results.get(test_key)
+        if result is not None and result is not previous:
+            self.update_performance_summary()
+            self.show_test_report(test_key)
+
+    def format_pooled(self, result):
+        """Summary lines for a test's pooled mode, if it ran."""
+        if 'pooled_total_duration' not in result:
+            return ""
+        return (f"  Pooled: acquire {result['pooled_acquire_duration']:.4f}s, release {result['pooled_release_duration']:.4f}s\n"
+                f"  Per op: acquire p99 {result['pooled_acquire_p99_ms']:.3f}ms, release p99 {result['pooled_release_p99_ms']:.3f}ms\n"
+                f"  RSS growth: fresh {result['fresh_rss_growth_mb']:.1f}MB, pooled {result['pooled_rss_growth_mb']:.1f}MB\n")
+
+    def format_memory_costs(self, result):
+        """Summary lines for memory accounting results, if present."""
+        lines = ""
+        costs = [(k, v) for k, v in result.items() if '_bytes_per_' in k]
+        if costs:
+            lines += "  Memory: " + ", ".join(f"{k.replace('_bytes_per_', ' B/')} {v:.0f}" for k, v in costs) + "\n"
+        for name, type_costs in result.get('memory_per_widget_type', {}).items():
+            lines += f"  {name}: " + ", ".join(f"{k.replace('_bytes_per_', ' B/')} {v:.0f}" for k, v in type_costs.items()) + "\n"
+        return lines
+
+    def headline_metrics(self, result, limit=8):
+        """Return the first scalar metrics of a result, skipping repetition statistics."""
+        suffixes = tuple('_' + key for key in SUMMARY_KEYS)
+        metrics = [(k, v) for k, v in result.items()
+                   if isinstance(v, (int, float)) and not k.endswith(suffixes)]
+        return metrics[:limit]
+
+    def show_test_report(self, test_key):
+        """Show every stored metric of one test in a text window."""
+        result = self.test_results.get(test_key, {})
+        report_window = tk.Toplevel(self.root)
+        report_window.title(f"{EXTENDED_LABELS.get(test_key, test_key.title())} Results")
+        report_window.geometry("600x450")
+
+        text_widget = tk.Text(report_window, wrap=tk.NONE)
+        scrollbar = ttk.Scrollbar(report_window, orient="vertical", command=text_widget.yview)
+        text_widget.configure(yscrollcommand=scrollbar.set)
+
+        def format_value(value, indent):
+            if isinstance(value, dict):
+                return "\n" + "".join(f"{indent}  {k}: {format_value(v, indent + '  ')}\n" for k, v in value.items()).rstrip("\n")
+            if isinstance(value, list):
+                return f"[{len(value)} values]"
+            if isinstance(value, float):
+                return f"{value:.4f}"
+            return str(value)
+
+        report = f"{test_key.upper()} RESULTS\n" + "=" * 50 + "\n\n"
+        for metric, value in result.items():
+            report += f"{metric}: {format_value(value, '')}\n"
+
+        text_widget.insert(tk.END, report)
+        text_widget.config(state="disabled")
+        text_widget.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+    def format_stats(self, result, metric):
+        """Format the repetition statistics and UI lag stored for a metric."""
+        text = ""
+        if f"{metric}_ci_low" in result:
+            text += (f"  Median of {result.get('repetitions', 1)} runs, p90 {result[metric + '_p90']:.4f}s, "
+                     f"stddev {result[metric + '_stddev']:.4f}s, "
+                     f"95% CI [{result[metric + '_ci_low']:.4f}, {result[metric + '_ci_high']:.4f}]\n")
+        if 'ui_lag_p99_ms' in result:
+            text += (f"  UI lag p50 {result['ui_lag_p50_ms']:.1f}ms, p99 {result['ui_lag_p99_ms']:.1f}ms; "
+                     f"input lag p99 {result['input_lag_p99_ms']:.1f}ms\n")
+        return text
+
     def update_performance_summary(self):
         """Update the performance summary text widget."""
         self.summary_text.delete(1.0, tk.END)
@@ -585,31 +2184,47 @@ class TTKBenchmarkApp:
         for test_name, result in self.test_results.items():
             if test_name == 'treeview' and 'duration' in result:
                 summary += f"Treeview Population: {result['items']} items in {result['duration']:.4f}s\n"
-                summary += f"  Rate: {result['items']/result['duration']:.0f} items/second\n\n"
+                summary += f"  Rate: {result['items']/result['duration']:.0f} items/second\n"
+                summary += self.format_stats(result, 'duration') + "\n"
+                summary += self.format_memory_costs(result)
                 total_time += result['duration']
                 
             elif test_name == 'label_updates' and 'duration' in result:
                 summary += f"Label/Progress Updates: {result['updates']} in {result['duration']:.4f}s\n"
-                summary += f"  Rate: {result['updates']/result['duration']:.0f} updates/second\n\n"
+                summary += f"  Rate: {result['updates']/result['duration']:.0f} updates/second\n"
+                summary += self.format_stats(result, 'duration') + "\n"
                 total_time += result['duration']
                 
             elif test_name == 'windows' and 'total_duration' in result:
                 summary += f"Window Management: {result['count']} windows\n"
                 summary += f"  Creation: {result['creation_duration']:.4f}s\n"
                 summary += f"  Destruction: {result['destroy_duration']:.4f}s\n"
-                summary += f"  Total: {result['total_duration']:.4f}s\n\n"
+                summary += f"  Total: {result['total_duration']:.4f}s\n"
+                summary += self.format_stats(result, 'total_duration') + "\n"
+                summary += self.format_pooled(result)
+                summary += self.format_memory_costs(result)
                 total_time += result['total_duration']
                 
             elif test_name == 'widgets' and 'duration' in result:
                 summary += f"Widget Creation: {result['widgets']} widgets in {result['duration']:.4f}s\n"
-                summary += f"  Rate: {result['widgets']/result['duration']:.0f} widgets/second\n\n"
+                summary += f"  Rate: {result['widgets']/result['duration']:.0f} widgets/second\n"
+                summary += self.format_stats(result, 'duration') + "\n"
+                summary += self.format_pooled(result)
+                summary += self.format_memory_costs(result)
                 total_time += result['duration']
                 
             elif test_name == 'memory' and 'alloc_time' in result:
                 summary += f"Memory Test: {result['size_mb']}MB\n"
                 summary += f"  Allocation: {result['alloc_time']:.4f}s\n"
                 summary += f"  Write: {result['write_time']:.4f}s\n"
-                summary += f"  Cleanup: {result['cleanup_time']:.4f}s\n\n"
+                summary += f"  Cleanup: {result['cleanup_time']:.4f}s\n"
+                summary += self.format_stats(result, 'write_time') + "\n"
+
+            elif test_name in EXTENDED_LABELS:
+                summary += f"{EXTENDED_LABELS[test_name]}:\n"
+                for metric, value in self.headline_metrics(result):
+                    summary += f"  {metric}: {value:.4f}\n" if isinstance(value, float) else f"  {metric}: {value}\n"
+                summary += "\n"
         
         if total_time > 0:
             summary += f"Total Test Time: {total_time:.4f} seconds\n"
@@ -617,6 +2232,16 @@ class TTKBenchmarkApp:
         summary += f"\nTest completed at: {time.strftime('%Y-%m-%d %H:%M:%S')}"
         self.summary_text.insert(tk.END, summary)
 
+    def get_save_data(self):
+        """Build the JSON-serializable results payload."""
+        return {
+            'timestamp': time.strftime('%Y-%m-%d %H:%M:%S'),
+            'theme': self.style.theme_use(),
+            'system_info': self.fingerprint.to_dict(),
+            'startup': self.startup.to_dict(),
+            'test_results': self.test_results
+        }
+
     def save_results(self):
         """Save test results to a JSON file."""
         if not self.test_results:
@@ -631,16 +2256,7 @@ class TTKBenchmarkApp:
         
         if filename:
             try:
-                save_data = {
-                    'timestamp': time.strftime('%Y-%m-%d %H:%M:%S'),
-                    'system_info': {
-                        'platform': platform.platform(),
-                        'python_version': platform.python_version(),
-                        'cpu_count': psutil.cpu_count(),
-                        'memory_total_gb': psutil.virtual_memory().total // (1024**3)
-                    },
-                    'test_results': self.test_results
-                }
+                save_data = self.get_save_data()
                 
                 with open(filename, 'w') as f:
                     json.dump(save_data, f, indent=2)
@@ -685,11 +2301,14 @@ class TTKBenchmarkApp:
         if filename:
             try:
                 with open(filename, 'w', newline='') as f:
+                    import csv
                     writer = csv.writer(f)
                     writer.writerow(['Test', 'Metric', 'Value', 'Unit'])
                     
                     for test_name, result in self.test_results.items():
                         for key, value in result.items():
+                            if isinstance(value, (dict, list)):
+                                continue # Histograms and curves are only kept in JSON
                             unit = self.get_unit_for_metric(key)
                             writer.writerow([test_name, key, value, unit])
                 
@@ -699,7 +2318,15 @@ class TTKBenchmarkApp:
 
     def get_unit_for_metric(self, metric):
         """Get the appropriate unit for a metric."""
-        if 'time' in metric or 'duration' in metric:
+        if metric.endswith('_ms'):
+            return 'ms'
+        elif metric.endswith('_gbps'):
+            return 'GB/s'
+        elif metric.endswith('_mbps'):
+            return 'MB/s'
+        elif 'bytes' in metric:
+            return 'bytes'
+        elif 'time' in metric or 'duration' in metric:
             return 'seconds'
         elif 'count' in metric or 'items' in metric or 'updates' in metric or 'widgets' in metric:
             return 'count'
@@ -708,31 +2335,124 @@ class TTKBenchmarkApp:
         else:
             return ''
 
+    def get_results_store(self):
+        """Open the results history database on first use."""
+        if self.results_store is None:
+            from results_store import ResultsStore
+            self.results_store = ResultsStore(self.settings['results_db'])
+        return self.results_store
+
     def auto_save_results(self):
-        """Automatically save results with timestamp."""
+        """Append the results to the results history database."""
         if not self.test_results:
             return
             
-        timestamp = time.strftime('%Y%m%d_%H%M%S')
-        filename = f"ttk_benchmark_results_{timestamp}.json"
-        
         try:
-            save_data = {
-                'timestamp': time.strftime('%Y-%m-%d %H:%M:%S'),
-                'system_info': {
-                    'platform': platform.platform(),
-                    'python_version': platform.python_version(),
-                    'cpu_count': psutil.cpu_count(),
-                    'memory_total_gb': psutil.virtual_memory().total // (1024**3)
-                },
-                'test_results': self.test_results
-            }
-            
-            with open(filename, 'w') as f:
-                json.dump(save_data, f, indent=2)
+            store = self.get_results_store()
+            store.add_run(self.get_save_data())
+            store.flush()
         except Exception as e:
             print(f"Auto-save failed: {e}")
 
+    def show_history_window(self):
+        """Browse stored runs, plot a metric over time and load or compare runs."""
+        try:
+            store = self.get_results_store()
+            runs = store.runs(limit=500)
+            series_names = [f"{test}.{metric}" for test, metric in store.tests()]
+        except Exception as e:
+            messagebox.showerror("History Error", f"Could not open results history: {e}")
+            return
+
+        history_window = tk.Toplevel(self.root)
+        history_window.title("Results History")
+        history_window.geometry("750x550")
+
+        columns = ('Time', 'Host', 'Theme')
+        runs_tree = ttk.Treeview(history_window, columns=columns, show='headings', height=8)
+        for col in columns:
+            runs_tree.heading(col, text=col)
+            runs_tree.column(col, width=150)
+        for run in runs:
+            runs_tree.insert('', 'end', iid=str(run['id']), values=(
+                time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(run['timestamp'])),
+                run['host'], run['theme'] or ''))
+        runs_tree.pack(fill=tk.X, padx=10, pady=10)
+
+        trend_frame = ttk.LabelFrame(history_window, text="Trend", padding="5")
+        trend_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+        series_var = tk.StringVar(value=series_names[0] if series_names else "")
+        same_host_var = tk.BooleanVar(value=True)
+        selector = ttk.Frame(trend_frame)
+        selector.pack(fill=tk.X)
+        ttk.Combobox(selector, textvariable=series_var, values=series_names, state="readonly", width=40).pack(side=tk.LEFT)
+        ttk.Checkbutton(selector, text="This host only", variable=same_host_var).pack(side=tk.LEFT, padx=5)
+        trend_canvas = tk.Canvas(trend_frame, background="white")
+        trend_canvas.pack(fill=tk.BOTH, expand=True, pady=5)
+
+        def draw_trend(*_):
+            if not series_var.get():
+                return
+            test, metric = series_var.get().split('.', 1)
+            host = self.fingerprint.fingerprint if same_host_var.get() else None
+            self.draw_trend(trend_canvas, store.time_series(test, metric, host=host), metric)
+
+        series_var.trace_add("write", draw_trend)
+        same_host_var.trace_add("write", draw_trend)
+        trend_canvas.bind("<Configure>", draw_trend)
+
+        def selected_runs():
+            return [store.load_run(int(iid)) for iid in runs_tree.selection()]
+
+        def load_selected():
+            loaded = selected_runs()
+            if loaded:
+                self.test_results = loaded[0]['test_results']
+                self.update_performance_summary()
+                self.update_result_displays()
+
+        def compare_selected():
+            for run in selected_runs():
+                self.comparison_results.append({'timestamp': run['timestamp'], 'results': run['test_results']})
+            self.show_comparison_window()
+
+        button_frame = ttk.Frame(history_window)
+        button_frame.pack(fill=tk.X, padx=10, pady=5)
+        ttk.Button(button_frame, text="Load Selected", command=load_selected).pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="Compare Selected", command=compare_selected).pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="Close", command=history_window.destroy).pack(side=tk.RIGHT, padx=5)
+
+    def draw_trend(self, canvas, series, metric):
+        """Draw a metric's stored values against time onto a canvas."""
+        canvas.delete("all")
+        width = canvas.winfo_width()
+        height = canvas.winfo_height()
+        left, bottom, top = 70, 30, 10
+        if len(series) < 2 or width <= left + 10:
+            canvas.create_text(width // 2, height // 2, text="Not enough stored runs for a trend")
+            return
+
+        times = [t for t, _, _ in series]
+        values = [v for _, v, _ in series]
+        t_min, t_span = times[0], (times[-1] - times[0]) or 1.0
+        v_min, v_max = min(values), max(values)
+        v_span = (v_max - v_min) or 1.0
+        plot_width = width - left - 10
+        plot_height = height - bottom - top
+
+        canvas.create_line(left, top, left, height - bottom)
+        canvas.create_line(left, height - bottom, width - 10, height - bottom)
+        unit = self.get_unit_for_metric(metric)
+        canvas.create_text(left - 5, top, text=f"{v_max:.4g} {unit}", anchor="e")
+        canvas.create_text(left - 5, height - bottom, text=f"{v_min:.4g} {unit}", anchor="e")
+        canvas.create_text(width - 10, height - bottom + 5, anchor="ne", text=f"{len(series)} runs")
+
+        coords = []
+        for t, v in zip(times, values):
+            coords.extend((left + plot_width * (t - t_min) / t_span,
+                           top + plot_height * (1 - (v - v_min) / v_span)))
+        canvas.create_line(*coords, fill="blue")
+
     def reset_all_tests(self):
         """Reset all test results and displays."""
         self.test_results = {}
@@ -779,25 +2499,34 @@ class TTKBenchmarkApp:
         text_widget.configure(yscrollcommand=scrollbar.set)
         
         # Gather system information
+        static = self.fingerprint.static
+        sample = self.fingerprint.sample()
         info = f"SYSTEM INFORMATION\n{'='*50}\n\n"
-        info += f"Platform: {platform.platform()}\n"
-        info += f"System: {platform.system()} {platform.release()}\n"
-        info += f"Architecture: {platform.architecture()[0]}\n"
-        info += f"Processor: {platform.processor()}\n"
-        info += f"Python Version: {platform.python_version()}\n"
-        info += f"Tkinter Version: {self.root.tk.call('info', 'patchlevel')}\n\n"
+        info += f"Platform: {static['platform']}\n"
+        info += f"System: {static['system']} {static['release']}\n"
+        info += f"Architecture: {static['architecture']}\n"
+        info += f"Processor: {static['processor']}\n"
+        info += f"Python Version: {static['python_version']}\n"
+        info += f"Tkinter Version: {static['tk_version']}\n"
+        info += f"Host Fingerprint: {static['fingerprint']}\n\n"
         
         info += f"CPU Information:\n"
-        info += f"  Physical cores: {psutil.cpu_count(logical=False)}\n"
-        info += f"  Total cores: {psutil.cpu_count(logical=True)}\n"
-        info += f"  Current frequency: {psutil.cpu_freq().current:.2f} MHz\n\n"
+        info += f"  Physical cores: {static['physical_cores']}\n"
+        info += f"  Total cores: {static['cpu_count']}\n"
+        if sample['cpu_freq_mhz'] is not None:
+            info += f"  Current frequency: {sample['cpu_freq_mhz']:.2f} MHz\n"
+        info += "\n"
         
-        memory = psutil.virtual_memory()
         info += f"Memory Information:\n"
-        info += f"  Total: {memory.total / (1024**3):.2f} GB\n"
-        info += f"  Available: {memory.available / (1024**3):.2f} GB\n"
-        info += f"  Used: {memory.used / (1024**3):.2f} GB ({memory.percent}%)\n\n"
+        info += f"  Total: {static['memory_total_gb']} GB\n"
+        info += f"  Available: {sample['memory_available_gb']:.2f} GB\n"
+        info += f"  Used: {sample['memory_used_gb']:.2f} GB ({sample['memory_percent']}%)\n\n"
         
+        info += "Startup Phases:\n"
+        for phase, ms in self.startup.phases:
+            info += f"  {phase}: {ms:.1f} ms\n"
+        info += f"  total: {self.startup.elapsed_ms():.1f} ms\n\n"
+
         info += f"Available TTK Themes:\n"
         for theme in self.style.theme_names():
             current = " (current)" if theme == self.style.theme_use() else ""
@@ -809,44 +2538,134 @@ class TTKBenchmarkApp:
         text_widget.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
 
+    def get_sampler(self):
+        """Create the shared background system sampler on first use."""
+        if self.sampler is None:
+            from system_sampler import SystemSampler
+            self.sampler = SystemSampler(interval=self.settings['monitor_interval'],
+                                         capacity=self.settings['monitor_history'])
+        return self.sampler
+
     def show_performance_monitor(self):
-        """Show a real-time performance monitor window."""
+        """Show live sparklines fed by the background system sampler."""
+        import psutil
+        from system_sampler import Sparkline
+        sampler = self.get_sampler()
+        cores = min(sampler.cores, MONITOR_MAX_CORES)
+        series = [(f'cpu{core}', f"CPU {core}", "{:.0f}%", 100) for core in range(cores)]
+        series += [
+            ('rss_mb', "RSS", "{:.1f} MB", None),
+            ('ctx_switches_per_s', "Ctx switches", "{:.0f}/s", None),
+            ('gc_gen0', "GC gen 0", "{:.0f}", None),
+            ('gc_gen1', "GC gen 1", "{:.0f}", None),
+            ('gc_gen2', "GC gen 2", "{:.0f}", None)
+        ]
+        row_height, spark_width = 24, 220
+
         monitor_window = tk.Toplevel(self.root)
         monitor_window.title("Performance Monitor")
-        monitor_window.geometry("400x300")
-        
-        # CPU and Memory monitoring labels
-        cpu_var = tk.StringVar()
-        memory_var = tk.StringVar()
-        
+        monitor_window.geometry(f"420x{len(series) * row_height + 110}")
+
         ttk.Label(monitor_window, text="Real-time System Monitor", font=('TkDefaultFont', 12, 'bold')).pack(pady=10)
-        ttk.Label(monitor_window, textvariable=cpu_var).pack(pady=5)
-        ttk.Label(monitor_window, textvariable=memory_var).pack(pady=5)
-        
-        # Progress bars for visual representation
-        cpu_progress = ttk.Progressbar(monitor_window, length=300, mode='determinate')
-        cpu_progress.pack(pady=5)
-        
-        memory_progress = ttk.Progressbar(monitor_window, length=300, mode='determinate')
-        memory_progress.pack(pady=5)
-        
-        def update_monitor():
-            if monitor_window.winfo_exists():
-                try:
-                    cpu_percent = psutil.cpu_percent(interval=0.1)
-                    memory = psutil.virtual_memory()
-                    
-                    cpu_var.set(f"CPU Usage: {cpu_percent:.1f}%")
-                    memory_var.set(f"Memory Usage: {memory.percent:.1f}% ({memory.used / (1024**3):.1f} GB / {memory.total / (1024**3):.1f} GB)")
-                    
-                    cpu_progress['value'] = cpu_percent
-                    memory_progress['value'] = memory.percent
-                    
-                    monitor_window.after(1000, update_monitor)
-                except:
-                    pass
-        
-        update_monitor()
+        memory_var = tk.StringVar()
+        overhead_var = tk.StringVar()
+        ttk.Label(monitor_window, textvariable=memory_var).pack()
+        ttk.Label(monitor_window, textvariable=overhead_var).pack()
+
+        canvas = tk.Canvas(monitor_window, background="white", height=len(series) * row_height + 10)
+        canvas.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+        sparklines = [
+            (name, Sparkline(canvas, label, 5 + i * row_height, row_height - 6, spark_width,
+                             value_format=value_format, fixed_max=fixed_max))
+            for i, (name, label, value_format, fixed_max) in enumerate(series)
+        ]
+
+        last_version = [-1]
+
+        def redraw():
+            if not monitor_window.winfo_exists():
+                return
+            # Only redraw when the sampler has produced something new
+            if sampler.version != last_version[0]:
+                last_version[0] = sampler.version
+                snapshot = sampler.snapshot()
+                for name, sparkline in sparklines:
+                    sparkline.update(snapshot[name], sampler.capacity)
+                memory = psutil.virtual_memory()
+                memory_var.set(f"Memory Usage: {memory.percent:.1f}% ({memory.used / (1024**3):.1f} GB / {memory.total / (1024**3):.1f} GB)")
+                overhead_var.set(f"Sampler overhead: {sampler.overhead_pct():.2f}% of one core")
+            monitor_window.after(int(sampler.interval * 1000), redraw)
+
+        def on_destroy(event):
+            if event.widget is monitor_window:
+                sampler.stop()
+
+        monitor_window.bind("<Destroy>", on_destroy)
+        sampler.start()
+        redraw()
+
+    def show_latency_curves(self):
+        """Plot per-operation latency against operation index for recorded tests."""
+        curves = [(name, result['latency_histogram']) for name, result in self.test_results.items()
+                  if isinstance(result.get('latency_histogram'), dict)]
+        if not curves:
+            messagebox.showinfo("Latency Curves", "No latency data yet. Run the Treeview or Label/Progress test first.")
+            return
+
+        curve_window = tk.Toplevel(self.root)
+        curve_window.title("Latency vs. Index")
+        curve_window.geometry("700x450")
+
+        notebook = ttk.Notebook(curve_window)
+        notebook.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+
+        for test_name, hist in curves:
+            frame = ttk.Frame(notebook)
+            notebook.add(frame, text=test_name.title())
+
+            summary = (f"p50 {hist['p50_us']:.1f}us | p90 {hist['p90_us']:.1f}us | "
+                       f"p99 {hist['p99_us']:.1f}us | p99.9 {hist['p999_us']:.1f}us | max {hist['max_us']:.1f}us")
+            if hist.get('growth_onset_index') is not None:
+                summary += f" | cost doubles from index {hist['growth_onset_index']}"
+            ttk.Label(frame, text=summary).pack(anchor="w", pady=5)
+
+            canvas = tk.Canvas(frame, background="white")
+            canvas.pack(fill=tk.BOTH, expand=True)
+            canvas.bind("<Configure>", lambda e, c=canvas, h=hist: self.draw_latency_curve(c, h['curve']))
+
+    def draw_latency_curve(self, canvas, curve):
+        """Draw mean (blue) and max (red) latency per bin onto a canvas."""
+        canvas.delete("all")
+        width = canvas.winfo_width()
+        height = canvas.winfo_height()
+        left, bottom, top = 60, 30, 10
+        means = curve['mean_us']
+        maxima = curve['max_us']
+        if len(means) < 2 or width <= left + 10:
+            return
+
+        # Scale to the 99th percentile bin max so one huge stall doesn't flatten the curve
+        y_max = sorted(maxima)[int(len(maxima) * 0.99) - 1] or 1.0
+        plot_width = width - left - 10
+        plot_height = height - bottom - top
+
+        def point(index, value):
+            x = left + plot_width * index / (len(means) - 1)
+            y = top + plot_height * (1 - min(value, y_max) / y_max)
+            return x, y
+
+        canvas.create_line(left, top, left, height - bottom)
+        canvas.create_line(left, height - bottom, width - 10, height - bottom)
+        canvas.create_text(left - 5, top, text=f"{y_max:.0f}us", anchor="e")
+        canvas.create_text(left - 5, height - bottom, text="0", anchor="e")
+        canvas.create_text(width - 10, height - bottom + 5, anchor="ne",
+                           text=f"op index ({len(means) * curve['bin_size']})")
+
+        for values, color in ((maxima, "red"), (means, "blue")):
+            coords = []
+            for index, value in enumerate(values):
+                coords.extend(point(index, value))
+            canvas.create_line(*coords, fill=color)
 
     def show_about(self):
         """Show about dialog."""
@@ -985,6 +2804,7 @@ Help → About, Shortcuts"""
         if filename:
             try:
                 with open(filename, 'w', newline='') as f:
+                    import csv
                     writer = csv.writer(f)
                     writer.writerow(['Test', 'Metric', 'Run 1', 'Run 2', 'Difference', 'Improvement %'])
                     
@@ -1048,6 +2868,24 @@ Help → About, Shortcuts"""
         
         self.stress_running = False
 
+    def get_test_sizes(self):
+        """Return the current test size settings."""
+        return {
+            'tree_items': self.tree_items_var.get(),
+            'label_updates': self.label_updates_var.get(),
+            'window_count': self.window_count_var.get(),
+            'widget_count': self.widget_count_var.get(),
+            'memory_test': self.memory_test_var.get()
+        }
+
+    def set_test_sizes(self, sizes, multiplier=1.0):
+        """Apply test size settings, optionally scaled by a load multiplier."""
+        self.tree_items_var.set(int(sizes['tree_items'] * multiplier))
+        self.label_updates_var.set(int(sizes['label_updates'] * multiplier))
+        self.window_count_var.set(int(sizes['window_count'] * multiplier))
+        self.widget_count_var.set(int(sizes['widget_count'] * multiplier))
+        self.memory_test_var.set(int(sizes['memory_test'] * multiplier))
+
     def run_stress_test(self):
         """Run stress test with multiple iterations."""
         iterations = self.stress_iterations_var.get()
@@ -1056,76 +2894,73 @@ Help → About, Shortcuts"""
         if iterations <= 0 or multiplier <= 0:
             messagebox.showerror("Invalid Input", "Iterations and multiplier must be positive numbers.")
             return
+        if self.is_running_tests:
+            messagebox.showwarning("Tests Running", "Wait for the current test run to finish first.")
+            return
         
         self.stress_running = True
+        self.is_running_tests = True
         self.stress_start_btn.config(state="disabled")
         self.stress_stop_btn.config(state="normal")
         self.stress_progress["maximum"] = iterations
+        self.dispatcher.start()
+        original_values = self.get_test_sizes()
         
+        # The worker only sequences iterations; every Tk call goes through the dispatcher
         def stress_test_thread():
+            stress_results = []
             try:
-                stress_results = []
-                original_values = {}
-                
-                # Save original test values
-                original_values['tree_items'] = self.tree_items_var.get()
-                original_values['label_updates'] = self.label_updates_var.get()
-                original_values['window_count'] = self.window_count_var.get()
-                original_values['widget_count'] = self.widget_count_var.get()
-                original_values['memory_test'] = self.memory_test_var.get()
-                
                 for i in range(iterations):
                     if not self.stress_running:
                         break
                         
-                    self.root.after(0, lambda i=i: self.stress_status_var.set(f"Running iteration {i+1}/{iterations}"))
-                    self.root.after(0, lambda i=i: setattr(self.stress_progress, 'value', i))
+                    self.dispatcher.post(self.stress_status_var.set, f"Running iteration {i+1}/{iterations}")
+                    self.dispatcher.post(self.stress_progress.configure, value=i)
+                    self.dispatcher.call(self.clear_treeview)
                     
                     # Increase test loads
-                    self.tree_items_var.set(int(original_values['tree_items'] * multiplier))
-                    self.label_updates_var.set(int(original_values['label_updates'] * multiplier))
-                    self.window_count_var.set(int(original_values['window_count'] * multiplier))
-                    self.widget_count_var.set(int(original_values['widget_count'] * multiplier))
-                    self.memory_test_var.set(int(original_values['memory_test'] * multiplier))
+                    self.dispatcher.call(self.set_test_sizes, original_values, multiplier)
                     
                     # Run tests
-                    self.run_all_tests()
+                    if not self.run_all_tests(self.dispatcher):
+                        break
                     
                     # Store results
-                    if self.test_results:
+                    results = self.dispatcher.call(self.test_results.copy)
+                    if results:
                         stress_results.append({
                             'iteration': i + 1,
-                            'results': self.test_results.copy()
+                            'results': results
                         })
                     
                     time.sleep(0.5)  # Brief pause between iterations
-                
-                # Restore original values
-                self.tree_items_var.set(original_values['tree_items'])
-                self.label_updates_var.set(original_values['label_updates'])
-                self.window_count_var.set(original_values['window_count'])
-                self.widget_count_var.set(original_values['widget_count'])
-                self.memory_test_var.set(original_values['memory_test'])
-                
-                # Calculate averages and show results
-                self.root.after(0, lambda: self.show_stress_results(stress_results))
-                
+            except Exception as e:
+                print(f"Stress test failed: {e}")
             finally:
-                self.root.after(0, self.stress_test_completed)
+                # Restore original values, show results and release the dispatcher
+                self.dispatcher.post(self.set_test_sizes, original_values)
+                self.dispatcher.post(self.show_stress_results, stress_results)
+                self.dispatcher.post(self.stress_test_completed)
         
         threading.Thread(target=stress_test_thread, daemon=True).start()
 
     def stop_stress_test(self):
         """Stop the running stress test."""
         self.stress_running = False
+        self.is_running_tests = False
 
     def stress_test_completed(self):
         """Called when stress test is completed."""
         self.stress_running = False
-        self.stress_start_btn.config(state="normal")
-        self.stress_stop_btn.config(state="disabled")
-        self.stress_status_var.set("Stress test completed")
-        self.stress_progress["value"] = self.stress_progress["maximum"]
+        self.is_running_tests = False
+        self.dispatcher.stop()
+        try:
+            self.stress_start_btn.config(state="normal")
+            self.stress_stop_btn.config(state="disabled")
+            self.stress_status_var.set("Stress test completed")
+            self.stress_progress["value"] = self.stress_progress["maximum"]
+        except tk.TclError:
+            pass # Stress window was closed while the test ran
 
     def show_stress_results(self, stress_results):
         """Show stress test results summary."""
@@ -1205,6 +3040,7 @@ Help → About, Shortcuts"""
     def create_html_report(self):
         """Create HTML content for the test report."""
         timestamp = time.strftime('%Y-%m-%d %H:%M:%S')
+        info = self.fingerprint.static
         
         html = f"""<!DOCTYPE html>
 <html>
@@ -1226,17 +3062,19 @@ Help → About, Shortcuts"""
     <div class="header">
         <h1>TTK Benchmark Test Report</h1>
         <p>Generated on: {timestamp}</p>
-        <p>Platform: {platform.platform()}</p>
-        <p>Python Version: {platform.python_version()}</p>
+        <p>Platform: {info['platform']}</p>
+        <p>Python Version: {info['python_version']}</p>
     </div>
     
     <div class="section">
         <h2>System Information</h2>
         <table>
             <tr><th>Property</th><th>Value</th></tr>
-            <tr><td>Operating System</td><td>{platform.system()} {platform.release()}</td></tr>
-            <tr><td>CPU Cores</td><td>{psutil.cpu_count()}</td></tr>
-            <tr><td>Memory (Total)</td><td>{psutil.virtual_memory().total // (1024**3)} GB</td></tr>
+            <tr><td>Operating System</td><td>{info['system']} {info['release']}</td></tr>
+            <tr><td>CPU Cores</td><td>{info['cpu_count']}</td></tr>
+            <tr><td>Memory (Total)</td><td>{info['memory_total_gb']} GB</td></tr>
+            <tr><td>Tk Version</td><td>{info['tk_version']}</td></tr>
+            <tr><td>Host Fingerprint</td><td>{info['fingerprint']}</td></tr>
             <tr><td>TTK Theme</td><td>{self.style.theme_use()}</td></tr>
         </table>
     </div>
@@ -1252,6 +3090,8 @@ Help → About, Shortcuts"""
                 <tr><th>Metric</th><th>Value</th><th>Unit</th></tr>"""
             
             for metric, value in results.items():
+                if isinstance(value, (dict, list)):
+                    continue
                 unit = self.get_unit_for_metric(metric)
                 if isinstance(value, float):
                     value_str = f"{value:.4f}"
@@ -1277,13 +3117,12 @@ Help → About, Shortcuts"""
             <h4>Performance Analysis:</h4>
             <ul>"""
         
-        for test_name, result in self.test_results.items():
-            if 'rate' in result:
-                rate = result['rate']
-                if test_name == 'treeview' and rate < 1000:
-                    html += "<li>Treeview population rate is below 1000 items/second - consider optimization</li>"
-                elif test_name == 'widgets' and rate < 100:
-                    html += "<li>Widget creation rate is below 100 widgets/second - UI may feel sluggish</li>"
+        thresholds = self.config.get('performance_thresholds', {})
+        from regression import check_thresholds
+        for check in check_thresholds(self.test_results, thresholds):
+            if check['status'] == 'fail':
+                label = check['name'].replace('_', ' ')
+                html += f"<li>{check['test'].title()} rate {check['value']:.1f} is below the {label} threshold of {check['threshold']}</li>"
         
         html += """
             </ul>
@@ -0,0 +1,130 @@
+"""
+Measurement engine for the TTK benchmarks.
+
+Every benchmark hands a sample function to measure(). The sample function
+performs one run and returns its elapsed time in seconds (or a dict of
+named timings). measure() takes care of warmup runs, timed repetitions,
+outlier rejection and summary statistics.
+"""
+
+import math
+import random
+import time
+
+# Statistics copied into test_results for each timed metric
+SUMMARY_KEYS = ('median', 'mean', 'stddev', 'min', 'max', 'p90', 'p99', 'ci_low', 'ci_high')
+
+def percentile(sorted_values, pct):
+    """Return the pct-th percentile (0-100) of pre-sorted values, interpolating linearly."""
+    if not sorted_values:
+        return 0.0
+    if len(sorted_values) == 1:
+        return sorted_values[0]
+    rank = (len(sorted_values) - 1) * pct / 100.0
+    low = math.floor(rank)
+    high = math.ceil(rank)
+    fraction = rank - low
+    return sorted_values[low] + (sorted_values[high] - sorted_values[low]) * fraction
+
+def reject_outliers(values, k=1.5):
+    """Split values into (kept, rejected) using Tukey's IQR fences."""
+    if len(values) < 4:
+        return list(values), []
+    ordered = sorted(values)
+    q1 = percentile(ordered, 25)
+    q3 = percentile(ordered, 75)
+    spread = (q3 - q1) * k
+    low, high = q1 - spread, q3 + spread
+    kept = [v for v in values if low <= v <= high]
+    rejected = [v for v in values if v < low or v > high]
+    return kept, rejected
+
+def bootstrap_ci(values, statistic=None, confidence=0.95, resamples=1000, seed=0):
+    """Bootstrap a confidence interval for a statistic (median by default)."""
+    if not values:
+        return 0.0, 0.0
+    if statistic is None:
+        statistic = lambda v: percentile(sorted(v), 50)
+    if len(values) == 1:
+        return values[0], values[0]
+
+    rng = random.Random(seed)
+    n = len(values)
+    estimates = sorted(statistic([values[rng.randrange(n)] for _ in range(n)]) for _ in range(resamples))
+    tail = (1.0 - confidence) / 2 * 100
+    return percentile(estimates, tail), percentile(estimates, 100 - tail)
+
+def summarize(values, outlier_k=1.5, confidence=0.95):
+    """Compute summary statistics for a list of timings."""
+    kept, rejected = reject_outliers(values, outlier_k) if outlier_k else (list(values), [])
+    ordered = sorted(kept)
+    n = len(ordered)
+    mean = sum(ordered) / n if n else 0.0
+    variance = sum((v - mean) ** 2 for v in ordered) / (n - 1) if n > 1 else 0.0
+    ci_low, ci_high = bootstrap_ci(ordered, confidence=confidence)
+    return {
+        'n': n,
+        'outliers': len(rejected),
+        'median': percentile(ordered, 50),
+        'mean': mean,
+        'stddev': math.sqrt(variance),
+        'min': ordered[0] if ordered else 0.0,
+        'max': ordered[-1] if ordered else 0.0,
+        'p90': percentile(ordered, 90),
+        'p99': percentile(ordered, 99),
+        'ci_low': ci_low,
+        'ci_high': ci_high,
+        'samples': list(values)
+    }
+
+def measure(sample, repeats=5, warmup=1, cancelled=None, outlier_k=1.5):
+    """Run sample() warmup + repeats times and summarize the timed runs.
+
+    sample() returns elapsed seconds, or a dict of {metric: seconds}. If it
+    returns None the run is timed here instead. cancelled() is checked before
+    every run so long measurements can be aborted.
+
+    Returns {metric: summary} with one summary per timed metric.
+    """
+    def run_once():
+        start = time.perf_counter()
+        result = sample()
+        if result is None:
+            result = time.perf_counter() - start
+        if not isinstance(result, dict):
+            result = {'duration': result}
+        return result
+
+    for _ in range(max(0, warmup)):
+        if cancelled is not None and cancelled():
+            break
+        run_once()
+
+    timings = {}
+    for _ in range(max(1, repeats)):
+        if cancelled is not None and cancelled():
+            break
+        for metric, value in run_once().items():
+            timings.setdefault(metric, []).append(value)
+
+    return {metric: summarize(values, outlier_k) for metric, values in timings.items()}
+
+def flatten_summary(summaries):
+    """Flatten measure() output into test_results keys like 'duration_p90'.
+
+    The median of each metric is stored under the metric's own name so the
+    existing 'duration'/'rate' consumers keep working. The raw repetition
+    timings are kept under 'duration_samples' for distribution comparisons.
+    """
+    flat = {}
+    for metric, summary in summaries.items():
+        flat[metric] = summary['median']
+        for key in SUMMARY_KEYS:
+            if key != 'median':
+                flat[f"{metric}_{key}"] = summary[key]
+        flat[f"{metric}_samples"] = summary['samples']
+    if summaries:
+        first = next(iter(summaries.values()))
+        flat['repetitions'] = first['n'] + first['outliers']
+        flat['outliers_rejected'] = max(s['outliers'] for s in summaries.values())
+    return flat
@@ -0,0 +1,91 @@
+"""
+Memory cost accounting for benchmark workloads.
+
+Python-side allocations (tkinter wrapper objects, option dicts, strings) are
+measured with tracemalloc snapshots. Memory allocated inside Tcl/Tk and the
+X client libraries is invisible to tracemalloc, so the process RSS and USS
+(unique set size) deltas are recorded as well.
+
+tracemalloc slows allocation down considerably, so accounting runs as a
+separate, untimed pass and never overlaps a timed measurement.
+
+Usage:
+    accountant = MemoryAccountant()
+    accountant.start()
+    build_widgets()
+    usage = accountant.stop()
+    costs = per_unit(usage, count=1000, unit="item")   # python_bytes_per_item, ...
+
+Accountants may be nested; tracing stops when the outermost one stops.
+"""
+
+import gc
+import os
+import tracemalloc
+
+import psutil
+
+TOP_SITES = 10
+
+def process_memory():
+    """Return (rss, uss) in bytes; uss is None where the platform refuses it."""
+    process = psutil.Process()
+    try:
+        info = process.memory_full_info()
+        return info.rss, info.uss
+    except (psutil.AccessDenied, AttributeError):
+        return process.memory_info().rss, None
+
+class MemoryAccountant:
+    """Records Python heap and process memory deltas around a block of work."""
+
+    def __init__(self, top_n=TOP_SITES, frames=1):
+        self.top_n = top_n
+        self.frames = frames
+        self._started_tracing = False
+
+    def start(self):
+        """Take the 'before' snapshot, starting tracemalloc if needed."""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+            self._started_tracing = True
+        gc.collect()
+        self._snapshot = tracemalloc.take_snapshot()
+        self._rss, self._uss = process_memory()
+
+    def stop(self):
+        """Take the 'after' snapshot and return the deltas."""
+        gc.collect()
+        snapshot = tracemalloc.take_snapshot()
+        rss, uss = process_memory()
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+        # Ignore tracemalloc's own bookkeeping
+        filters = [tracemalloc.Filter(False, tracemalloc.__file__)]
+        differences = snapshot.filter_traces(filters).compare_to(self._snapshot.filter_traces(filters), 'lineno')
+        top = sorted(differences, key=lambda stat: stat.size_diff, reverse=True)[:self.top_n]
+        return {
+            'python_bytes': sum(stat.size_diff for stat in differences),
+            'rss_bytes': rss - self._rss,
+            'uss_bytes': uss - self._uss if uss is not None and self._uss is not None else None,
+            'top_allocations': [
+                {
+                    'site': f"{os.path.basename(stat.traceback[0].filename)}:{stat.traceback[0].lineno}",
+                    'bytes': stat.size_diff,
+                    'blocks': stat.count_diff
+                }
+                for stat in top if stat.size_diff > 0
+            ]
+        }
+
+def per_unit(usage, count, unit):
+    """Turn MemoryAccountant.stop() deltas into per-unit costs for test_results."""
+    costs = {}
+    for kind in ('python', 'rss', 'uss'):
+        total = usage[f'{kind}_bytes']
+        if total is not None:
+            costs[f'{kind}_bytes_per_{unit}'] = total / count if count else 0.0
+    costs['top_allocations'] = usage['top_allocations']
+    return costs
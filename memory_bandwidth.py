@@ -0,0 +1,156 @@
+"""
+Memory bandwidth kernels.
+
+Every kernel moves a known number of bytes with C-level buffer operations
+(slice assignment, memoryview copies, bytes.find, operator.itemgetter), so
+the timings reflect the memory system rather than the interpreter loop.
+
+Kernels:
+    write_slice      bytearray slice assignment from a 1 MB block
+    write_memoryview memoryview slice assignment from a 1 MB block
+    read_scan        bytearray.find() over the whole buffer (memchr)
+    read_memoryview  memoryview chunks copied into a cache-sized block
+    copy             full buffer-to-buffer copy (memcpy)
+    strided_read     gather one 8-byte word per 64-byte cache line
+    strided_write    scatter one 8-byte word per 64-byte cache line
+    random_read      gather 8-byte words at random offsets
+    mmap_anonymous   map, first-touch and unmap anonymous memory
+    mmap_file        map, first-touch and unmap a file-backed mapping
+
+Usage:
+    bench = BandwidthBench(256 * 1024 * 1024)
+    seconds, faults = bench.run("copy")
+    gbps = bench.bytes_moved("copy") / seconds / 1e9
+    bench.close()
+"""
+
+import mmap
+import operator
+import random
+import tempfile
+import time
+
+import psutil
+
+try:
+    import resource
+except ImportError: # Windows
+    resource = None
+
+CHUNK_BYTES = 1024 * 1024
+CACHE_LINE = 64
+WORD = 8
+
+KERNELS = ('write_slice', 'write_memoryview', 'read_scan', 'read_memoryview', 'copy',
+           'strided_read', 'strided_write', 'random_read', 'mmap_anonymous', 'mmap_file')
+
+def page_faults():
+    """Return (minor, major) page faults of this process so far."""
+    if resource is not None:
+        usage = resource.getrusage(resource.RUSAGE_SELF)
+        return usage.ru_minflt, usage.ru_majflt
+    # psutil only reports a combined count on Windows
+    return getattr(psutil.Process().memory_info(), 'num_page_faults', 0), 0
+
+class BandwidthBench:
+    """Pre-allocated buffers and the kernels that stream through them."""
+
+    def __init__(self, size_bytes, random_reads=1000000, seed=0):
+        # Whole chunks and cache lines keep the byte accounting exact
+        self.size = max(CHUNK_BYTES, size_bytes - size_bytes % CHUNK_BYTES)
+        self.random_reads = max(2, random_reads) # itemgetter needs two indices to return a tuple
+        # 0xFF never occurs in the data, so read_scan has to look at every byte
+        self.block = bytes(range(255)) * (CHUNK_BYTES // 255) + bytes(CHUNK_BYTES % 255)
+        self.src = bytearray(self.size)
+        self.dst = bytearray(self.size)
+        self._write(self.src, self.block)
+        self._write(self.dst, self.block)
+        self.scratch = memoryview(bytearray(CHUNK_BYTES))
+
+        words = memoryview(self.src).cast('Q')
+        lines = self.size // CACHE_LINE
+        # One word per cache line, copied from src so its pages are already faulted in
+        self.line_words = memoryview(bytearray(self.src[:lines * WORD])).cast('Q')
+        rng = random.Random(seed)
+        self.gather = operator.itemgetter(*(rng.randrange(len(words)) for _ in range(self.random_reads)))
+
+    def _write(self, target, block):
+        view = memoryview(target)
+        for start in range(0, self.size, CHUNK_BYTES):
+            view[start:start + CHUNK_BYTES] = block
+
+    def close(self):
+        """Release the buffers."""
+        self.scratch.release()
+        self.line_words.release()
+        self.src = self.dst = None
+
+    def bytes_moved(self, kernel):
+        """Bytes of memory each kernel touches per run, for GB/s figures."""
+        if kernel == 'random_read':
+            # Every random word pulls in a whole cache line
+            return self.random_reads * CACHE_LINE
+        if kernel == 'copy':
+            return self.size * 2 # Read plus write
+        return self.size
+
+    def run(self, kernel):
+        """Run one kernel once. Returns (seconds, (minor_faults, major_faults))."""
+        operation = getattr(self, f"_{kernel}")
+        prepare = getattr(self, f"_prepare_{kernel}", None)
+        state = prepare() if prepare else None
+        minor, major = page_faults()
+        start = time.perf_counter()
+        operation(state)
+        elapsed = time.perf_counter() - start
+        end_minor, end_major = page_faults()
+        return elapsed, (end_minor - minor, end_major - major)
+
+    def _write_slice(self, _):
+        dst, block = self.dst, self.block
+        for start in range(0, self.size, CHUNK_BYTES):
+            dst[start:start + CHUNK_BYTES] = block
+
+    def _write_memoryview(self, _):
+        self._write(self.dst, self.block)
+
+    def _read_scan(self, _):
+        if self.src.find(b'\xff') != -1:
+            raise RuntimeError("read_scan sentinel found in buffer")
+
+    def _read_memoryview(self, _):
+        view, scratch = memoryview(self.src), self.scratch
+        for start in range(0, self.size, CHUNK_BYTES):
+            scratch[:] = view[start:start + CHUNK_BYTES]
+
+    def _copy(self, _):
+        self.dst[:] = self.src
+
+    def _strided_read(self, _):
+        self.line_words[:] = memoryview(self.src).cast('Q')[::CACHE_LINE // WORD]
+
+    def _strided_write(self, _):
+        memoryview(self.dst).cast('Q')[::CACHE_LINE // WORD] = self.line_words
+
+    def _random_read(self, _):
+        self.gather(memoryview(self.src).cast('Q'))
+
+    def _touch_mapping(self, mapping):
+        for start in range(0, self.size, CHUNK_BYTES):
+            mapping[start:start + CHUNK_BYTES] = self.block
+        mapping.close()
+
+    def _mmap_anonymous(self, _):
+        self._touch_mapping(mmap.mmap(-1, self.size))
+
+    def _prepare_mmap_file(self):
+        # File creation is not part of the timed mapping
+        handle = tempfile.TemporaryFile()
+        handle.truncate(self.size)
+        return handle
+
+    def _mmap_file(self, handle):
+        try:
+            self._touch_mapping(mmap.mmap(handle.fileno(), self.size))
+        finally:
+            handle.close()
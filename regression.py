@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+TTK Benchmark Regression Gate
+Checks a results file against the performance_thresholds in config.json
+and against a baseline distribution of earlier runs.
+
+Baseline comparisons use a one-sided Mann-Whitney U test on the
+per-repetition timings ('<metric>_samples'), so a run only fails when it is
+both significantly slower (p < alpha) and slower by more than min_effect.
+The baseline comes from results JSON files or from the results history
+database (same host and theme by default).
+
+Usage:
+    python -m regression run.json --db ttk_benchmark_results.db
+    python -m regression run.json --baseline old1.json old2.json -o verdict.json
+
+Exit codes: 0 pass, 1 regression or threshold failure, 2 bad input.
+"""
+
+import argparse
+import json
+import math
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from results_store import ResultsStore, host_fingerprint
+
+CONFIG_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "config.json")
+
+# performance_thresholds key -> (test, metric); rates are minimums
+THRESHOLD_METRICS = {
+    'treeview_items_per_second': ('treeview', 'rate'),
+    'widgets_per_second': ('widgets', 'rate'),
+    'updates_per_second': ('label_updates', 'rate'),
+    'window_operations_per_second': ('windows', 'rate'),
+}
+
+SAMPLES_SUFFIX = '_samples'
+
+# Below this many samples on either side the test has too little power
+MIN_SAMPLES = 3
+
+# Exact U distribution is used for samples up to this combined size
+EXACT_LIMIT = 40
+
+def check_thresholds(test_results, thresholds):
+    """Compare rates against configured minimums. Returns a list of check dicts."""
+    checks = []
+    for name, minimum in thresholds.items():
+        test, metric = THRESHOLD_METRICS.get(name, (None, None))
+        if test is None:
+            continue
+        value = test_results.get(test, {}).get(metric)
+        if value is None:
+            status = 'missing'
+        else:
+            status = 'pass' if value >= minimum else 'fail'
+        checks.append({
+            'kind': 'threshold', 'name': name, 'test': test, 'metric': metric,
+            'value': value, 'threshold': minimum, 'status': status
+        })
+    return checks
+
+def _exact_upper_tail(u, m, n):
+    """P(U >= u) for tie-free samples of sizes m and n under the null hypothesis."""
+    # Coefficients of the Gaussian binomial [m+n choose m] count arrangements per U value
+    size = m * n
+    counts = [1] + [0] * size
+    for i in range(1, m + 1):
+        for k in range(size, n + i - 1, -1):
+            counts[k] -= counts[k - n - i]
+        for k in range(i, size + 1):
+            counts[k] += counts[k - i]
+    start = max(0, math.ceil(u))
+    return sum(counts[start:]) / math.comb(m + n, m)
+
+def mann_whitney_u(current, baseline):
+    """One-sided Mann-Whitney U test that current values tend to be larger.
+
+    Returns (u, p_greater, p_less) where u counts pairs with current > baseline
+    (ties count one half).
+    """
+    m, n = len(current), len(baseline)
+    ranked = sorted([(v, 0) for v in current] + [(v, 1) for v in baseline])
+    ranks = [0.0] * len(ranked)
+    tie_term = 0
+    i = 0
+    while i < len(ranked):
+        j = i
+        while j + 1 < len(ranked) and ranked[j + 1][0] == ranked[i][0]:
+            j += 1
+        for k in range(i, j + 1):
+            ranks[k] = (i + j) / 2 + 1
+        ties = j - i + 1
+        tie_term += ties ** 3 - ties
+        i = j + 1
+    rank_sum = sum(r for r, (_, group) in zip(ranks, ranked) if group == 0)
+    u = rank_sum - m * (m + 1) / 2
+
+    if tie_term == 0 and m + n <= EXACT_LIMIT:
+        return u, _exact_upper_tail(u, m, n), _exact_upper_tail(m * n - u, n, m)
+
+    total = m + n
+    variance = m * n / 12 * ((total + 1) - tie_term / (total * (total - 1)))
+    if variance <= 0:
+        return u, 1.0, 1.0
+    sigma = math.sqrt(variance)
+    mean = m * n / 2
+    # Continuity-corrected normal approximation
+    p_greater = 0.5 * math.erfc((u - mean - 0.5) / sigma / math.sqrt(2))
+    p_less = 0.5 * math.erfc((mean - u - 0.5) / sigma / math.sqrt(2))
+    return u, min(1.0, p_greater), min(1.0, p_less)
+
+def _median(values):
+    ordered = sorted(values)
+    mid = len(ordered) // 2
+    return ordered[mid] if len(ordered) % 2 else (ordered[mid - 1] + ordered[mid]) / 2
+
+def compare_samples(test, metric, current, baseline, alpha=0.05, min_effect=0.05):
+    """Compare timing samples (lower is better) against a baseline distribution."""
+    check = {
+        'kind': 'baseline', 'test': test, 'metric': metric,
+        'n_current': len(current), 'n_baseline': len(baseline)
+    }
+    if len(current) < MIN_SAMPLES or len(baseline) < MIN_SAMPLES:
+        check['status'] = 'insufficient'
+        return check
+
+    current_median = _median(current)
+    baseline_median = _median(baseline)
+    change = (current_median - baseline_median) / baseline_median if baseline_median > 0 else 0.0
+    u, p_slower, p_faster = mann_whitney_u(current, baseline)
+    if p_slower < alpha and change > min_effect:
+        status = 'regression'
+    elif p_faster < alpha and change < -min_effect:
+        status = 'improvement'
+    else:
+        status = 'pass'
+    check.update({
+        'current_median': current_median,
+        'baseline_median': baseline_median,
+        'change_pct': change * 100,
+        'u': u,
+        # Probability that a current run is slower than a baseline run
+        'effect_size': u / (len(current) * len(baseline)),
+        'p_value': p_slower,
+        'status': status
+    })
+    return check
+
+def sample_metrics(test_results):
+    """Yield (test, metric, samples) for every timing with per-repetition samples."""
+    for test, result in test_results.items():
+        for key, value in result.items():
+            if key.endswith(SAMPLES_SUFFIX) and isinstance(value, list):
+                yield test, key[:-len(SAMPLES_SUFFIX)], value
+
+def baseline_from_files(paths):
+    """Pool per-repetition samples from baseline results files: {(test, metric): [samples]}."""
+    pooled = {}
+    for path in paths:
+        with open(path, 'r') as f:
+            payload = json.load(f)
+        for test, metric, samples in sample_metrics(payload.get('test_results', {})):
+            pooled.setdefault((test, metric), []).extend(samples)
+    return pooled
+
+def baseline_from_store(store, payload, history=10, any_host=False, any_theme=False):
+    """Pool samples of the most recent stored runs matching the run's host and theme.
+
+    The run under test is usually already in the store (auto-save, --store), so
+    stored runs with its timestamp and host, or with identical samples, are left out.
+    """
+    host = None if any_host else host_fingerprint(payload.get('system_info', {}))
+    theme = None if any_theme else payload.get('theme')
+    own_runs = set(store.find_runs(payload))
+    pooled = {}
+    for test, metric, current in sample_metrics(payload.get('test_results', {})):
+        for samples in store.samples(test, metric, host=host, theme=theme, limit=history, exclude=own_runs):
+            if samples != current:
+                pooled.setdefault((test, metric), []).extend(samples)
+    return pooled
+
+def evaluate(payload, thresholds, baseline, alpha=0.05, min_effect=0.05):
+    """Build the machine-readable verdict for one results payload."""
+    test_results = payload.get('test_results', {})
+    checks = check_thresholds(test_results, thresholds)
+    for test, metric, samples in sample_metrics(test_results):
+        checks.append(compare_samples(test, metric, samples, baseline.get((test, metric), []),
+                                      alpha=alpha, min_effect=min_effect))
+    failed = [c for c in checks if c['status'] in ('fail', 'regression')]
+    return {
+        'verdict': 'fail' if failed else 'pass',
+        'timestamp': payload.get('timestamp'),
+        'theme': payload.get('theme'),
+        'alpha': alpha,
+        'min_effect_pct': min_effect * 100,
+        'failures': len(failed),
+        'checks': checks
+    }
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="regression",
+        description="Check benchmark results against thresholds and a baseline; exits 1 on regression."
+    )
+    parser.add_argument("results", help="Results JSON file (from benchmark_cli or Save Results)")
+    parser.add_argument("--config", default=CONFIG_FILE, help="config.json with performance_thresholds")
+    parser.add_argument("--baseline", nargs="+", default=[], help="Baseline results JSON file(s)")
+    parser.add_argument("--db", help="Results history database to draw the baseline from")
+    parser.add_argument("--history", type=int, default=10, help="Stored runs to pool into the baseline (default: 10)")
+    parser.add_argument("--any-host", action="store_true", help="Use stored runs from every host")
+    parser.add_argument("--any-theme", action="store_true", help="Use stored runs of every theme")
+    parser.add_argument("--alpha", type=float, default=0.05, help="Significance level (default: 0.05)")
+    parser.add_argument("--min-effect", type=float, default=5.0,
+                        help="Minimum median slowdown in percent to fail (default: 5)")
+    parser.add_argument("-o", "--output", help="Write the verdict JSON to this file instead of stdout")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    """Command-line entry point."""
+    args = parse_args(argv)
+    try:
+        with open(args.results, 'r') as f:
+            payload = json.load(f)
+        with open(args.config, 'r') as f:
+            thresholds = json.load(f).get('performance_thresholds', {})
+        baseline = baseline_from_files(args.baseline)
+        if args.db:
+            with ResultsStore(args.db) as store:
+                stored = baseline_from_store(store, payload, args.history, args.any_host, args.any_theme)
+            for key, samples in stored.items():
+                baseline.setdefault(key, []).extend(samples)
+    except (OSError, ValueError) as e:
+        print(f"Regression check failed: {e}", file=sys.stderr)
+        return 2
+
+    verdict = evaluate(payload, thresholds, baseline, alpha=args.alpha, min_effect=args.min_effect / 100)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(verdict, f, indent=2)
+    else:
+        json.dump(verdict, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+    for check in verdict['checks']:
+        if check['status'] in ('fail', 'regression'):
+            label = check.get('name') or f"{check['test']}.{check['metric']}"
+            print(f"FAIL {label}: {check['status']}", file=sys.stderr)
+    return 1 if verdict['verdict'] == 'fail' else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
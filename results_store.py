@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+"""
+Append-only SQLite history of benchmark results.
+
+Every run is one row in `runs` and one row per scalar metric in
+`measurements`. Measurements repeat the run's timestamp, host fingerprint
+and theme so trend and comparison queries are answered from one indexed
+table without joins. Nested data (histograms, curves) is kept as JSON in
+`details`.
+
+Usage:
+    store = ResultsStore("ttk_benchmark_results.db")
+    store.add_run(payload)          # payload as produced by get_save_data()
+    store.flush()                   # writes are batched; flush() or close() commits
+    store.time_series("treeview", "rate", host=..., theme="clam")
+
+    python -m results_store import .            # one-shot import of old JSON files
+    python -m results_store query treeview rate
+"""
+
+import argparse
+import glob
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+import time
+
+DEFAULT_DB = "ttk_benchmark_results.db"
+
+# Legacy auto-save files written before the store existed
+LEGACY_PATTERN = "ttk_benchmark_results_*.json"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    timestamp REAL NOT NULL,
+    host TEXT NOT NULL,
+    theme TEXT,
+    source TEXT UNIQUE,
+    system_info TEXT
+);
+CREATE TABLE IF NOT EXISTS measurements (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    timestamp REAL NOT NULL,
+    host TEXT NOT NULL,
+    theme TEXT,
+    test TEXT NOT NULL,
+    metric TEXT NOT NULL,
+    value REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS details (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    test TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_runs_time ON runs(timestamp);
+CREATE INDEX IF NOT EXISTS idx_runs_host_time ON runs(host, timestamp);
+CREATE INDEX IF NOT EXISTS idx_runs_theme_time ON runs(theme, timestamp);
+CREATE INDEX IF NOT EXISTS idx_meas_series ON measurements(test, metric, timestamp);
+CREATE INDEX IF NOT EXISTS idx_meas_host_theme ON measurements(test, metric, host, theme, timestamp);
+CREATE INDEX IF NOT EXISTS idx_meas_run ON measurements(run_id);
+CREATE INDEX IF NOT EXISTS idx_details_run ON details(run_id);
+"""
+
+# system_info keys that identify a machine (volatile values are left out)
+FINGERPRINT_KEYS = ('platform', 'python_version', 'cpu_count', 'memory_total_gb', 'hostname', 'tk_version')
+
+def host_fingerprint(system_info):
+    """Return a short stable hash identifying the machine a run came from."""
+    if system_info.get('fingerprint'):
+        return system_info['fingerprint']
+    identity = {key: system_info.get(key) for key in FINGERPRINT_KEYS}
+    return hashlib.sha1(json.dumps(identity, sort_keys=True).encode()).hexdigest()[:12]
+
+def parse_timestamp(value):
+    """Convert a payload timestamp ('%Y-%m-%d %H:%M:%S' or epoch) to epoch seconds."""
+    if isinstance(value, (int, float)):
+        return float(value)
+    try:
+        return time.mktime(time.strptime(value, '%Y-%m-%d %H:%M:%S'))
+    except (TypeError, ValueError):
+        return time.time()
+
+class ResultsStore:
+    """Append-only, indexed results history with batched writes."""
+
+    def __init__(self, path=DEFAULT_DB, batch_size=50):
+        self.path = path
+        self.batch_size = batch_size
+        self._pending = []
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+        self.conn.commit()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        """Write any queued runs and close the database."""
+        self.flush()
+        self.conn.close()
+
+    def add_run(self, payload, source=None):
+        """Queue one results payload; runs are written in batches. Returns ids written now."""
+        self._pending.append((payload, source))
+        if len(self._pending) >= self.batch_size:
+            return self.flush()
+        return []
+
+    def flush(self):
+        """Write all queued runs in a single transaction. Returns the new run ids."""
+        if not self._pending:
+            return []
+        pending, self._pending = self._pending, []
+        run_ids = []
+        with self.conn:
+            for payload, source in pending:
+                run_id = self._insert_run(payload, source)
+                if run_id is not None:
+                    run_ids.append(run_id)
+        return run_ids
+
+    def _insert_run(self, payload, source):
+        system_info = payload.get('system_info', {})
+        timestamp = parse_timestamp(payload.get('timestamp'))
+        host = host_fingerprint(system_info)
+        theme = payload.get('theme')
+        cursor = self.conn.execute(
+            "INSERT OR IGNORE INTO runs (timestamp, host, theme, source, system_info) VALUES (?, ?, ?, ?, ?)",
+            (timestamp, host, theme, source, json.dumps(system_info)))
+        if not cursor.rowcount:
+            return None # Already imported from this source
+        run_id = cursor.lastrowid
+
+        rows = []
+        details = []
+        for test, result in payload.get('test_results', {}).items():
+            nested = {}
+            for metric, value in result.items():
+                if isinstance(value, (int, float)):
+                    rows.append((run_id, timestamp, host, theme, test, metric, float(value)))
+                elif value is not None:
+                    nested[metric] = value
+            if nested:
+                details.append((run_id, test, json.dumps(nested)))
+        self.conn.executemany(
+            "INSERT INTO measurements (run_id, timestamp, host, theme, test, metric, value) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            rows)
+        self.conn.executemany("INSERT INTO details (run_id, test, data) VALUES (?, ?, ?)", details)
+        return run_id
+
+    def _filters(self, host=None, theme=None, since=None, until=None):
+        clauses, params = [], []
+        for column, op, value in (('host', '=', host), ('theme', '=', theme),
+                                  ('timestamp', '>=', since), ('timestamp', '<=', until)):
+            if value is not None:
+                clauses.append(f"{column} {op} ?")
+                params.append(value)
+        return clauses, params
+
+    def time_series(self, test, metric, host=None, theme=None, since=None, until=None, limit=None):
+        """Return [(timestamp, value, run_id), ...] oldest first."""
+        clauses, params = self._filters(host, theme, since, until)
+        sql = "SELECT timestamp, value, run_id FROM measurements WHERE test = ? AND metric = ?"
+        sql += "".join(" AND " + c for c in clauses)
+        if limit:
+            # Most recent `limit` points, returned in time order
+            sql = f"SELECT * FROM ({sql} ORDER BY timestamp DESC LIMIT {int(limit)}) ORDER BY timestamp"
+        else:
+            sql += " ORDER BY timestamp"
+        return self.conn.execute(sql, [test, metric] + params).fetchall()
+
+    def values(self, test, metric, **filters):
+        """Return just the values of a time series."""
+        return [value for _, value, _ in self.time_series(test, metric, **filters)]
+
+    def samples(self, test, metric, host=None, theme=None, limit=10, exclude=()):
+        """Return the per-repetition samples of a metric for the most recent runs.
+
+        Runs stored without '<metric>_samples' contribute their single value;
+        runs whose id is in exclude are skipped.
+        """
+        runs = []
+        series = self.time_series(test, metric, host=host, theme=theme, limit=limit + len(exclude) if limit else None)
+        series = [point for point in series if point[2] not in exclude]
+        for _, value, run_id in series[-limit:] if limit else series:
+            row = self.conn.execute("SELECT data FROM details WHERE run_id = ? AND test = ?", (run_id, test)).fetchone()
+            stored = json.loads(row[0]).get(f"{metric}_samples") if row else None
+            runs.append(stored if isinstance(stored, list) else [value])
+        return runs
+
+    def compare(self, test, metric, group_by='host', since=None, until=None):
+        """Summarize a metric per host or per theme: {group: {count, mean, min, max, last}}."""
+        if group_by not in ('host', 'theme'):
+            raise ValueError("group_by must be 'host' or 'theme'")
+        clauses, params = self._filters(since=since, until=until)
+        where = "".join(" AND " + c for c in clauses)
+        sql = (f"SELECT {group_by}, COUNT(*), AVG(value), MIN(value), MAX(value), "
+               f"(SELECT value FROM measurements m2 WHERE m2.test = m.test AND m2.metric = m.metric "
+               f"AND m2.{group_by} IS m.{group_by} ORDER BY timestamp DESC LIMIT 1) "
+               f"FROM measurements m WHERE test = ? AND metric = ?{where} GROUP BY {group_by}")
+        return {
+            group: {'count': count, 'mean': mean, 'min': low, 'max': high, 'last': last}
+            for group, count, mean, low, high, last in self.conn.execute(sql, [test, metric] + params)
+        }
+
+    def find_runs(self, payload):
+        """Return the ids of stored runs with the payload's timestamp and host."""
+        return [row[0] for row in self.conn.execute(
+            "SELECT id FROM runs WHERE timestamp = ? AND host = ?",
+            (parse_timestamp(payload.get('timestamp')), host_fingerprint(payload.get('system_info', {}))))]
+
+    def runs(self, limit=100, host=None, theme=None):
+        """Return recent runs as dicts, newest first."""
+        clauses, params = self._filters(host, theme)
+        sql = "SELECT id, timestamp, host, theme, source FROM runs"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY timestamp DESC LIMIT ?"
+        return [dict(zip(('id', 'timestamp', 'host', 'theme', 'source'), row))
+                for row in self.conn.execute(sql, params + [limit])]
+
+    def load_run(self, run_id):
+        """Rebuild the results payload of one run."""
+        row = self.conn.execute("SELECT timestamp, host, theme, system_info FROM runs WHERE id = ?", (run_id,)).fetchone()
+        if row is None:
+            raise KeyError(run_id)
+        timestamp, host, theme, system_info = row
+        test_results = {}
+        for test, metric, value in self.conn.execute(
+                "SELECT test, metric, value FROM measurements WHERE run_id = ?", (run_id,)):
+            test_results.setdefault(test, {})[metric] = int(value) if value.is_integer() else value
+        for test, data in self.conn.execute("SELECT test, data FROM details WHERE run_id = ?", (run_id,)):
+            test_results.setdefault(test, {}).update(json.loads(data))
+        return {
+            'timestamp': time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(timestamp)),
+            'host': host,
+            'theme': theme,
+            'system_info': json.loads(system_info or "{}"),
+            'test_results': test_results
+        }
+
+    def tests(self):
+        """Return (test, metric) pairs present in the store."""
+        return self.conn.execute("SELECT DISTINCT test, metric FROM measurements ORDER BY test, metric").fetchall()
+
+    def import_json_files(self, paths):
+        """Import legacy JSON result files, skipping ones already imported. Returns the new run count."""
+        imported = 0
+        for path in paths:
+            try:
+                with open(path, 'r') as f:
+                    payload = json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"Skipping {path}: {e}")
+                continue
+            imported += len(self.add_run(payload, source=os.path.abspath(path)))
+        return imported + len(self.flush())
+
+def main(argv=None):
+    """Command-line entry point for importing and querying the history."""
+    parser = argparse.ArgumentParser(prog="results_store", description="TTK benchmark results history")
+    parser.add_argument("--db", default=DEFAULT_DB, help="SQLite database path")
+    commands = parser.add_subparsers(dest="command", required=True)
+    import_cmd = commands.add_parser("import", help="Import legacy JSON result files")
+    import_cmd.add_argument("paths", nargs="*", default=["."], help="Files or directories (default: .)")
+    query_cmd = commands.add_parser("query", help="Print a metric's time series as JSON")
+    query_cmd.add_argument("test")
+    query_cmd.add_argument("metric")
+    query_cmd.add_argument("--host")
+    query_cmd.add_argument("--theme")
+    query_cmd.add_argument("--limit", type=int)
+    args = parser.parse_args(argv)
+
+    with ResultsStore(args.db) as store:
+        if args.command == "import":
+            files = []
+            for path in args.paths:
+                files.extend(sorted(glob.glob(os.path.join(path, LEGACY_PATTERN))) if os.path.isdir(path) else [path])
+            print(f"Imported {store.import_json_files(files)} of {len(files)} file(s) into {args.db}")
+        else:
+            start = time.perf_counter()
+            series = store.time_series(args.test, args.metric, host=args.host, theme=args.theme, limit=args.limit)
+            json.dump([{'timestamp': t, 'value': v, 'run_id': r} for t, v, r in series], sys.stdout, indent=2)
+            print(f"\n{len(series)} point(s) in {(time.perf_counter() - start) * 1000:.1f} ms", file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
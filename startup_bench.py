@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""
+TTK Benchmark Startup Timing
+Launches TTKBenchmarkApp in fresh interpreters and times how long it takes to come up.
+
+Every run is a new plain interpreter that imports main, creates the tk.Tk()
+root, constructs the app and waits for the first idle after the deferred panels
+are built. Runs use a private copy of the app modules in a temporary directory,
+so cold runs can delete its bytecode cache (and drop the OS page cache with
+--drop-caches, which needs root on Linux) without touching this checkout; warm
+runs reuse both. -X importtime adds its own overhead to every import, so the
+per-module breakdown comes from one extra cold and one extra warm run that are
+not part of the timings.
+
+Usage:
+    python -m startup_bench                         # 3 cold + 10 warm runs, JSON to stdout
+    python -m startup_bench --runs 30 --cold-runs 5 -o startup.json
+    python -m startup_bench --drop-caches --store results.db
+"""
+
+import argparse
+import glob
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from measurement import summarize, flatten_summary
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Timings reported by every run, in milliseconds
+RUN_METRICS = ('interpreter_ms', 'import_ms', 'tk_root_ms', 'app_ms', 'first_idle_ms', 'total_ms')
+
+# Modules listed in the import breakdown
+BREAKDOWN_TOP = 15
+
+# Runs inside the fresh interpreter; argv: app directory, timeout in seconds
+CHILD_SCRIPT = r"""
+import json, sys, time
+wall_start = time.time()
+start = time.perf_counter()
+sys.path.insert(0, sys.argv[1])
+import main
+imported = time.perf_counter()
+root = main.tk.Tk()
+root_ready = time.perf_counter()
+app = main.TTKBenchmarkApp(root)
+constructed = time.perf_counter()
+root.after(int(float(sys.argv[2]) * 1000), lambda: None) # Wakes dooneevent if the window never maps
+deadline = constructed + float(sys.argv[2])
+while not app.secondary_panels_built and time.perf_counter() < deadline:
+    root.tk.dooneevent()
+root.update_idletasks()
+idle = time.perf_counter()
+print(json.dumps({
+    'wall_start': wall_start,
+    'import_ms': (imported - start) * 1000,
+    'tk_root_ms': (root_ready - imported) * 1000,
+    'app_ms': (constructed - root_ready) * 1000,
+    'first_idle_ms': (idle - constructed) * 1000,
+    'total_ms': (idle - start) * 1000,
+    'completed': app.secondary_panels_built,
+    'theme': app.style.theme_use(),
+    'phases_ms': app.startup.to_dict()['phases_ms']
+}))
+root.destroy()
+"""
+
+def parse_importtime(text):
+    """Parse -X importtime output into [(name, depth, self_us, cumulative_us)]."""
+    entries = []
+    for line in text.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue # The header line
+        name = fields[2].rstrip()
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        entries.append((name.strip(), depth, int(fields[0]), int(fields[1])))
+    return entries
+
+def main_imports(entries, module="main"):
+    """Return {name: cumulative ms} for the modules imported directly by module."""
+    for index, (name, depth, _, _) in enumerate(entries):
+        if name == module:
+            break
+    else:
+        return {}
+    # importtime lists a module's imports before the module itself
+    children = {}
+    for name, child_depth, _, cumulative in reversed(entries[:index]):
+        if child_depth <= depth:
+            break
+        if child_depth == depth + 1:
+            children[name] = cumulative / 1000
+    return children
+
+def copy_app(target, source=APP_DIR):
+    """Copy the app modules and config.json into target; main imports only top-level modules."""
+    for path in glob.glob(os.path.join(source, "*.py")) + [os.path.join(source, "config.json")]:
+        if os.path.exists(path):
+            shutil.copy2(path, target)
+
+def clear_bytecode(directory):
+    """Delete the bytecode cache of the app modules copied into directory."""
+    shutil.rmtree(os.path.join(directory, "__pycache__"), ignore_errors=True)
+
+def drop_page_cache():
+    """Ask the kernel to drop clean page cache entries. Returns False if not permitted."""
+    try:
+        os.sync()
+        with open("/proc/sys/vm/drop_caches", "w") as f:
+            f.write("3\n")
+        return True
+    except (AttributeError, OSError):
+        return False
+
+def run_once(python=sys.executable, timeout=30.0, app_dir=APP_DIR, importtime=False):
+    """Start one fresh interpreter and return its timings (and import breakdown with importtime)."""
+    options = ["-X", "importtime"] if importtime else []
+    launched = time.time()
+    proc = subprocess.run(
+        [python] + options + ["-c", CHILD_SCRIPT, app_dir, str(timeout)],
+        cwd=app_dir, capture_output=True, text=True, timeout=timeout * 2
+    )
+    lines = proc.stdout.strip().splitlines()
+    if proc.returncode != 0 or not lines:
+        errors = [l for l in proc.stderr.splitlines() if not l.startswith("import time:")]
+        raise RuntimeError(errors[-1] if errors else f"startup run exited with {proc.returncode}")
+    run = json.loads(lines[-1])
+    run['interpreter_ms'] = (run.pop('wall_start') - launched) * 1000
+    run['total_ms'] += run['interpreter_ms']
+    if importtime:
+        run['imports'] = main_imports(parse_importtime(proc.stderr))
+    return run
+
+def median_breakdown(runs, limit=BREAKDOWN_TOP):
+    """Median cumulative import time per module across runs, largest first."""
+    samples = {}
+    for run in runs:
+        for name, ms in run['imports'].items():
+            samples.setdefault(name, []).append(ms)
+    medians = {name: summarize(values, outlier_k=0)['median'] for name, values in samples.items()}
+    return dict(sorted(medians.items(), key=lambda item: -item[1])[:limit])
+
+def summarize_runs(runs, drop_caches=False, breakdowns=None):
+    """Build a test_results entry with cold and warm distributions for every timing.
+
+    breakdowns maps 'cold'/'warm' to the -X importtime runs of that mode.
+    """
+    breakdowns = breakdowns or {}
+    cold = [run for run in runs if run['mode'] == 'cold']
+    warm = [run for run in runs if run['mode'] == 'warm']
+    summaries = {}
+    for mode, mode_runs in (('cold', cold), ('warm', warm)):
+        for metric in RUN_METRICS:
+            values = [run[metric] for run in mode_runs]
+            if values:
+                summaries[f"{mode}_{metric}"] = summarize(values)
+
+    result = {
+        'cold_runs': len(cold),
+        'warm_runs': len(warm),
+        'page_cache_dropped': drop_caches,
+        'incomplete_runs': sum(1 for run in runs if not run['completed'])
+    }
+    result.update(flatten_summary(summaries))
+    result['import_breakdown_ms'] = {mode: median_breakdown(breakdowns.get(mode, [])) for mode in ('cold', 'warm')}
+    phases = {}
+    for run in warm or cold:
+        for phase, ms in run['phases_ms'].items():
+            phases.setdefault(phase, []).append(ms)
+    result['phases_ms'] = {phase: summarize(values, outlier_k=0)['median'] for phase, values in phases.items()}
+    return result
+
+def run_startup_benchmark(runs=10, cold_runs=3, drop_caches=False, python=sys.executable,
+                          timeout=30.0, cancelled=None, progress=None):
+    """Time cold_runs cold and runs warm startups. Returns (test result, theme)."""
+    if drop_caches and not drop_page_cache():
+        print("Could not drop the page cache (needs root on Linux); cold runs only clear bytecode",
+              file=sys.stderr)
+        drop_caches = False
+
+    plan = ['cold'] * max(0, cold_runs) + ['warm'] * max(0, runs)
+    results = []
+    breakdowns = {}
+    with tempfile.TemporaryDirectory(prefix="ttk_startup_") as app_dir:
+        copy_app(app_dir)
+
+        def prepare(mode, first):
+            if mode == 'cold':
+                clear_bytecode(app_dir)
+                if drop_caches:
+                    drop_page_cache()
+            elif first:
+                run_once(python, timeout, app_dir) # Untimed run so the first warm run finds bytecode
+
+        for index, mode in enumerate(plan):
+            if cancelled is not None and cancelled():
+                break
+            prepare(mode, index == 0)
+            run = run_once(python, timeout, app_dir)
+            run['mode'] = mode
+            results.append(run)
+            if progress:
+                progress(run, len(results), len(plan))
+
+        # Import breakdown from separate runs; warm first, the timed runs left bytecode behind
+        for mode in ('warm', 'cold'):
+            if not any(run['mode'] == mode for run in results) or (cancelled is not None and cancelled()):
+                continue
+            prepare(mode, False)
+            breakdowns[mode] = [run_once(python, timeout, app_dir, importtime=True)]
+
+    if not results:
+        return None, None
+    return summarize_runs(results, drop_caches, breakdowns), results[-1]['theme']
+
+def main(argv=None):
+    """Command-line entry point."""
+    from main import load_config
+    from benchmark_cli import start_virtual_display, stop_virtual_display
+
+    settings = load_config()['default_settings']
+    parser = argparse.ArgumentParser(prog="startup_bench", description="Time TTK Benchmark App startup in fresh interpreters.")
+    parser.add_argument("--runs", type=int, default=settings['startup_runs'], help="Warm runs (default: startup_runs)")
+    parser.add_argument("--cold-runs", type=int, default=settings['startup_cold_runs'],
+                        help="Cold runs with bytecode caches removed (default: startup_cold_runs)")
+    parser.add_argument("--drop-caches", action="store_true", help="Also drop the OS page cache before cold runs (Linux, root)")
+    parser.add_argument("--python", default=sys.executable, help="Interpreter to launch (default: this one)")
+    parser.add_argument("--timeout", type=float, default=30.0, help="Seconds to wait for each startup")
+    parser.add_argument("--xvfb", action="store_true",
+                        help="Start a private Xvfb display (automatic when DISPLAY is unset on Linux)")
+    parser.add_argument("-o", "--output", help="Write the JSON results to this file instead of stdout")
+    parser.add_argument("--store", metavar="DB", help="Also append the results to this results history database")
+    args = parser.parse_args(argv)
+
+    def progress(run, done, total):
+        print(f"[{done}/{total}] {run['mode']}: {run['total_ms']:.1f} ms", file=sys.stderr)
+
+    xvfb_proc = None
+    needs_display = sys.platform.startswith("linux") and not os.environ.get("DISPLAY")
+    try:
+        if args.xvfb or needs_display:
+            xvfb_proc, display = start_virtual_display()
+            os.environ["DISPLAY"] = display
+        result, theme = run_startup_benchmark(args.runs, args.cold_runs, args.drop_caches,
+                                              args.python, args.timeout, progress=progress)
+    except Exception as e:
+        print(f"Startup benchmark failed: {e}", file=sys.stderr)
+        return 1
+    finally:
+        stop_virtual_display(xvfb_proc)
+    if result is None:
+        print("Startup benchmark failed: no runs completed", file=sys.stderr)
+        return 1
+
+    from system_fingerprint import SystemFingerprint
+    payload = {
+        'timestamp': time.strftime('%Y-%m-%d %H:%M:%S'),
+        'theme': theme,
+        'system_info': SystemFingerprint().to_dict(),
+        'test_results': {'startup': result}
+    }
+
+    if args.store:
+        from results_store import ResultsStore
+        try:
+            with ResultsStore(args.store) as store:
+                store.add_run(payload)
+        except Exception as e:
+            print(f"Could not store results in {args.store}: {e}", file=sys.stderr)
+            return 1
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(payload, f, indent=2)
+    else:
+        json.dump(payload, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
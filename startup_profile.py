@@ -0,0 +1,47 @@
+"""
+Startup phase timing.
+
+StartupTimer records how long each phase of application start-up took,
+from the first import of main.py to the first drawn frame, so fast-start
+changes can be checked against real numbers.
+
+Usage:
+    timer = StartupTimer(origin=IMPORT_START)
+    timer.mark("imports", at=IMPORTS_DONE)
+    build_menu()
+    timer.mark("menu")
+    timer.to_dict()   # {'phases_ms': {'imports': ..., 'menu': ...}, 'total_ms': ...}
+"""
+
+import time
+
+class StartupTimer:
+    """Consecutive named phases measured with perf_counter."""
+
+    def __init__(self, origin=None):
+        self.origin = origin if origin is not None else time.perf_counter()
+        self._last = self.origin
+        self.phases = []
+
+    def mark(self, phase, at=None):
+        """End the current phase now (or at a perf_counter value recorded earlier)."""
+        now = time.perf_counter() if at is None else at
+        self.phases.append((phase, (now - self._last) * 1000))
+        self._last = now
+
+    def elapsed_ms(self):
+        """Milliseconds from the origin to the last mark."""
+        return (self._last - self.origin) * 1000
+
+    def to_dict(self):
+        """Return the phases for results payloads."""
+        return {
+            'phases_ms': dict(self.phases),
+            'total_ms': self.elapsed_ms()
+        }
+
+    def report(self):
+        """Return a printable phase breakdown."""
+        lines = [f"  {phase:<20} {ms:8.1f} ms" for phase, ms in self.phases]
+        lines.append(f"  {'total':<20} {self.elapsed_ms():8.1f} ms")
+        return "Startup phases:\n" + "\n".join(lines)
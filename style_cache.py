@@ -0,0 +1,86 @@
+"""
+Python-side cache for ttk.Style options.
+
+Every Style.lookup() and Style.configure() is a round trip into Tcl. Screens
+with hundreds of custom styles look the same options up again and again and
+re-apply configurations that have not changed. StyleCache remembers looked-up
+values and the last configured options per style, answers repeated lookups
+from a dict and skips configure()/map() calls that would not change anything.
+
+Changing a style drops the cached lookups of that style and of the styles
+derived from it ("Big.TButton" derives from "TButton", every style from ".");
+switching themes drops everything.
+
+Usage:
+    cache = StyleCache(ttk.Style())
+    cache.configure("Big.TButton", padding=10)   # Tcl call
+    cache.configure("Big.TButton", padding=10)   # unchanged, skipped
+    cache.lookup("Big.TButton", "padding")       # Tcl call, then cached
+    cache.theme_use("clam")                      # clears the cache
+"""
+
+class StyleCache:
+    """Caches ttk.Style lookups and skips redundant configure/map calls."""
+
+    def __init__(self, style):
+        self.style = style
+        self._lookups = {}
+        self._configured = {}
+        self._mapped = {}
+        self.hits = 0
+        self.misses = 0
+        self.skipped = 0
+
+    def lookup(self, style, option, state=None, default=None):
+        """Return style's option value, asking Tcl only the first time."""
+        key = (style, option, tuple(state) if state else None, default)
+        try:
+            value = self._lookups[key]
+        except KeyError:
+            self.misses += 1
+            value = self._lookups[key] = self.style.lookup(style, option, state, default)
+            return value
+        self.hits += 1
+        return value
+
+    def configure(self, style, **options):
+        """Configure style, skipping the Tcl call if every option already has that value."""
+        current = self._configured.setdefault(style, {})
+        changed = {k: v for k, v in options.items() if k not in current or current[k] != v}
+        if not changed:
+            self.skipped += 1
+            return
+        self.style.configure(style, **changed)
+        current.update(changed)
+        self.invalidate(style)
+
+    def map(self, style, **options):
+        """Set state-dependent values, skipping the Tcl call if nothing changed."""
+        current = self._mapped.setdefault(style, {})
+        changed = {k: v for k, v in options.items() if k not in current or current[k] != v}
+        if not changed:
+            self.skipped += 1
+            return
+        self.style.map(style, **changed)
+        current.update(changed)
+        self.invalidate(style)
+
+    def theme_use(self, theme):
+        """Switch themes; every cached value belongs to the old theme, so drop them all."""
+        self.style.theme_use(theme)
+        self.clear()
+
+    def invalidate(self, style):
+        """Drop the cached lookups of style and of every style derived from it."""
+        if style == ".":
+            self._lookups.clear()
+            return
+        suffix = "." + style
+        for key in [k for k in self._lookups if k[0] == style or k[0].endswith(suffix)]:
+            del self._lookups[key]
+
+    def clear(self):
+        """Forget everything, e.g. after the theme changed behind the cache's back."""
+        self._lookups.clear()
+        self._configured.clear()
+        self._mapped.clear()
@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""
+Parallel TTK Benchmark Sweeps
+Runs a matrix of tests x themes x load scales with one worker process per case.
+
+Each case gets a fresh interpreter with its own tk.Tk() root on its own Xvfb
+display, optionally pinned to one CPU. Without Xvfb the cases share the current
+DISPLAY (with a warning); with neither, the sweep stops before starting. The parent
+merges everything into one JSON report and flags cases whose timings were
+likely disturbed by running in parallel.
+
+Usage:
+    python -m sweep --scales 0.5,1,2 --themes clam,alt,default -o sweep.json
+    python -m sweep --workers 8 --pin --verify
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import shutil
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from main import ALL_TESTS, BENCHMARK_TESTS, CONFIG_FILE, load_config
+from system_fingerprint import SystemFingerprint
+
+# Size settings scaled by a case's load multiplier
+SCALED_SETTINGS = ('treeview_items', 'label_updates', 'window_count', 'widget_count', 'memory_test_mb',
+                   'virtual_tree_rows')
+
+# Headline timing per test, used to compare parallel and serial runs (other tests use 'duration').
+# Tests whose timings are all keyed by theme, size or strategy have none and are reported unverified.
+PRIMARY_METRICS = {
+    'windows': 'total_duration',
+    'memory': 'write_time',
+    'virtual_treeview': 'virtual_populate_time',
+    'bulk_insert': 'per_row_time',
+    'coalesced_updates': 'coalesced_wall_time',
+    'memory_bandwidth': 'copy_time',
+    'startup': 'warm_total_ms',
+    'style_scaling': 'uncached_lookup_time',
+    'text': 'bulk_insert_time',
+    'scrolling': 'tree_moveto_frame_p50_ms',
+}
+
+# Preemptions per second above which a case is considered disturbed
+DEFAULT_PREEMPTION_LIMIT = 50.0
+
+# Relative slowdown versus a serial rerun above which a case is considered disturbed
+DEFAULT_SLOWDOWN_LIMIT = 0.10
+
+_cpu_pool = None
+
+def _init_worker(cpu_pool):
+    """Pool initializer: remember the shared queue of free CPUs (None = no pinning)."""
+    global _cpu_pool
+    _cpu_pool = cpu_pool
+
+def build_cases(tests, themes, scales):
+    """Expand the sweep matrix into a list of case dicts."""
+    cases = []
+    for test in tests:
+        for theme in themes:
+            for scale in scales:
+                cases.append({'index': len(cases), 'test': test, 'theme': theme, 'scale': scale})
+    return cases
+
+def case_config(base_config, case):
+    """Return a copy of the config with the case's theme and scaled sizes applied."""
+    config = json.loads(json.dumps(base_config))
+    settings = config['default_settings']
+    for key in SCALED_SETTINGS:
+        settings[key] = max(1, int(settings[key] * case['scale']))
+    if case['theme']:
+        settings['theme'] = case['theme']
+    settings['auto_save'] = False
+    return config
+
+def run_case(case, base_config, private_display=True):
+    """Run one sweep case in the current (worker) process."""
+    import psutil
+    from benchmark_cli import run_benchmarks, start_virtual_display, stop_virtual_display
+
+    cpu = None
+    if _cpu_pool is not None:
+        cpu = _cpu_pool.get()
+        try:
+            psutil.Process().cpu_affinity([cpu])
+        except (AttributeError, psutil.Error, OSError) as e:
+            print(f"Could not pin case {case['index']} to CPU {cpu}: {e}", file=sys.stderr)
+
+    xvfb_proc = None
+    try:
+        if private_display:
+            xvfb_proc, display = start_virtual_display()
+            os.environ["DISPLAY"] = display
+
+        process = psutil.Process()
+        switches_before = process.num_ctx_switches()
+        cpu_before = time.process_time()
+        wall_before = time.perf_counter()
+
+        payload = run_benchmarks(case_config(base_config, case), [case['test']])
+
+        wall = time.perf_counter() - wall_before
+        cpu_time = time.process_time() - cpu_before
+        switches_after = process.num_ctx_switches()
+        preemptions = switches_after.involuntary - switches_before.involuntary
+
+        return dict(case,
+            cpu=cpu,
+            pid=os.getpid(),
+            display=os.environ.get("DISPLAY"),
+            actual_theme=payload.get('theme'),
+            settings=payload.get('settings'),
+            results=payload['test_results'].get(case['test'], {}),
+            contention={
+                'wall_time': wall,
+                'cpu_time': cpu_time,
+                'involuntary_ctx_switches': preemptions,
+                'voluntary_ctx_switches': switches_after.voluntary - switches_before.voluntary,
+                'preemptions_per_sec': preemptions / wall if wall > 0 else 0.0,
+                'load_average': os.getloadavg()[0] if hasattr(os, 'getloadavg') else None
+            })
+    except Exception as e:
+        return dict(case, error=str(e))
+    finally:
+        stop_virtual_display(xvfb_proc)
+        if cpu is not None:
+            _cpu_pool.put(cpu)
+
+def _run_case_star(args):
+    return run_case(*args)
+
+def run_sweep(cases, base_config, workers, pin=False, private_display=True, progress=None):
+    """Run cases in a process pool, one fresh process per case. Returns results in case order."""
+    ctx = multiprocessing.get_context("spawn")
+    manager = ctx.Manager() if pin else None
+    cpu_pool = None
+    if manager is not None:
+        cpu_pool = manager.Queue()
+        cpus = sorted(os.sched_getaffinity(0)) if hasattr(os, 'sched_getaffinity') else range(os.cpu_count() or 1)
+        for cpu in cpus:
+            cpu_pool.put(cpu)
+
+    results = []
+    try:
+        with ctx.Pool(processes=workers, initializer=_init_worker, initargs=(cpu_pool,), maxtasksperchild=1) as pool:
+            jobs = [(case, base_config, private_display) for case in cases]
+            for result in pool.imap_unordered(_run_case_star, jobs):
+                results.append(result)
+                if progress:
+                    progress(result, len(results), len(cases))
+    finally:
+        if manager is not None:
+            manager.shutdown()
+    return sorted(results, key=lambda r: r['index'])
+
+def primary_value(result):
+    """Return the headline timing of a case result, or None."""
+    metric = PRIMARY_METRICS.get(result['test'], 'duration')
+    return result.get('results', {}).get(metric)
+
+def flag_disturbed(results, preemption_limit=DEFAULT_PREEMPTION_LIMIT):
+    """Mark cases whose process was frequently preempted while measuring."""
+    for result in results:
+        reasons = []
+        contention = result.get('contention')
+        if contention and contention['preemptions_per_sec'] > preemption_limit:
+            reasons.append(f"{contention['preemptions_per_sec']:.0f} preemptions/s")
+        result['disturbed'] = bool(reasons)
+        result['disturbed_reasons'] = reasons
+
+def verify_serially(results, base_config, private_display=True, slowdown_limit=DEFAULT_SLOWDOWN_LIMIT, only_flagged=True):
+    """Rerun cases one at a time and flag those that were slower in parallel."""
+    to_check = [r for r in results if 'error' not in r and (r['disturbed'] or not only_flagged)]
+    if not to_check:
+        return
+    cases = [{k: r[k] for k in ('index', 'test', 'theme', 'scale')} for r in to_check]
+    serial = {s['index']: s for s in run_sweep(cases, base_config, 1, private_display=private_display)}
+    for result in to_check:
+        parallel_value = primary_value(result)
+        serial_value = primary_value(serial.get(result['index'], {'test': result['test']}))
+        if not parallel_value or not serial_value:
+            result['unverified'] = "no headline timing in both runs"
+            continue
+        slowdown = parallel_value / serial_value - 1.0
+        result['serial_value'] = serial_value
+        result['parallel_slowdown'] = slowdown
+        if slowdown > slowdown_limit:
+            result['disturbed'] = True
+            result['disturbed_reasons'].append(f"{slowdown:+.0%} vs serial rerun")
+        elif result['disturbed']:
+            # The serial rerun agrees, so preemption did not change the timing
+            result['disturbed'] = False
+            result['disturbed_reasons'].append("cleared by serial rerun")
+
+def parse_list(text, convert=str):
+    return [convert(part.strip()) for part in text.split(",") if part.strip()]
+
+def main(argv=None):
+    """Command-line entry point."""
+    test_names = [name for name, _ in ALL_TESTS]
+    core_names = [name for name, _ in BENCHMARK_TESTS]
+    parser = argparse.ArgumentParser(prog="sweep", description="Run TTK benchmark sweeps in parallel worker processes.")
+    parser.add_argument("--config", default=CONFIG_FILE, help="Path to config.json")
+    parser.add_argument("--tests", default=",".join(core_names), help="Comma-separated tests (default: core tests)")
+    parser.add_argument("--themes", default="", help="Comma-separated themes (default: config theme)")
+    parser.add_argument("--scales", default="1", help="Comma-separated load multipliers (default: 1)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Worker processes (default: CPU count)")
+    parser.add_argument("--pin", action="store_true", help="Pin each worker to its own CPU")
+    parser.add_argument("--shared-display", action="store_true",
+                        help="Use the current DISPLAY in every worker instead of one Xvfb per worker")
+    parser.add_argument("--verify", action="store_true", help="Rerun flagged cases serially to confirm disturbance")
+    parser.add_argument("--preemption-limit", type=float, default=DEFAULT_PREEMPTION_LIMIT,
+                        help="Preemptions per second that mark a case as disturbed")
+    parser.add_argument("-o", "--output", help="Write the JSON report to this file instead of stdout")
+    args = parser.parse_args(argv)
+
+    tests = parse_list(args.tests)
+    unknown = [t for t in tests if t not in test_names]
+    if unknown:
+        parser.error(f"unknown test(s): {', '.join(unknown)}")
+
+    base_config = load_config(args.config)
+    themes = parse_list(args.themes) or [base_config['default_settings']['theme']]
+    scales = parse_list(args.scales, float)
+    cases = build_cases(tests, themes, scales)
+    workers = max(1, min(args.workers, len(cases)))
+    private_display = not args.shared_display
+    if private_display and not shutil.which("Xvfb"):
+        if not os.environ.get("DISPLAY"):
+            print("Xvfb not found on PATH and DISPLAY is not set; install Xvfb or run with a display", file=sys.stderr)
+            return 2
+        print("Xvfb not found on PATH; all cases share the current DISPLAY", file=sys.stderr)
+        private_display = False
+
+    def progress(result, done, total):
+        status = "error: " + result['error'] if 'error' in result else "ok"
+        print(f"[{done}/{total}] {result['test']} theme={result['theme']} scale={result['scale']}: {status}", file=sys.stderr)
+
+    start = time.perf_counter()
+    results = run_sweep(cases, base_config, workers, pin=args.pin, private_display=private_display, progress=progress)
+    flag_disturbed(results, args.preemption_limit)
+    if args.verify:
+        verify_serially(results, base_config, private_display=private_display)
+
+    report = {
+        'timestamp': time.strftime('%Y-%m-%d %H:%M:%S'),
+        'system_info': SystemFingerprint().to_dict(),
+        'workers': workers,
+        'pinned': args.pin,
+        'wall_time': time.perf_counter() - start,
+        'cases': results,
+        'disturbed_cases': [r['index'] for r in results if r.get('disturbed')],
+        'failed_cases': [r['index'] for r in results if 'error' in r]
+    }
+    if args.verify:
+        report['unverified_cases'] = [r['index'] for r in results if 'unverified' in r]
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+    return 1 if report['failed_cases'] else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
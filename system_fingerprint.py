@@ -0,0 +1,77 @@
+"""
+System fingerprint provider.
+
+Static machine facts (platform, CPU and memory size, Python and Tcl/Tk
+versions) are computed once. Values that change at runtime (memory use,
+CPU frequency) are sampled separately with cheap, non-blocking psutil
+calls. One instance is shared by the info panel and every exporter so all
+of them report the same identity.
+
+Usage:
+    fingerprint = SystemFingerprint(root)
+    fingerprint.to_dict()      # static facts + 'fingerprint' hash, for saved results
+    fingerprint.sample()       # {'memory_percent': ..., 'memory_available_gb': ..., 'cpu_freq_mhz': ...}
+    fingerprint.summary()      # one-line text for the info panel
+"""
+
+import platform
+
+import psutil
+
+from results_store import host_fingerprint
+
+class SystemFingerprint:
+    """Static system facts gathered once, plus cheap live samples."""
+
+    def __init__(self, root=None):
+        if root is not None:
+            tcl = root.tk
+        else:
+            import tkinter
+            tcl = tkinter.Tcl().tk
+        memory = psutil.virtual_memory()
+        self.static = {
+            'platform': platform.platform(),
+            'system': platform.system(),
+            'release': platform.release(),
+            'architecture': platform.architecture()[0],
+            'processor': platform.processor(),
+            'hostname': platform.node(),
+            'python_version': platform.python_version(),
+            'tk_version': str(tcl.call('info', 'patchlevel')),
+            'cpu_count': psutil.cpu_count(),
+            'physical_cores': psutil.cpu_count(logical=False),
+            'memory_total_gb': memory.total // (1024**3)
+        }
+        self.static['fingerprint'] = host_fingerprint(self.static)
+
+    @property
+    def fingerprint(self):
+        return self.static['fingerprint']
+
+    def to_dict(self):
+        """Return the static facts for results payloads and reports."""
+        return dict(self.static)
+
+    def sample(self):
+        """Return the values that change at runtime."""
+        memory = psutil.virtual_memory()
+        try:
+            frequency = psutil.cpu_freq()
+        except Exception:
+            frequency = None
+        return {
+            'memory_percent': memory.percent,
+            'memory_available_gb': memory.available / (1024**3),
+            'memory_used_gb': memory.used / (1024**3),
+            'cpu_freq_mhz': frequency.current if frequency else None
+        }
+
+    def summary(self, sample=None):
+        """One-line description for the info panel."""
+        info = self.static
+        sample = sample or self.sample()
+        return (f"OS: {info['system']} {info['release']} | "
+                f"CPU: {info['cpu_count']} cores | "
+                f"RAM: {info['memory_total_gb']}GB ({sample['memory_percent']}% used) | "
+                f"Python: {info['python_version']} | Tk: {info['tk_version']}")
@@ -0,0 +1,152 @@
+"""
+Background system sampler and Canvas sparklines.
+
+SystemSampler runs on a daemon thread and appends one sample per interval
+to fixed-size ring buffers: CPU percent per core, this process's RSS,
+context switches per second and garbage collections per generation. It
+never touches Tk, and psutil.cpu_percent() is called without an interval
+so nothing blocks. The sampler tracks its own CPU time so its overhead can
+be reported next to benchmark results.
+
+Sparkline draws one ring buffer on a Canvas with a single line item whose
+coordinates are updated in place, so a redraw is one Tcl call per series.
+
+Usage:
+    sampler = SystemSampler(interval=0.5, capacity=120)
+    sampler.start()
+    series = sampler.snapshot()        # {name: [values...]}
+    sampler.stop()
+"""
+
+import collections
+import gc
+import threading
+import time
+
+import psutil
+
+class SystemSampler:
+    """Samples system and process counters into ring buffers on a background thread."""
+
+    def __init__(self, interval=0.5, capacity=120):
+        self.interval = interval
+        self.capacity = capacity
+        self.process = psutil.Process()
+        self.cores = psutil.cpu_count() or 1
+        self.buffers = collections.OrderedDict()
+        for core in range(self.cores):
+            self.buffers[f'cpu{core}'] = collections.deque(maxlen=capacity)
+        for name in ('rss_mb', 'ctx_switches_per_s', 'gc_gen0', 'gc_gen1', 'gc_gen2'):
+            self.buffers[name] = collections.deque(maxlen=capacity)
+        self.version = 0 # Incremented per sample so readers can skip unchanged redraws
+        self.sampler_cpu_time = 0.0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self._users = 0
+        self._started_at = None
+
+    def start(self):
+        """Start sampling; calls are counted so several users can share the sampler."""
+        self._users += 1
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._started_at = time.perf_counter()
+        self.sampler_cpu_time = 0.0
+        self._thread = threading.Thread(target=self._run, name="SystemSampler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop sampling once the last user has stopped."""
+        self._users = max(0, self._users - 1)
+        if self._users or self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join(timeout=self.interval * 2)
+        self._thread = None
+
+    @property
+    def running(self):
+        return self._thread is not None
+
+    def snapshot(self):
+        """Return a copy of every ring buffer as {name: [values...]}."""
+        with self._lock:
+            return {name: list(buffer) for name, buffer in self.buffers.items()}
+
+    def latest(self):
+        """Return the newest value of every series."""
+        with self._lock:
+            return {name: buffer[-1] for name, buffer in self.buffers.items() if buffer}
+
+    def overhead_pct(self):
+        """CPU time spent sampling as a percentage of one core since start."""
+        if self._started_at is None:
+            return 0.0
+        elapsed = time.perf_counter() - self._started_at
+        return self.sampler_cpu_time / elapsed * 100 if elapsed > 0 else 0.0
+
+    def _read_counters(self):
+        switches = self.process.num_ctx_switches()
+        return switches.voluntary + switches.involuntary, [s['collections'] for s in gc.get_stats()]
+
+    def _run(self):
+        psutil.cpu_percent(percpu=True) # Prime the per-core deltas
+        last_time = time.perf_counter()
+        last_switches, last_collections = self._read_counters()
+        while not self._stop.wait(self.interval):
+            cpu_start = time.thread_time()
+            cores = psutil.cpu_percent(percpu=True)
+            rss = self.process.memory_info().rss / 1024 / 1024
+            switches, collections_now = self._read_counters()
+            now = time.perf_counter()
+            elapsed = now - last_time
+
+            with self._lock:
+                for core, percent in enumerate(cores[:self.cores]):
+                    self.buffers[f'cpu{core}'].append(percent)
+                self.buffers['rss_mb'].append(rss)
+                self.buffers['ctx_switches_per_s'].append((switches - last_switches) / elapsed if elapsed > 0 else 0.0)
+                for generation, count in enumerate(collections_now[:3]):
+                    self.buffers[f'gc_gen{generation}'].append(count - last_collections[generation])
+                self.version += 1
+
+            last_time, last_switches, last_collections = now, switches, collections_now
+            self.sampler_cpu_time += time.thread_time() - cpu_start
+
+class Sparkline:
+    """A labelled series drawn as one Canvas line item, updated in place."""
+
+    def __init__(self, canvas, label, y, height, width, label_width=90, value_format="{:.1f}", fixed_max=None):
+        self.canvas = canvas
+        self.y = y
+        self.height = height
+        self.left = label_width
+        self.width = width
+        self.value_format = value_format
+        self.fixed_max = fixed_max
+        self._last_text = None
+        canvas.create_text(4, y + height / 2, text=label, anchor="w")
+        self.line = canvas.create_line(self.left, y + height, self.left, y + height, fill="blue")
+        self.value = canvas.create_text(self.left + width + 4, y + height / 2, anchor="w")
+
+    def update(self, values, capacity):
+        """Move the line to the newest values; only changed items are reconfigured."""
+        if not values:
+            return
+        top = self.fixed_max or max(max(values), 1e-9)
+        step = self.width / max(1, capacity - 1)
+        # Right-align so the newest sample is always at the right edge
+        offset = self.left + (capacity - len(values)) * step
+        coords = []
+        for index, value in enumerate(values):
+            coords.append(offset + index * step)
+            coords.append(self.y + self.height * (1 - min(value, top) / top))
+        if len(coords) == 2:
+            coords *= 2 # A line needs two points
+        self.canvas.coords(self.line, *coords)
+        text = self.value_format.format(values[-1])
+        if text != self._last_text:
+            self.canvas.itemconfigure(self.value, text=text)
+            self._last_text = text
@@ -0,0 +1,130 @@
+"""
+Fast bulk operations for ttk.Treeview.
+
+tree.insert() costs one Python -> Tcl round trip per row. bulk_insert()
+hands a whole batch of rows to a small Tcl procedure instead, so each batch
+is a single Tcl evaluation. Row values are passed as Tcl lists, so no manual
+quoting is needed.
+
+Clearing works the same way: delete_all() removes every top-level item in
+one Tcl call without converting item ids to Python, and detach_all() /
+reattach() park items on the Tcl side so a reload can reuse them.
+
+Usage:
+    ids = bulk_insert(tree, rows, batch_size=1000)
+    bulk_insert_chunked(tree, rows, batch_size=1000, on_done=callback)  # non-blocking
+    delete_all(tree)
+    detach_all(tree); reused = reattach(tree, new_rows); bulk_insert(tree, new_rows[reused:])
+"""
+
+_TCL_PROCS = """
+namespace eval ::ttkbench {}
+proc ::ttkbench::bulk_insert {tree parent rows} {
+    set ids {}
+    foreach row $rows {
+        lappend ids [$tree insert $parent end -values $row]
+    }
+    return $ids
+}
+proc ::ttkbench::delete_all {tree} {
+    $tree delete [$tree children {}]
+}
+proc ::ttkbench::detach_all {tree} {
+    variable detached
+    set ids [$tree children {}]
+    $tree detach $ids
+    lappend detached($tree) {*}$ids
+    return [llength $ids]
+}
+proc ::ttkbench::reattach {tree rows} {
+    variable detached
+    if {![info exists detached($tree)]} {
+        return 0
+    }
+    set count [expr {min([llength $detached($tree)], [llength $rows])}]
+    foreach id [lrange $detached($tree) 0 [expr {$count - 1}]] row [lrange $rows 0 [expr {$count - 1}]] {
+        $tree move $id {} end
+        $tree item $id -values $row
+    }
+    set detached($tree) [lrange $detached($tree) $count end]
+    return $count
+}
+proc ::ttkbench::discard_detached {tree} {
+    variable detached
+    if {[info exists detached($tree)]} {
+        if {[winfo exists $tree]} {
+            $tree delete $detached($tree)
+        }
+        unset detached($tree)
+    }
+}
+"""
+
+def _ensure_procs(tree):
+    """Define the helper Tcl procedures once per interpreter."""
+    if not tree.tk.call("info", "commands", "::ttkbench::discard_detached"):
+        tree.tk.eval(_TCL_PROCS)
+
+def insert_batch(tree, rows, parent=""):
+    """Insert rows (sequences of column values) in one Tcl evaluation and return their ids."""
+    _ensure_procs(tree)
+    if not rows:
+        return ()
+    return tree.tk.splitlist(tree.tk.call("::ttkbench::bulk_insert", tree._w, parent, tuple(rows)))
+
+def delete_all(tree):
+    """Delete every top-level item in one Tcl call."""
+    _ensure_procs(tree)
+    tree.tk.call("::ttkbench::delete_all", tree._w)
+
+def detach_all(tree):
+    """Detach every top-level item, keeping it for reattach(). Returns the count."""
+    _ensure_procs(tree)
+    return tree.tk.getint(tree.tk.call("::ttkbench::detach_all", tree._w))
+
+def reattach(tree, rows):
+    """Reattach previously detached items with new values. Returns how many rows were placed."""
+    _ensure_procs(tree)
+    return tree.tk.getint(tree.tk.call("::ttkbench::reattach", tree._w, tuple(rows)))
+
+def discard_detached(tree):
+    """Delete any items still parked by detach_all()."""
+    _ensure_procs(tree)
+    tree.tk.call("::ttkbench::discard_detached", tree._w)
+
+def bulk_insert(tree, rows, batch_size=1000, parent=""):
+    """Insert all rows in batches of batch_size and return the new item ids."""
+    ids = []
+    for start in range(0, len(rows), batch_size):
+        ids.extend(insert_batch(tree, rows[start:start + batch_size], parent))
+    return ids
+
+def bulk_insert_chunked(tree, rows, batch_size=1000, parent="", on_done=None, on_progress=None, delay_ms=0):
+    """Insert rows one batch per after() callback so the UI keeps responding.
+
+    on_progress(inserted, total) runs after each batch and on_done(ids) at
+    the end. Returns a cancel() function that stops the remaining batches.
+    """
+    ids = []
+    state = {'after_id': None, 'start': 0}
+
+    def next_batch():
+        start = state['start']
+        ids.extend(insert_batch(tree, rows[start:start + batch_size], parent))
+        state['start'] = start + batch_size
+        if on_progress:
+            on_progress(min(state['start'], len(rows)), len(rows))
+        if state['start'] < len(rows):
+            state['after_id'] = tree.after(delay_ms, next_batch)
+        else:
+            state['after_id'] = None
+            if on_done:
+                on_done(ids)
+
+    def cancel():
+        if state['after_id'] is not None:
+            tree.after_cancel(state['after_id'])
+            state['after_id'] = None
+
+    state['after_id'] = tree.after(delay_ms, next_batch)
+    return cancel
@@ -0,0 +1,84 @@
+"""
+Frame-rate-coalesced widget updates.
+
+Pushing every new value straight into a widget wastes work when values
+arrive faster than the screen refreshes. CoalescingUpdater lets producers
+post the latest value for a widget as often as they like; a single after()
+tick applies only the newest value per widget, at most fps times a second.
+
+Usage:
+    updater = CoalescingUpdater(root, fps=60)
+    updater.post("label", lambda v: label.config(text=v), "Update 42")
+    updater.post("progress", lambda v: progressbar.configure(value=v), 42)
+
+Posting from the Tk main thread schedules the next tick on demand. Worker
+threads may post too, but then call start() from the main thread first so
+ticks keep running while they produce values.
+"""
+
+import threading
+
+class CoalescingUpdater:
+    """Applies only the newest posted value per key, once per frame."""
+
+    def __init__(self, root, fps=60):
+        self.root = root
+        self.interval_ms = max(1, int(round(1000 / fps)))
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._after_id = None
+        self._continuous = False
+        self._main_thread = threading.current_thread()
+        self.posted = 0
+        self.applied = 0
+        self.ticks = 0
+
+    def post(self, key, apply, value):
+        """Record value as the newest for key; apply(value) runs on the next tick."""
+        with self._lock:
+            self._pending[key] = (apply, value)
+            self.posted += 1
+        if self._after_id is None and threading.current_thread() is self._main_thread:
+            self._after_id = self.root.after(self.interval_ms, self._tick)
+
+    def start(self):
+        """Tick continuously, for producers on other threads."""
+        self._continuous = True
+        if self._after_id is None:
+            self._after_id = self.root.after(self.interval_ms, self._tick)
+
+    def stop(self, flush=True):
+        """Stop ticking, applying any pending values first unless flush is False."""
+        self._continuous = False
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+        if flush:
+            self.flush()
+        else:
+            with self._lock:
+                self._pending = {}
+
+    def flush(self):
+        """Apply all pending values now."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        for apply, value in pending.values():
+            apply(value)
+        self.applied += len(pending)
+
+    def stats(self):
+        """Return post/apply counters."""
+        return {
+            'posted': self.posted,
+            'applied': self.applied,
+            'ticks': self.ticks,
+            'coalesced': self.posted - self.applied - len(self._pending)
+        }
+
+    def _tick(self):
+        self._after_id = None
+        self.ticks += 1
+        self.flush()
+        if self._continuous or self._pending:
+            self._after_id = self.root.after(self.interval_ms, self._tick)
@@ -0,0 +1,151 @@
+"""
+Virtualized, data-backed Treeview.
+
+A plain ttk.Treeview keeps one Tcl item per row, so memory and population
+time grow with the data set. VirtualTreeview keeps the rows in a Python
+list and only creates enough Tcl items to fill the visible area (plus a
+small buffer). Scrolling re-binds those items to new rows instead of
+moving through millions of real items.
+
+Usage:
+    vt = VirtualTreeview(parent, columns=("col1", "col2"), height=8)
+    vt.tree.heading("col1", text="Item")
+    vt.set_data(rows)            # any sequence of value tuples
+    vt.pack(fill=tk.BOTH, expand=True)
+"""
+
+import tkinter as tk
+from tkinter import ttk
+
+DEFAULT_ROW_HEIGHT = 20
+
+class VirtualTreeview(ttk.Frame):
+    """A Treeview that only materializes the rows currently on screen."""
+
+    def __init__(self, parent, columns, height=10, buffer_rows=4, **tree_options):
+        super().__init__(parent)
+        self.rows = []
+        self.offset = 0
+        self.visible_rows = height
+        self.buffer_rows = buffer_rows
+
+        tree_options.setdefault("show", "headings")
+        self.tree = ttk.Treeview(self, columns=columns, height=height, **tree_options)
+        self.scrollbar = ttk.Scrollbar(self, orient="vertical", command=self.yview)
+        self.tree.grid(row=0, column=0, sticky="nsew")
+        self.scrollbar.grid(row=0, column=1, sticky="ns")
+        self.grid_rowconfigure(0, weight=1)
+        self.grid_columnconfigure(0, weight=1)
+
+        # Recycled Tcl items; slot k shows row offset + k
+        self.pool = []
+        self._slot_rows = []
+        self._grow_pool(height + buffer_rows)
+
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.tree.bind(sequence, self._on_wheel)
+        self.tree.bind("<Configure>", self._on_configure)
+
+    def _grow_pool(self, size):
+        """Create detached items until the pool holds at least size items."""
+        while len(self.pool) < size:
+            iid = self.tree.insert("", "end")
+            self.tree.detach(iid)
+            self.pool.append(iid)
+            self._slot_rows.append(None)
+
+    def __len__(self):
+        return len(self.rows)
+
+    def set_data(self, rows):
+        """Replace the backing data and show it from the top."""
+        self.rows = rows
+        self.offset = 0
+        # Attached items must be rebound, detached ones stay detached
+        self._slot_rows = [None if row is None else -1 for row in self._slot_rows]
+        self.refresh()
+
+    def row_index(self, iid):
+        """Return the data index shown by a pool item, or None."""
+        try:
+            row = self._slot_rows[self.pool.index(iid)]
+        except ValueError:
+            return None
+        return row if row is not None and row >= 0 else None
+
+    def selection_indices(self):
+        """Return the data indices of the selected rows."""
+        return [i for i in (self.row_index(iid) for iid in self.tree.selection()) if i is not None]
+
+    def max_offset(self):
+        return max(0, len(self.rows) - self.visible_rows)
+
+    def refresh(self):
+        """Bind pool items to the rows in the current window and update the scrollbar."""
+        tree = self.tree
+        shown = max(0, min(self.visible_rows, len(self.rows) - self.offset))
+        for slot, iid in enumerate(self.pool):
+            if slot < shown:
+                row = self.offset + slot
+                if self._slot_rows[slot] is None:
+                    tree.move(iid, "", slot) # Reattach; earlier slots are already in order
+                if self._slot_rows[slot] != row:
+                    tree.item(iid, values=self.rows[row])
+                    self._slot_rows[slot] = row
+            elif self._slot_rows[slot] is not None:
+                # Slots past the data or the visible area stay detached as the buffer
+                tree.detach(iid)
+                self._slot_rows[slot] = None
+
+        total = len(self.rows)
+        if total:
+            self.scrollbar.set(self.offset / total, min(1.0, (self.offset + self.visible_rows) / total))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+    def yview(self, *args):
+        """Scrollbar protocol: ('moveto', fraction) or ('scroll', n, 'units'|'pages')."""
+        if not args:
+            total = len(self.rows) or 1
+            return self.offset / total, min(1.0, (self.offset + self.visible_rows) / total)
+        if args[0] == "moveto":
+            self.yview_moveto(float(args[1]))
+        elif args[0] == "scroll":
+            self.yview_scroll(int(args[1]), args[2])
+
+    def yview_moveto(self, fraction):
+        """Scroll so that the given fraction of the data is at the top."""
+        self._set_offset(int(float(fraction) * len(self.rows)))
+
+    def yview_scroll(self, number, what="units"):
+        """Scroll by a number of rows ('units') or screens ('pages')."""
+        step = self.visible_rows if what.startswith("page") else 1
+        self._set_offset(self.offset + number * step)
+
+    def _set_offset(self, offset):
+        offset = max(0, min(offset, self.max_offset()))
+        if offset != self.offset:
+            self.offset = offset
+            self.refresh()
+
+    def _on_wheel(self, event):
+        if event.num == 4 or event.delta > 0:
+            self.yview_scroll(-3)
+        else:
+            self.yview_scroll(3)
+        return "break"
+
+    def _on_configure(self, event):
+        """Resize the window of visible rows to the widget's height."""
+        style = ttk.Style(self)
+        try:
+            row_height = int(style.lookup(self.tree.cget("style") or "Treeview", "rowheight") or DEFAULT_ROW_HEIGHT)
+        except (tk.TclError, ValueError):
+            row_height = DEFAULT_ROW_HEIGHT
+        heading_height = row_height if "headings" in str(self.tree.cget("show")) else 0
+        visible = max(1, (event.height - heading_height) // row_height)
+        if visible != self.visible_rows:
+            self.visible_rows = visible
+            self._grow_pool(visible + self.buffer_rows)
+            self.offset = min(self.offset, self.max_offset())
+            self.refresh()
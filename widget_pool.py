@@ -0,0 +1,107 @@
+"""
+Reusable widget pools.
+
+Creating and destroying a Toplevel or a set of widgets costs several Tcl
+commands plus window-manager work every time. A pool keeps released items
+hidden and hands them out again, reconfigured, on the next acquire().
+
+Usage:
+    pool = ToplevelPool(root, build=lambda win: ttk.Label(win),
+                        configure=lambda win, label, text: label.config(text=text))
+    win, label = pool.acquire("Hello")   # deiconified, reconfigured
+    pool.release((win, label))           # withdrawn, kept for reuse
+    pool.clear()                         # destroy everything idle
+"""
+
+import tkinter as tk
+
+class WidgetPool:
+    """Keeps released items for reuse instead of destroying them.
+
+    create() builds a new item, configure(item, *args) prepares it for a new
+    use, show(item)/hide(item) map and unmap it and destroy(item) frees it.
+    """
+
+    def __init__(self, create, configure, show, hide, destroy, max_idle=None):
+        self._create = create
+        self._configure = configure
+        self._show = show
+        self._hide = hide
+        self._destroy = destroy
+        self.max_idle = max_idle
+        self.idle = []
+        self.created = 0
+        self.reused = 0
+
+    def acquire(self, *args):
+        """Return an idle item (or a new one) configured with args and shown."""
+        if self.idle:
+            item = self.idle.pop()
+            self.reused += 1
+        else:
+            item = self._create()
+            self.created += 1
+        self._configure(item, *args)
+        self._show(item)
+        return item
+
+    def release(self, item):
+        """Hide an item and keep it for the next acquire()."""
+        if self.max_idle is not None and len(self.idle) >= self.max_idle:
+            self._destroy(item)
+            return
+        self._hide(item)
+        self.idle.append(item)
+
+    def prefill(self, count):
+        """Create hidden items until count are idle."""
+        while len(self.idle) < count:
+            item = self._create()
+            self.created += 1
+            self._hide(item)
+            self.idle.append(item)
+
+    def clear(self):
+        """Destroy all idle items."""
+        for item in self.idle:
+            self._destroy(item)
+        self.idle = []
+
+class ToplevelPool(WidgetPool):
+    """Pool of Toplevels that are withdrawn on release and deiconified on acquire.
+
+    build(win) fills a new window and returns its contents; items are
+    (win, contents) tuples and configure(win, contents, *args) updates them.
+    """
+
+    def __init__(self, root, build, configure, max_idle=None):
+        def create():
+            win = tk.Toplevel(root)
+            win.withdraw()
+            return win, build(win)
+
+        super().__init__(
+            create,
+            lambda item, *args: configure(item[0], item[1], *args),
+            lambda item: item[0].deiconify(),
+            lambda item: item[0].withdraw(),
+            lambda item: item[0].destroy(),
+            max_idle
+        )
+
+class WidgetSetPool(WidgetPool):
+    """Pool of widget sets in one parent, unpacked on release and repacked on acquire.
+
+    build(parent) returns (frame, contents); configure(contents, *args)
+    rewrites the set for its new use.
+    """
+
+    def __init__(self, parent, build, configure, max_idle=None, **pack_options):
+        super().__init__(
+            lambda: build(parent),
+            lambda item, *args: configure(item[1], *args),
+            lambda item: item[0].pack(**pack_options),
+            lambda item: item[0].pack_forget(),
+            lambda item: item[0].destroy(),
+            max_idle
+        )